@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserProfile
+from .models import UserProfile, AuthToken
 
 
 @admin.register(UserProfile)
@@ -48,3 +48,32 @@ class UserProfileAdmin(admin.ModelAdmin):
             )
         }),
     )
+
+
+@admin.register(AuthToken)
+class AuthTokenAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the AuthToken model.
+    Lists the issued tokens per user and device so single sessions can be revoked.
+    """
+    list_display = (
+        'user',
+        'device',
+        'created_at',
+        'expires_at',
+    )
+    list_filter = (
+        'created_at',
+        'expires_at',
+    )
+    search_fields = (
+        'user__username',
+        'device',
+    )
+    raw_id_fields = (
+        'user',
+    )
+    readonly_fields = (
+        'key',
+        'created_at',
+    )
@@ -0,0 +1,229 @@
+"""
+Token authentication backed by a cache of resolved tokens.
+
+Tokens are expiring AuthTokens; permanent DRF tokens issued before them are still
+accepted until AUTH_TOKEN_LIFETIME after their creation. The expiry is cached with the
+token and checked in memory on every request.
+
+DRF's TokenAuthentication loads the token and its user from the database on every
+request. CachedTokenAuthentication keeps the resolved rows in a bounded per-process
+LRU with a TTL, or in a shared Django cache when AUTH_TOKEN_CACHE_ALIAS is set, so
+steady-state requests authenticate without a database round trip. The user's profile
+type is resolved by the same lookup and exposed as `user.profile_type`, so permission
+checks need no profile query either. Entries are invalidated by the signal handlers in
+auth_app.signals when a token is deleted, its user is saved (deactivation, password
+change), or the user's profile changes.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from auth_app.models import AuthToken
+
+# Only the user columns read by views and permission checks are cached; the password hash,
+# login timestamps, and any other column stay deferred and are loaded on access. USER_FIELDS
+# is kept in model field order, which Model.from_db expects for a subset of the columns.
+CACHED_USER_FIELDS = {'id', 'username', 'first_name', 'last_name', 'email', 'is_active', 'is_staff', 'is_superuser'}
+USER_FIELDS = [field.attname for field in User._meta.concrete_fields if field.attname in CACHED_USER_FIELDS]
+TOKEN_MODELS = {model._meta.label: model for model in (AuthToken, Token)}
+TOKEN_FIELDS = {
+    label: [field.attname for field in model._meta.concrete_fields]
+    for label, model in TOKEN_MODELS.items()
+}
+
+
+def get_token_lifetime():
+    """
+    Returns the lifetime of issued tokens.
+    """
+    return getattr(settings, 'AUTH_TOKEN_LIFETIME', timedelta(days=14))
+
+
+class TokenCache:
+    """
+    Maps token keys to the field values of the token and its user.
+
+    Without a shared cache alias, entries live in a thread-safe LRU of at most max_size
+    keys that expire after ttl seconds. Other workers only drop an invalidated entry
+    once its TTL runs out, so multi-worker deployments should configure a shared cache,
+    which then replaces the local LRU.
+    """
+
+    def __init__(self, max_size=10000, ttl=60, alias=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.shared = caches[alias] if alias else None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def shared_key(self, key):
+        """
+        Returns the shared cache key for a token without exposing the token itself.
+        """
+        return 'auth:token:v2:' + hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the cached entry for the token key, or None.
+        """
+        if self.shared is not None:
+            return self.shared.get(self.shared_key(key))
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """
+        Stores the entry, evicting the least recently used keys beyond max_size.
+        """
+        if self.shared is not None:
+            self.shared.set(self.shared_key(key), entry, self.ttl)
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *keys):
+        """
+        Removes the given token keys.
+        """
+        if self.shared is not None:
+            self.shared.delete_many([self.shared_key(key) for key in keys])
+            return
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Removes every locally cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache():
+    """
+    Returns the process-wide token cache configured via the AUTH_TOKEN_CACHE_* settings.
+    """
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                _token_cache = TokenCache(
+                    max_size=getattr(settings, 'AUTH_TOKEN_CACHE_MAX_SIZE', 10000),
+                    ttl=getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 60),
+                    alias=getattr(settings, 'AUTH_TOKEN_CACHE_ALIAS', None),
+                )
+    return _token_cache
+
+
+@receiver(setting_changed)
+def reset_token_cache(setting, **kwargs):
+    """
+    Rebuilds the token cache when one of its settings changes, e.g. in tests.
+    """
+    global _token_cache
+    if setting.startswith('AUTH_TOKEN_CACHE_'):
+        _token_cache = None
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that resolves tokens from the token cache.
+
+    A cache miss loads the token, its user, and the user's profile in one joined query
+    and caches the result. Every request gets fresh model instances built from the cached
+    values, so per-request attribute caches never leak between requests.
+    """
+
+    def authenticate_credentials(self, key):
+        cache = get_token_cache()
+        entry = cache.get(key)
+        if entry is None:
+            user, token, expires_at = self.load_credentials(key)
+            cache.set(key, self.build_entry(user, token, expires_at))
+            return user, token
+        if entry['expires_at'] <= time.time():
+            cache.invalidate(key)
+            raise exceptions.AuthenticationFailed(_('Token has expired.'))
+        return self.restore_entry(entry)
+
+    def load_credentials(self, key):
+        """
+        Loads the token together with its user and profile type from the database.
+
+        AuthTokens are looked up first; legacy DRF tokens expire AUTH_TOKEN_LIFETIME
+        after their creation.
+
+        Returns:
+            tuple: The user, the token, and the token's expiry.
+        """
+        related = ('user', 'user__userprofile')
+        token = AuthToken.objects.select_related(*related).filter(key=key).first()
+        if token is not None:
+            expires_at = token.expires_at
+        else:
+            token = Token.objects.select_related(*related).filter(key=key).first()
+            if token is None:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            expires_at = token.created + get_token_lifetime()
+
+        if expires_at <= timezone.now():
+            raise exceptions.AuthenticationFailed(_('Token has expired.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        profile = getattr(token.user, 'userprofile', None)
+        token.user.profile_type = profile.type if profile else None
+        return token.user, token, expires_at
+
+    def build_entry(self, user, token, expires_at):
+        """
+        Returns the cacheable field values of the token and its user,
+        the profile type, and the expiry as a timestamp.
+        """
+        label = token._meta.label
+        return {
+            'user': [getattr(user, name) for name in USER_FIELDS],
+            'model': label,
+            'token': [getattr(token, name) for name in TOKEN_FIELDS[label]],
+            'profile_type': user.profile_type,
+            'expires_at': expires_at.timestamp(),
+        }
+
+    def restore_entry(self, entry):
+        """
+        Rebuilds the user and token instances from a cached entry.
+        """
+        user = User.from_db('default', USER_FIELDS, entry['user'])
+        user.profile_type = entry['profile_type']
+        model = TOKEN_MODELS[entry['model']]
+        token = model.from_db('default', TOKEN_FIELDS[entry['model']], entry['token'])
+        token.user = user
+        return user, token
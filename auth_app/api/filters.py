@@ -0,0 +1,20 @@
+import django_filters
+from auth_app.models import UserProfile
+
+class ProfileDirectoryFilter(django_filters.FilterSet):
+    """
+    A FilterSet for the profile directories, allowing filtering by exact location.
+
+    Together with the type filter of the directory views, the lookup is served by the
+    (type, location) index on UserProfile.
+    """
+    location = django_filters.CharFilter(field_name='location')
+
+    class Meta:
+        """
+        Meta class for ProfileDirectoryFilter, defining the model and fields to filter on.
+        """
+        model = UserProfile
+        fields = [
+            'location',
+        ]
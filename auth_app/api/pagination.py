@@ -0,0 +1,14 @@
+"""
+Custom pagination settings for the business and customer directories in the auth_app.
+"""
+
+from rest_framework.pagination import PageNumberPagination
+
+class ProfileDirectoryPagination(PageNumberPagination):
+    """
+    Pagination class for the profile directories, allowing a default page size of 20 and
+    supporting a 'page_size' query parameter with a maximum limit.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
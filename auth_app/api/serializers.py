@@ -79,6 +79,29 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return instance
 
 
+class PublicProfileSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the public part of a user profile, without email and phone number.
+    Used wherever a profile is embedded into responses anonymous clients can read.
+    """
+    username = serializers.CharField(source='user.username', read_only=True, default='')
+    first_name = serializers.CharField(source='user.first_name', read_only=True, default='')
+    last_name = serializers.CharField(source='user.last_name', read_only=True, default='')
+    file = serializers.ImageField(read_only=True)
+
+    class Meta:
+        model = UserProfile
+        fields = ['user', 'username', 'first_name', 'last_name', 'location', 'file', 'type']
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        rep = super().to_representation(instance)
+        for key, value in rep.items():
+            if value is None:
+                rep[key] = ''
+        return rep
+
+
 class CustomerProfileSerializer(serializers.ModelSerializer):
     """
     Serializer for customer profile data (read-limited public fields).
@@ -108,6 +131,8 @@ class CustomerProfileSerializer(serializers.ModelSerializer):
 class BusinessProfileSerializer(serializers.ModelSerializer):
     """
     Serializer for business profile data including contact and company details.
+
+    The review count and average rating are read from the business user's rating summary.
     """
     username = serializers.CharField(source='user.username', read_only=True, default='')
     first_name = serializers.CharField(source='user.first_name', allow_blank=True, default='')
@@ -118,14 +143,31 @@ class BusinessProfileSerializer(serializers.ModelSerializer):
     description = serializers.CharField(allow_blank=True, default='')
     working_hours = serializers.CharField(allow_blank=True, default='')
     type = serializers.CharField(read_only=True, default='business')
+    review_count = serializers.SerializerMethodField()
+    average_rating = serializers.SerializerMethodField()
 
     class Meta:
         model = UserProfile
         fields = [
             'user', 'username', 'first_name', 'last_name', 'file',
-            'location', 'tel', 'description', 'working_hours', 'type'
+            'location', 'tel', 'description', 'working_hours', 'type',
+            'review_count', 'average_rating'
         ]
 
+    def get_rating_summary(self, instance):
+        """
+        Returns the rating summary of the profile's user, or None if it has no reviews yet.
+        """
+        return getattr(instance.user, 'rating_summary', None)
+
+    def get_review_count(self, instance):
+        summary = self.get_rating_summary(instance)
+        return summary.review_count if summary else 0
+
+    def get_average_rating(self, instance):
+        summary = self.get_rating_summary(instance)
+        return summary.average_rating if summary else 0.0
+
     def to_representation(self, instance):
         rep = super().to_representation(instance)
         for key, value in rep.items():
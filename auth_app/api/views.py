@@ -2,16 +2,39 @@
 Views for managing user authentication, registration,
 login, and profile data within the auth_app.
 """
-from rest_framework import generics, status
+from rest_framework import generics, status, filters
+from django_filters.rest_framework import DjangoFilterBackend
 from django.contrib.auth.models import User
-from auth_app.models import UserProfile
+from auth_app.models import UserProfile, AuthToken
+from django.db import transaction
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.response import Response
 from .serializers import RegistrationSerializer, UsernameAuthTokenSerializer, UserProfileSerializer, CustomerProfileSerializer, BusinessProfileSerializer
 from .permissions import IsOwner, IsAuthenticated
+from .pagination import ProfileDirectoryPagination
+from .filters import ProfileDirectoryFilter
+
+
+def token_response_data(token, user):
+    """
+    Returns the token and user details sent after registration, login, and token refresh.
+    """
+    return {
+        'token': token.key,
+        'expires_at': token.expires_at,
+        'username': f"{user.first_name} {user.last_name}".strip(),
+        'email': user.email,
+        'user_id': user.id,
+    }
+
+
+def get_device(request):
+    """
+    Returns the device name a token is issued for, taken from the User-Agent header.
+    """
+    return request.headers.get('User-Agent', '')
 
 
 class UserProfileList(generics.ListCreateAPIView):
@@ -77,13 +100,8 @@ class RegistrationView(APIView):
 
         if serializer.is_valid():
             saved_account = serializer.save()
-            token, _ = Token.objects.get_or_create(user=saved_account)
-            data = {
-                'token': token.key,
-                'username': f"{saved_account.first_name} {saved_account.last_name}".strip(),
-                'email': saved_account.email,
-                'user_id': saved_account.id,
-            }
+            token = AuthToken.issue(saved_account, get_device(request))
+            data = token_response_data(token, saved_account)
             return Response(data, status=status.HTTP_201_CREATED)
         else:
             data = serializer.errors
@@ -114,37 +132,83 @@ class CustomLogInView(ObtainAuthToken):
 
         if serializer.is_valid():
             user = serializer.validated_data['user']
-            token, _ = Token.objects.get_or_create(user=user)
-            username = f"{user.first_name} {user.last_name}".strip()
-            data = {
-                'token': token.key,
-                'username': username,
-                'email': user.email,
-                'user_id': user.id,
-    
-            }
-            return Response(data)
+            token = AuthToken.issue(user, get_device(request))
+            return Response(token_response_data(token, user))
         else:
             return Response(
                 {'error': 'Invalid username or password'},
                 status=status.HTTP_400_BAD_REQUEST)
             
 
-class BusinessUserListView(generics.ListAPIView):
+class TokenRefreshView(APIView):
+    """
+    API view to rotate the token used for the request.
+
+    Issues a new token for the same user and device and deletes the presented one,
+    so a client keeps its session alive without ever holding a permanent token.
+    Legacy tokens are replaced by expiring ones the same way.
+
+    Methods:
+        post(): Rotates the current token.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        with transaction.atomic():
+            old_token = request.auth
+            device = getattr(old_token, 'device', '') or get_device(request)
+            token = AuthToken.issue(request.user, device)
+            if old_token is not None:
+                old_token.delete()
+        return Response(token_response_data(token, request.user))
+
+
+class ProfileDirectoryMixin:
+    """
+    Shared configuration of the paginated business and customer directories.
+
+    Profiles of profile_type are loaded with their users in one joined query that only
+    selects the columns in directory_fields. Results can be filtered by exact
+    '?location=', which uses the (type, location) index, and by '?search=', a
+    case-insensitive username prefix match that is not index-backed.
+    """
+    profile_type = None
+    directory_fields = []
+    permission_classes = [IsAuthenticated]
+    pagination_class = ProfileDirectoryPagination
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filterset_class = ProfileDirectoryFilter
+    search_fields = ['^user__username']
+
+    def get_queryset(self):
+        return (
+            UserProfile.objects.filter(type=self.profile_type)
+            .select_related('user')
+            .only('user__username', 'user__first_name', 'user__last_name', *self.directory_fields)
+            .order_by('id')
+        )
+
+
+class BusinessUserListView(ProfileDirectoryMixin, generics.ListAPIView):
     """
     API view to list all users with type 'business'.
 
     Inherits from ListAPIView and filters UserProfiles accordingly.
+    The rating summary is joined into the same query.
     Requires authentication.
     """
     serializer_class = BusinessProfileSerializer
-    permission_classes = [IsAuthenticated]
+    profile_type = 'business'
+    directory_fields = [
+        'type', 'file', 'location', 'tel', 'description', 'working_hours',
+        'user__rating_summary__review_count', 'user__rating_summary__rating_sum',
+    ]
 
     def get_queryset(self):
-        return UserProfile.objects.filter(type='business')
+        return super().get_queryset().select_related('user__rating_summary')
 
 
-class CustomerUserListView(generics.ListAPIView):
+class CustomerUserListView(ProfileDirectoryMixin, generics.ListAPIView):
     """
     API view to list all users with type 'customer'.
 
@@ -152,7 +216,5 @@ class CustomerUserListView(generics.ListAPIView):
     Requires authentication.
     """
     serializer_class = CustomerProfileSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        return UserProfile.objects.filter(type='customer')
+    profile_type = 'customer'
+    directory_fields = ['type', 'file', 'created_at']
@@ -0,0 +1,47 @@
+"""
+Management command that deletes expired authentication tokens.
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from auth_app.models import AuthToken
+from auth_app.api.authentication import get_token_lifetime
+
+
+class Command(BaseCommand):
+    """
+    Deletes expired AuthToken rows in batches using the expires_at index, so the sweep
+    never holds a long write lock on the table. Legacy DRF tokens older than the token
+    lifetime are removed as well.
+    """
+    help = "Deletes expired authentication tokens."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of tokens deleted per statement.',
+        )
+
+    def sweep(self, queryset, order_by, pk_field, batch_size):
+        """
+        Deletes the rows of the queryset in batches and returns how many were deleted.
+        """
+        total = 0
+        while True:
+            ids = list(queryset.order_by(order_by).values_list(pk_field, flat=True)[:batch_size])
+            if not ids:
+                return total
+            total += queryset.model.objects.filter(**{f'{pk_field}__in': ids}).delete()[0]
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = options['batch_size']
+        expired = self.sweep(AuthToken.objects.filter(expires_at__lte=now), 'expires_at', 'id', batch_size)
+        legacy = self.sweep(
+            Token.objects.filter(created__lte=now - get_token_lifetime()), 'created', 'key', batch_size
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {expired} expired token(s) and {legacy} legacy token(s)."
+        ))
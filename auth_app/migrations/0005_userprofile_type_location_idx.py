@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 10:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0004_authtoken'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['type', 'location'], name='profile_type_location_idx'),
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
+import binascii
+import os
+from datetime import timedelta
+from django.conf import settings
+from django.db import models, transaction
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class UserProfile(models.Model):
@@ -21,6 +26,83 @@ class UserProfile(models.Model):
     file = models.ImageField(upload_to='profile_pictures/', blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['type', 'location'], name='profile_type_location_idx'),
+        ]
+
     def __str__(self):
         return self.user.username
-    
\ No newline at end of file
+
+
+class AuthToken(models.Model):
+    """
+    Expiring authentication token; a user holds one per device or login.
+
+    Tokens expire AUTH_TOKEN_LIFETIME after they are issued and are rotated through the
+    refresh endpoint. Only the newest AUTH_TOKEN_MAX_PER_USER tokens of a user are kept,
+    and expired tokens are removed by sweep_expired_tokens using the expires_at index.
+    """
+    key = models.CharField(max_length=40, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='auth_tokens')
+    device = models.CharField(max_length=255, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        """
+        Meta options for the AuthToken model.
+        """
+        verbose_name = "Auth Token"
+        verbose_name_plural = "Auth Tokens"
+
+    @staticmethod
+    def generate_key():
+        """
+        Returns a new random token key.
+        """
+        return binascii.hexlify(os.urandom(20)).decode()
+
+    @classmethod
+    def issue(cls, user, device=''):
+        """
+        Creates a new token for the user and drops the user's oldest tokens beyond
+        AUTH_TOKEN_MAX_PER_USER.
+        """
+        lifetime = getattr(settings, 'AUTH_TOKEN_LIFETIME', timedelta(days=14))
+        max_per_user = getattr(settings, 'AUTH_TOKEN_MAX_PER_USER', 10)
+        with transaction.atomic():
+            token = cls.objects.create(
+                key=cls.generate_key(), user=user, device=device[:255],
+                expires_at=timezone.now() + lifetime,
+            )
+            stale = cls.objects.filter(user=user).order_by('-created_at', '-id').values_list('id', flat=True)
+            stale_ids = list(stale[max_per_user:])
+            if stale_ids:
+                cls.objects.filter(id__in=stale_ids).delete()
+        return token
+
+    @property
+    def is_expired(self):
+        """
+        Returns True once the token's lifetime has passed.
+        """
+        return self.expires_at <= timezone.now()
+
+    def __str__(self):
+        return f"{self.user.username} ({self.device or 'unknown device'})"
+
+
+def get_profile_type(user):
+    """
+    Returns the profile type ('customer' or 'business') of a user, or None without a profile.
+
+    Authentication sets `user.profile_type` from the same joined lookup that loads the
+    user, so permission checks normally add no query. Users obtained another way fall back
+    to their profile, and the result is remembered on the instance.
+    """
+    if 'profile_type' not in user.__dict__:
+        profile = getattr(user, 'userprofile', None) if user.is_authenticated else None
+        user.profile_type = profile.type if profile else None
+    return user.profile_type
+
@@ -0,0 +1,66 @@
+"""
+Signal handlers keeping the authentication token cache consistent.
+
+Keys are dropped immediately and again once the transaction commits, so a request
+that re-cached the old rows while the change was still uncommitted cannot keep them.
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from auth_app.models import AuthToken, UserProfile
+from auth_app.api.authentication import get_token_cache
+
+
+def invalidate_keys(keys):
+    """
+    Drops the token keys from the cache now and after the current transaction commits.
+    """
+    if not keys:
+        return
+    cache = get_token_cache()
+    cache.invalidate(*keys)
+    transaction.on_commit(lambda: cache.invalidate(*keys))
+
+
+def user_token_keys(user_id):
+    """
+    Returns the keys of every token, expiring or legacy, of the user.
+    """
+    return (
+        list(AuthToken.objects.filter(user_id=user_id).values_list('key', flat=True))
+        + list(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+    )
+
+
+@receiver(post_delete, sender=AuthToken)
+@receiver(post_save, sender=AuthToken)
+@receiver(post_delete, sender=Token)
+@receiver(post_save, sender=Token)
+def invalidate_token(sender, instance, **kwargs):
+    """
+    Drops a token from the cache when it is deleted (logout, rotation) or changed.
+    """
+    invalidate_keys([instance.key])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, created, **kwargs):
+    """
+    Drops every cached token of a user whose account changed, so deactivation and
+    password changes take effect on the next request.
+    """
+    if created:
+        return
+    invalidate_keys(user_token_keys(instance.pk))
+
+
+@receiver(post_delete, sender=UserProfile)
+@receiver(post_save, sender=UserProfile)
+def invalidate_profile_tokens(sender, instance, **kwargs):
+    """
+    Drops every cached token of a user whose profile was created, changed, or deleted,
+    so the cached profile type is never stale.
+    """
+    invalidate_keys(user_token_keys(instance.user_id))
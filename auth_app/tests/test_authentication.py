@@ -0,0 +1,236 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+from django.contrib.auth.models import User
+from auth_app.models import UserProfile, AuthToken
+from auth_app.api.authentication import get_token_cache, CachedTokenAuthentication
+from rest_framework import status
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """
+    Test suite for the cached token authentication and its invalidation.
+    """
+
+    def setUp(self):
+        """
+        Create a business user with a token and start from an empty token cache.
+        """
+        get_token_cache().clear()
+        self.user = User.objects.create_user(username='cached_user', password='test123')
+        UserProfile.objects.create(user=self.user, type='business')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.url = reverse('business-user-list')
+
+    def get_token_queries(self):
+        """
+        Performs a request and returns the queries that touched the token table.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [q['sql'] for q in queries.captured_queries if 'authtoken_token' in q['sql']]
+
+    def test_repeated_requests_skip_token_lookup(self):
+        """
+        Test that only the first request with a token queries the token table.
+        """
+        self.assertEqual(len(self.get_token_queries()), 1)
+        self.assertEqual(self.get_token_queries(), [])
+
+    def test_cached_entry_excludes_password_hash(self):
+        """
+        Test that the cached entry never holds the password hash and that a restored
+        user only loads it from the database on access.
+        """
+        self.get_token_queries()
+        entry = get_token_cache().get(self.token.key)
+        self.assertNotIn(self.user.password, entry['user'])
+
+        user, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        self.assertIn('password', user.get_deferred_fields())
+        self.assertEqual(user.username, 'cached_user')
+        self.assertTrue(user.check_password('test123'))
+
+    def test_deleted_token_is_rejected(self):
+        """
+        Test that deleting a token (logout or rotation) invalidates the cached entry.
+        """
+        self.get_token_queries()
+        self.token.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_rejected(self):
+        """
+        Test that deactivating a user invalidates the cached tokens of that user.
+        """
+        self.get_token_queries()
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_change_reloads_user(self):
+        """
+        Test that a password change drops the cached entry, so the next request reloads the user.
+        """
+        self.get_token_queries()
+        self.user.set_password('new-password-123')
+        self.user.save()
+        self.assertEqual(len(self.get_token_queries()), 1)
+
+    def test_profile_type_is_resolved_with_authentication(self):
+        """
+        Test that permission checks read the profile type resolved during authentication,
+        so neither the first nor later requests query the profile table separately.
+        """
+        from reviews_app.models import Review
+
+        customer = User.objects.create_user(username='cached_customer', password='test123')
+        UserProfile.objects.create(user=customer, type='customer')
+        token = Token.objects.create(user=customer)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+        for business_user in (self.user, User.objects.create_user(username='other_business')):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    reverse('review-list'), {'business_user': business_user.id, 'rating': 5}, format='json'
+                )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            profile_queries = [
+                q['sql'] for q in queries.captured_queries
+                if q['sql'].startswith('SELECT') and 'auth_app_userprofile' in q['sql']
+                and 'authtoken' not in q['sql']
+            ]
+            self.assertEqual(profile_queries, [])
+        self.assertEqual(Review.objects.filter(reviewer=customer).count(), 2)
+
+    def test_profile_type_change_invalidates_cached_role(self):
+        """
+        Test that changing a profile type takes effect on the next request.
+        """
+        offer_data = {'title': 'Rollen', 'description': 'Test', 'details': []}
+        self.get_token_queries()
+        profile = UserProfile.objects.get(user=self.user)
+        profile.type = 'customer'
+        profile.save()
+
+        response = self.client.post(reverse('offer-list'), offer_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ExpiringTokenTests(APITestCase):
+    """
+    Test suite for issuing, rotating, expiring, and sweeping auth tokens.
+    """
+
+    def setUp(self):
+        """
+        Create a customer user and start from an empty token cache.
+        """
+        get_token_cache().clear()
+        self.user = User.objects.create_user(username='token_user', password='test123')
+        UserProfile.objects.create(user=self.user, type='customer')
+        self.url = reverse('business-user-list')
+
+    def login(self, device):
+        """
+        Logs in from the given device and returns the response data.
+        """
+        response = self.client.post(
+            reverse('login'), {'username': 'token_user', 'password': 'test123'},
+            format='json', HTTP_USER_AGENT=device,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_login_issues_token_per_device(self):
+        """
+        Test that every login issues a separate, expiring token for its device.
+        """
+        phone = self.login('phone')
+        laptop = self.login('laptop')
+        self.assertNotEqual(phone['token'], laptop['token'])
+        self.assertIn('expires_at', phone)
+        self.assertEqual(
+            set(AuthToken.objects.filter(user=self.user).values_list('device', flat=True)),
+            {'phone', 'laptop'},
+        )
+
+    @override_settings(AUTH_TOKEN_MAX_PER_USER=2)
+    def test_oldest_tokens_are_pruned(self):
+        """
+        Test that issuing more than AUTH_TOKEN_MAX_PER_USER tokens deletes the oldest ones.
+        """
+        first = self.login('one')['token']
+        self.login('two')
+        self.login('three')
+        self.assertEqual(AuthToken.objects.filter(user=self.user).count(), 2)
+        self.assertFalse(AuthToken.objects.filter(key=first).exists())
+
+    def test_refresh_rotates_token(self):
+        """
+        Test that refreshing issues a new token for the same device and revokes the old one.
+        """
+        old_key = self.login('phone')['token']
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + old_key)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        response = self.client.post(reverse('token-refresh'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_token = AuthToken.objects.get(key=response.data['token'])
+        self.assertEqual(new_token.device, 'phone')
+        self.assertFalse(AuthToken.objects.filter(key=old_key).exists())
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + new_token.key)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_expired_token_is_rejected_from_cache(self):
+        """
+        Test that a cached token is rejected once it expires, without a token lookup.
+        """
+        token = AuthToken.issue(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        expired = timezone.now() + timedelta(days=15)
+        with mock.patch('time.time', return_value=expired.timestamp()):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual([q for q in queries.captured_queries if 'authtoken' in q['sql']], [])
+
+    def test_legacy_token_expires_after_lifetime(self):
+        """
+        Test that permanent DRF tokens stop working AUTH_TOKEN_LIFETIME after their creation.
+        """
+        token = Token.objects.create(user=self.user)
+        Token.objects.filter(key=token.key).update(created=timezone.now() - timedelta(days=15))
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_sweep_expired_tokens(self):
+        """
+        Test that the sweeper deletes expired tokens and keeps valid ones.
+        """
+        valid = AuthToken.issue(self.user, 'valid')
+        expired = AuthToken.issue(self.user, 'expired')
+        AuthToken.objects.filter(pk=expired.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+        legacy = Token.objects.create(user=self.user)
+        Token.objects.filter(key=legacy.key).update(created=timezone.now() - timedelta(days=15))
+
+        call_command('sweep_expired_tokens', batch_size=1, stdout=StringIO())
+
+        self.assertEqual(list(AuthToken.objects.values_list('pk', flat=True)), [valid.pk])
+        self.assertFalse(Token.objects.exists())
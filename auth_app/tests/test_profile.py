@@ -40,8 +40,8 @@ class UserProfileAPITests(APITestCase):
         """
         response = self.client.get('/api/profiles/business/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(all(p['type'] == 'business' for p in response.data))
-        for profile in response.data:
+        self.assertTrue(all(p['type'] == 'business' for p in response.data['results']))
+        for profile in response.data['results']:
             for field in ['first_name', 'last_name', 'location', 'tel', 'description', 'working_hours']:
                 self.assertIsNotNone(profile.get(field))
 
@@ -51,11 +51,53 @@ class UserProfileAPITests(APITestCase):
         """
         response = self.client.get('/api/profiles/customer/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(all(p['type'] == 'customer' for p in response.data))
-        for profile in response.data:
+        self.assertTrue(all(p['type'] == 'customer' for p in response.data['results']))
+        for profile in response.data['results']:
             for field in ['first_name', 'last_name', 'file']:
                 self.assertIsNotNone(profile.get(field))
 
+    def test_directories_use_constant_query_count(self):
+        """
+        Test that the directories join users into the page query, so their query count
+        (count + page) does not grow with the number of profiles.
+        """
+        for index in range(5):
+            business = User.objects.create_user(username=f'business_{index}', first_name='Anna')
+            UserProfile.objects.create(user=business, type='business')
+            customer = User.objects.create_user(username=f'customer_{index}', last_name='Meyer')
+            UserProfile.objects.create(user=customer, type='customer')
+        self.client.get('/api/profiles/business/')
+
+        for url, expected in (('/api/profiles/business/', 6), ('/api/profiles/customer/', 6)):
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            self.assertEqual(response.data['count'], expected)
+            self.assertEqual(len(response.data['results']), expected)
+
+    def test_directories_paginate_and_filter(self):
+        """
+        Test the page size, the location filter, and the username prefix search.
+        """
+        for index in range(3):
+            user = User.objects.create_user(username=f'munich_{index}', first_name='Max')
+            UserProfile.objects.create(user=user, type='business', location='München')
+
+        response = self.client.get('/api/profiles/business/', {'page_size': 2})
+        self.assertEqual(response.data['count'], 4)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get('/api/profiles/business/', {'location': 'Berlin'})
+        self.assertEqual([p['username'] for p in response.data['results']], ['business_user'])
+
+        response = self.client.get('/api/profiles/business/', {'search': 'MUNICH'})
+        self.assertEqual(response.data['count'], 3)
+        response = self.client.get('/api/profiles/business/', {'search': 'max'})
+        self.assertEqual(response.data['count'], 0)
+
+        response = self.client.get('/api/profiles/customer/', {'search': 'customer'})
+        self.assertEqual([p['username'] for p in response.data['results']], ['customer_user'])
+
     def test_get_single_profile(self):
         """
         Test retrieving a single profile returns correct user data.
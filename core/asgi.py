@@ -2,6 +2,9 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The order event stream (/api/order-events/) is only served through this application,
+e.g. ``uvicorn core.asgi:application``, with the reverse proxy routing that path here
+and everything else to the WSGI workers (core.wsgi). Under WSGI the stream returns 501.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
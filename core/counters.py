@@ -0,0 +1,20 @@
+"""
+Shared helper for denormalized counter rows.
+
+Apps keep materialized counts and sums next to the rows they summarize and
+adjust them in the same transaction as the write, instead of aggregating on read.
+"""
+from django.db.models import F
+
+
+def adjust_row(model, lookup, **deltas):
+    """
+    Atomically adds the given deltas to the row matching lookup, creating it on first use.
+    """
+    rows = model.objects.filter(**lookup)
+    increments = {field: F(field) + delta for field, delta in deltas.items()}
+    if rows.update(**increments):
+        return
+    _, created = model.objects.get_or_create(**lookup, defaults=deltas)
+    if not created:
+        rows.update(**increments)
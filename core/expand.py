@@ -0,0 +1,95 @@
+"""
+Shared support for the `?expand=` query parameter.
+
+Serializers declare which related resources can be embedded inline, and views
+declare the select_related/prefetch_related paths each expansion needs, so an
+expanded response is served with a fixed number of queries.
+"""
+from django.core.exceptions import ObjectDoesNotExist
+
+
+def get_requested_expansions(request):
+    """
+    Returns the set of expansion names requested via `?expand=a,b,c`.
+    """
+    if request is None:
+        return set()
+    raw = request.query_params.get('expand', '')
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+
+def resolve_source(instance, source):
+    """
+    Follows a dotted attribute path such as 'customer.userprofile'.
+
+    Returns None if any step along the path is missing.
+    """
+    value = instance
+    for attr in source.split('.'):
+        try:
+            value = getattr(value, attr)
+        except ObjectDoesNotExist:
+            return None
+        if value is None:
+            return None
+    return value
+
+
+class ExpandableSerializerMixin:
+    """
+    Serializer mixin that embeds related resources when they are requested via `?expand=`.
+
+    `expandable_fields` maps an expansion name to a tuple of
+    (output field, source path, serializer class, many).
+    """
+    expandable_fields = {}
+
+    def get_expansions(self):
+        """
+        Returns the requested expansions supported by this serializer.
+        """
+        return get_requested_expansions(self.context.get('request')) & set(self.expandable_fields)
+
+    def to_representation(self, instance):
+        """
+        Serializes the instance and replaces expanded fields with embedded representations.
+        """
+        representation = super().to_representation(instance)
+        for name in self.get_expansions():
+            field, source, serializer_class, many = self.expandable_fields[name]
+            related = resolve_source(instance, source)
+            if related is None:
+                representation[field] = [] if many else None
+                continue
+            if many:
+                related = related.all()
+            representation[field] = serializer_class(related, many=many, context=self.context).data
+        return representation
+
+
+class ExpandQuerysetMixin:
+    """
+    View mixin that adds the joins and prefetches needed by the requested expansions.
+
+    `expand_related` maps an expansion name to a tuple of
+    (select_related paths, prefetch_related paths).
+    """
+    expand_related = {}
+
+    def get_expansions(self):
+        """
+        Returns the requested expansions supported by this view.
+        """
+        return get_requested_expansions(getattr(self, 'request', None)) & set(self.expand_related)
+
+    def apply_expansions(self, queryset):
+        """
+        Applies select_related/prefetch_related for every requested expansion.
+        """
+        for name in self.get_expansions():
+            select, prefetch = self.expand_related[name]
+            if select:
+                queryset = queryset.select_related(*select)
+            if prefetch:
+                queryset = queryset.prefetch_related(*prefetch)
+        return queryset
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from datetime import timedelta
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -121,6 +122,18 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Point this at a shared backend (e.g. Redis or Memcached) when running several workers,
+# so cached snapshots and their single-flight locks are shared between processes.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -168,13 +181,60 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.api.authentication.CachedTokenAuthentication',
+        'overview_app.api.authentication.BatchSubRequestAuthentication',
     ],
        'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend'
     ],
 }
 
+AUTH_TOKEN_LIFETIME = timedelta(days=14)
+
+AUTH_TOKEN_MAX_PER_USER = 10
+
+AUTH_TOKEN_CACHE_MAX_SIZE = 10000
+
+AUTH_TOKEN_CACHE_TTL = 60
+
+AUTH_TOKEN_CACHE_ALIAS = None
+
+ORDER_IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+ORDER_ARCHIVE_AFTER_DAYS = 365
+
+# The event stream runs in the ASGI process while orders are written by the WSGI workers,
+# so events travel through the shared outbox table rather than process memory.
+ORDER_EVENT_BROKER = 'orders_app.events.OutboxOrderEventBroker'
+
+ORDER_EVENT_POLL_SECONDS = 1
+
+ORDER_EVENT_QUEUE_SIZE = 100
+
+ORDER_EVENT_HEARTBEAT_SECONDS = 15
+
+ORDER_OUTBOX_HANDLERS = [
+    'orders_app.outbox.log_order_event',
+]
+
+ORDER_OUTBOX_MAX_ATTEMPTS = 8
+
+ORDER_OUTBOX_RETRY_BASE_SECONDS = 5
+
+ORDER_OUTBOX_RETRY_MAX_SECONDS = 3600
+
+ORDER_OUTBOX_LEASE_SECONDS = 60
+
+ORDER_OUTBOX_RETENTION_DAYS = 7
+
+BUSINESS_LEADERBOARD_PRIOR_WEIGHT = 5
+
+BASE_INFO_CACHE_TTL = 60
+
+BASE_INFO_STALE_TTL = 300
+
+BASE_INFO_LOCK_TIMEOUT = 10
+
 AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
 ]
@@ -1,6 +1,7 @@
 """
 Custom permission classes for offers_app to control access to offer-related views.
 """
+from auth_app.models import get_profile_type
 from rest_framework.permissions import BasePermission, IsAuthenticated, SAFE_METHODS
 
 
@@ -13,8 +14,7 @@ class IsBusinessUser(BasePermission):
         return bool(
             request.user and
             request.user.is_authenticated and
-            hasattr(request.user, 'userprofile') and
-            request.user.userprofile.type == 'business'
+            get_profile_type(request.user) == 'business'
         )
 
 
@@ -41,8 +41,7 @@ class IsBusinessOrReadOnly(BasePermission):
         return (
             request.user and
             request.user.is_authenticated and
-            hasattr(request.user, 'userprofile') and
-            request.user.userprofile.type == 'business'
+            get_profile_type(request.user) == 'business'
         )
 
 
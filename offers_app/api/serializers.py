@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from offers_app.models import Offer, OfferDetail
+from auth_app.api.serializers import PublicProfileSerializer
+from core.expand import ExpandableSerializerMixin
 
 
 class OfferDetailSerializer(serializers.ModelSerializer):
@@ -96,12 +98,20 @@ class OfferSerializer(serializers.ModelSerializer):
         }
 
 
-class OfferListSerializer(serializers.ModelSerializer):
+OFFER_EXPANDABLE_FIELDS = {
+    'details': ('details', 'details', OfferDetailSerializer, True),
+    'user': ('user', 'user.userprofile', PublicProfileSerializer, False),
+}
+
+
+class OfferListSerializer(ExpandableSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for listing Offer objects.
     Provides a simplified view of Offer details (only ID and URL) for list view.
     Includes min_price, min_delivery_time, and user details.
+    Supports `?expand=details,user` to embed full details and the owner's public profile.
     """
+    expandable_fields = OFFER_EXPANDABLE_FIELDS
     details = serializers.SerializerMethodField()
     min_price = serializers.DecimalField(
         max_digits=10, decimal_places=2, source='overall_min_price', read_only=True
@@ -175,11 +185,13 @@ class OfferDetailLinkSerializer(serializers.ModelSerializer):
         return request.build_absolute_uri(f'/api/offerdetails/{obj.id}/')
 
 
-class OfferRetrieveSerializer(serializers.ModelSerializer):
+class OfferRetrieveSerializer(ExpandableSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for retrieving a single Offer object.
     Includes linked OfferDetail IDs and URLs, and calculated min_price/delivery_time.
+    Supports `?expand=details,user` to embed full details and the owner's public profile.
     """
+    expandable_fields = OFFER_EXPANDABLE_FIELDS
     details = OfferDetailLinkSerializer(many=True, read_only=True)
     min_price = serializers.DecimalField(
         max_digits=10, decimal_places=2, source='overall_min_price', read_only=True
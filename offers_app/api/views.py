@@ -12,6 +12,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from django.http import Http404
 from rest_framework.exceptions import ValidationError
+from core.expand import ExpandQuerysetMixin
 
 """
 API views for managing Offer and OfferDetail resources.
@@ -21,24 +22,30 @@ searching, ordering, and pagination. Also includes a detail viewset for
 retrieving, updating, and deleting individual OfferDetail instances.
 """
 
-class OfferViewSet(viewsets.ModelViewSet):
+class OfferViewSet(ExpandQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Offer instances.
 
     Provides CRUD operations and supports filtering, searching, ordering, and pagination.
     Handles user-specific permissions and annotated minimum values for price and delivery time.
+    Related details and the owner's profile can be embedded via `?expand=details,user`.
     """
     queryset = Offer.objects.all()
+    expand_related = {
+        'details': ([], ['details']),
+        'user': (['user__userprofile'], []),
+    }
 
     def get_queryset(self):
         """
         Returns a queryset of Offer objects annotated with minimum price and delivery time,
-        ordered by the most recently updated.
+        ordered by the most recently updated, with joins for any requested expansions.
         """
-        return Offer.objects.annotate(
+        queryset = Offer.objects.annotate(
             overall_min_price=Min('details__price'),
             overall_min_delivery_time=Min('details__delivery_time_in_days')
         ).distinct().order_by('-updated_at')
+        return self.apply_expansions(queryset)
 
     permission_classes = [IsBusinessOrReadOnly, IsOfferOwnerOrReadOnly]
     pagination_class = OffersResultPagination
@@ -118,17 +125,60 @@ class OfferViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class OfferDetailViewSet(mixins.RetrieveModelMixin,
+class OfferDetailViewSet(mixins.ListModelMixin,
+                         mixins.RetrieveModelMixin,
                          mixins.UpdateModelMixin,
                          mixins.DestroyModelMixin,
                          viewsets.GenericViewSet):
     """
     ViewSet for managing individual OfferDetail instances.
 
-    Supports retrieve, partial update, and delete operations.
+    Supports batched retrieval via `?ids=`, retrieve, partial update, and delete operations.
     Requires authentication.
     """
     queryset = OfferDetail.objects.all()
     serializer_class = OfferDetailSerializer
     permission_classes = [IsAuthenticated]
-    http_method_names = ['get', 'patch', 'delete']
\ No newline at end of file
+    http_method_names = ['get', 'patch', 'delete']
+    max_batch_size = 50
+
+    def get_requested_ids(self):
+        """
+        Parses the comma-separated `ids` query parameter into a list of unique integers,
+        preserving the order in which they were requested.
+
+        Raises:
+            ValidationError: If the parameter is missing, malformed, or exceeds max_batch_size.
+        """
+        raw_ids = self.request.query_params.get('ids', '')
+        try:
+            ids = [int(value) for value in raw_ids.split(',') if value.strip()]
+        except ValueError:
+            raise ValidationError({'ids': 'Must be a comma-separated list of integers.'})
+
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            raise ValidationError({'ids': 'At least one id is required.'})
+        if len(ids) > self.max_batch_size:
+            raise ValidationError({'ids': f'At most {self.max_batch_size} ids can be requested at once.'})
+        return ids
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns all OfferDetails named in the `ids` query parameter with a single query.
+
+        Responds with 404 and the missing ids if any of them is not visible to the requester,
+        so clients never receive a silently incomplete batch.
+        """
+        ids = self.get_requested_ids()
+        details = {detail.id: detail for detail in self.get_queryset().filter(pk__in=ids)}
+
+        missing = [pk for pk in ids if pk not in details]
+        if missing:
+            return Response(
+                {'detail': 'Some offer details were not found.', 'missing_ids': missing},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = self.get_serializer([details[pk] for pk in ids], many=True)
+        return Response(serializer.data)
\ No newline at end of file
@@ -470,3 +470,95 @@ class OffersAPITest(APITestCase):
 
         delete_response = self.client.delete(detail_url)
         self.assertIn(delete_response.status_code, [status.HTTP_403_FORBIDDEN, status.HTTP_204_NO_CONTENT])
+
+
+class OfferDetailBatchTests(APITestCase):
+    """
+    Tests for fetching several OfferDetails at once via /api/offerdetails/?ids=.
+    """
+
+    def setUp(self):
+        from offers_app.models import Offer, OfferDetail
+
+        self.business_user = User.objects.create_user(username='batch_business', password='test123')
+        UserProfile.objects.create(user=self.business_user, type='business')
+        self.token = Token.objects.create(user=self.business_user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+        offer = Offer.objects.create(user=self.business_user, title="Batch", description="Batch Test")
+        self.details = [
+            OfferDetail.objects.create(
+                offer=offer,
+                title=f"Detail {i}",
+                revisions=1,
+                delivery_time_in_days=i + 1,
+                price=100 + i,
+                features=["Feature"],
+                offer_type=offer_type
+            )
+            for i, offer_type in enumerate(['basic', 'standard', 'premium'])
+        ]
+        self.url = reverse('offerdetail-list')
+
+    def test_batch_returns_details_in_requested_order_with_one_query(self):
+        """
+        Test that all requested details are returned in request order using a single detail query.
+        """
+        ids = [self.details[2].id, self.details[0].id, self.details[1].id]
+        self.client.get(self.url, {'ids': str(ids[0])})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'ids': ','.join(str(pk) for pk in ids)})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([d['id'] for d in response.data], ids)
+
+    def test_batch_with_unknown_id_returns_404(self):
+        """
+        Test that a batch containing an unknown id is rejected and lists the missing ids.
+        """
+        response = self.client.get(self.url, {'ids': f"{self.details[0].id},999999"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['missing_ids'], [999999])
+
+    def test_batch_rejects_missing_invalid_or_oversized_ids(self):
+        """
+        Test that missing, malformed and oversized id lists return HTTP 400.
+        """
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'ids': 'a,b'}).status_code, status.HTTP_400_BAD_REQUEST)
+        too_many = ','.join(str(i) for i in range(1, 52))
+        self.assertEqual(self.client.get(self.url, {'ids': too_many}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_retrieve_offer_with_expand_embeds_details_and_user(self):
+        """
+        Test that ?expand=details,user embeds the full details and the owner's profile.
+        """
+        offer_id = self.details[0].offer_id
+        url = reverse('offer-detail', kwargs={'pk': offer_id})
+
+        plain = self.client.get(url)
+        self.assertEqual(set(plain.data['details'][0]), {'id', 'url'})
+
+        response = self.client.get(url, {'expand': 'details,user'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({d['title'] for d in response.data['details']}, {'Detail 0', 'Detail 1', 'Detail 2'})
+        self.assertEqual(response.data['user']['username'], 'batch_business')
+
+    def test_anonymous_expanded_offers_hide_contact_details(self):
+        """
+        Test that the owner's profile embedded for anonymous clients has no email or phone.
+        """
+        self.business_user.email = 'secret@biz.com'
+        self.business_user.save()
+        UserProfile.objects.filter(user=self.business_user).update(tel='12345', location='Berlin')
+        self.client.credentials()
+
+        response = self.client.get(reverse('offer-list'), {'expand': 'user'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        owner = response.data['results'][0]['user']
+        self.assertEqual((owner['username'], owner['location']), ('batch_business', 'Berlin'))
+        self.assertNotIn('email', owner)
+        self.assertNotIn('tel', owner)
+        self.assertNotIn('secret@biz.com', str(response.data))
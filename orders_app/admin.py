@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Order
+from .models import Order, ArchivedOrder, OrderOutboxEvent
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
@@ -33,7 +33,12 @@ class OrderAdmin(admin.ModelAdmin):
         'created_at',
         'updated_at',
         'price_at_order',       
-        'display_total_price'   
+        'display_total_price',
+        'title',
+        'revisions',
+        'delivery_time_in_days',
+        'features',
+        'offer_type'
     )
 
     fieldsets = (
@@ -41,6 +46,10 @@ class OrderAdmin(admin.ModelAdmin):
             'fields': ('customer', 'offer', 'ordered_detail'),
             'description': 'Core details about the customer and the ordered item.'
         }),
+        ('Purchased Detail', {
+            'fields': ('title', 'revisions', 'delivery_time_in_days', 'features', 'offer_type'),
+            'description': 'Snapshot of the offer detail at the time of purchase.'
+        }),
         ('Pricing & Quantity', {
             'fields': ('quantity', 'price_at_order', 'display_total_price'),
         }),
@@ -65,3 +74,79 @@ class OrderAdmin(admin.ModelAdmin):
         extra_context = extra_context or {}
         extra_context['title'] = 'Manage Customer Orders'
         return super().changelist_view(request, extra_context=extra_context)
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    """
+    Read-only admin view of orders moved to the archive table.
+    """
+    list_display = (
+        'id',
+        'customer',
+        'business_user',
+        'title',
+        'status',
+        'price_at_order',
+        'created_at',
+        'archived_at'
+    )
+
+    list_filter = (
+        'status',
+        'archived_at'
+    )
+
+    search_fields = (
+        'customer__username',
+        'business_user__username',
+        'title'
+    )
+
+    ordering = ('-created_at',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(OrderOutboxEvent)
+class OrderOutboxEventAdmin(admin.ModelAdmin):
+    """
+    Admin view for inspecting outbox events and their delivery attempts.
+    """
+    list_display = (
+        'id',
+        'event_type',
+        'order_id',
+        'status',
+        'attempts',
+        'created_at',
+        'dispatched_at'
+    )
+
+    list_filter = (
+        'status',
+        'event_type'
+    )
+
+    search_fields = (
+        'order_id',
+    )
+
+    readonly_fields = (
+        'event_type',
+        'order_id',
+        'payload',
+        'attempts',
+        'last_error',
+        'created_at',
+        'dispatched_at'
+    )
+
+    ordering = ('-id',)
+
+    def has_add_permission(self, request):
+        return False
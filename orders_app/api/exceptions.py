@@ -0,0 +1,23 @@
+"""
+Custom API exceptions for the orders_app.
+"""
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class OrderVersionConflict(APIException):
+    """
+    Raised when an order was modified by another request between reading and writing it.
+    """
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'Die Bestellung wurde zwischenzeitlich geändert. Bitte erneut laden.'
+    default_code = 'conflict'
+
+
+class OrderPreconditionFailed(APIException):
+    """
+    Raised when the If-Match header does not match the current version of an order.
+    """
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'Die Bestellung entspricht nicht der angegebenen Version.'
+    default_code = 'precondition_failed'
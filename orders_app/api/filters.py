@@ -0,0 +1,53 @@
+import django_filters
+from orders_app.models import Order, ArchivedOrder
+
+class OrderFilter(django_filters.FilterSet):
+    """
+    A FilterSet for the Order model, allowing filtering by status,
+    creation date range, offer, and the requesting user's role in the order.
+    """
+    ROLE_CHOICES = [
+        ('customer', 'Customer'),
+        ('business', 'Business'),
+    ]
+
+    status = django_filters.ChoiceFilter(choices=Order.STATUS_CHOICES)
+    created_after = django_filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='gte')
+    created_before = django_filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='lt')
+    offer_id = django_filters.NumberFilter(field_name='offer_id')
+    role = django_filters.ChoiceFilter(choices=ROLE_CHOICES, method='filter_role')
+
+    def filter_role(self, queryset, name, value):
+        """
+        Restricts orders to those where the requesting user is the customer
+        or the business, so a single indexed column drives the lookup.
+        """
+        user = self.request.user
+        if value == 'customer':
+            return queryset.filter(customer=user)
+        return queryset.filter(business_user=user)
+
+    class Meta:
+        """
+        Meta class for OrderFilter, defining the model and fields to filter on.
+        """
+        model = Order
+        fields = [
+            'status',
+            'created_after',
+            'created_before',
+            'offer_id',
+            'role',
+        ]
+
+
+class ArchivedOrderFilter(OrderFilter):
+    """
+    The OrderFilter applied to archived orders when a client requests its full history.
+    """
+
+    class Meta(OrderFilter.Meta):
+        """
+        Meta class for ArchivedOrderFilter, reusing the OrderFilter fields.
+        """
+        model = ArchivedOrder
@@ -0,0 +1,90 @@
+"""
+Idempotency-Key support for order creation in the orders_app.
+"""
+import hashlib
+import json
+from datetime import timedelta
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from orders_app.models import OrderIdempotencyKey
+
+
+class IdempotentCreateMixin:
+    """
+    View mixin that makes a create handler safe to retry.
+
+    The first successful response for a (user, Idempotency-Key) pair is stored in the same
+    transaction as the created order; repeated requests with that key replay it with a
+    single lookup. Reusing a key with a different payload is rejected with HTTP 422.
+    """
+    idempotency_header = 'Idempotency-Key'
+
+    def get_idempotency_ttl(self):
+        """
+        Returns how long stored responses are replayed.
+        """
+        return getattr(settings, 'ORDER_IDEMPOTENCY_KEY_TTL', timedelta(hours=24))
+
+    def get_request_hash(self, request):
+        """
+        Returns a stable hash of the request payload.
+        """
+        payload = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def replay(self, stored, request_hash):
+        """
+        Returns the stored response, or HTTP 422 if the key was used for a different payload.
+        """
+        if stored.request_hash != request_hash:
+            return Response(
+                {'detail': 'Idempotency-Key was already used with a different request.'},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY
+            )
+        response = Response(stored.response_body, status=stored.response_status)
+        response['Idempotent-Replayed'] = 'true'
+        return response
+
+    def with_idempotency(self, request, handler):
+        """
+        Runs handler() once per idempotency key and replays its response for retries.
+
+        Requests without the header are passed straight through.
+        """
+        key = request.headers.get(self.idempotency_header)
+        if not key:
+            return handler()
+        if len(key) > 255:
+            raise ValidationError({'detail': 'Idempotency-Key must be at most 255 characters.'})
+
+        now = timezone.now()
+        request_hash = self.get_request_hash(request)
+        keys = OrderIdempotencyKey.objects.filter(user=request.user, key=key)
+        stored = keys.filter(expires_at__gt=now).first()
+        if stored is not None:
+            return self.replay(stored, request_hash)
+
+        try:
+            with transaction.atomic():
+                keys.filter(expires_at__lte=now).delete()
+                response = handler()
+                if status.is_success(response.status_code):
+                    OrderIdempotencyKey.objects.create(
+                        user=request.user,
+                        key=key,
+                        request_hash=request_hash,
+                        response_status=response.status_code,
+                        response_body=response.data,
+                        expires_at=now + self.get_idempotency_ttl(),
+                    )
+        except IntegrityError:
+            stored = keys.first()
+            if stored is None:
+                raise
+            return self.replay(stored, request_hash)
+        return response
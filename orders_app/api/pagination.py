@@ -0,0 +1,17 @@
+"""
+Custom pagination settings for the order list in the orders_app.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+class OrdersCursorPagination(CursorPagination):
+    """
+    Cursor pagination for orders, newest first.
+
+    Cursors keep page lookups on the created_at indexes constant-time,
+    no matter how deep a client pages into a large order history.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
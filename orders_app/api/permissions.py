@@ -1,6 +1,7 @@
 """
 Custom permission classes for the orders_app to control access to order-related operations.
 """
+from auth_app.models import get_profile_type
 from rest_framework.permissions import BasePermission
 
 
@@ -13,7 +14,6 @@ class IsCustomerUser(BasePermission):
         return (
             request.user and
             request.user.is_authenticated and
-            hasattr(request.user, 'userprofile') and
-            request.user.userprofile.type == 'customer'
+            get_profile_type(request.user) == 'customer'
         )
     
\ No newline at end of file
@@ -6,6 +6,9 @@ from rest_framework import serializers
 from orders_app.models import Order
 from offers_app.models import OfferDetail
 from offers_app.api.serializers import OfferDetailSerializer, OfferSerializer
+from auth_app.api.serializers import UserProfileSerializer
+from core.expand import ExpandableSerializerMixin
+from .exceptions import OrderVersionConflict
 from django.contrib.auth.models import User
 
 
@@ -30,7 +33,7 @@ class OrderSerializer(serializers.ModelSerializer):
     offer = OfferSerializer(read_only=True)
     ordered_detail = OfferDetailSerializer(read_only=True)
     offer_detail_id = serializers.PrimaryKeyRelatedField(
-        queryset=OfferDetail.objects.all(),
+        queryset=OfferDetail.objects.select_related('offer'),
         write_only=True,
         required=True
     )
@@ -51,7 +54,8 @@ class OrderSerializer(serializers.ModelSerializer):
         Creates a new Order instance with the current user as the customer.
 
         Extracts the related offer and price from the selected offer detail,
-        sets the default status to 'in_progress', and saves the order.
+        sets the default status to 'in_progress', and saves the order with a single INSERT.
+        The offer detail is loaded together with its offer during validation.
         """
         customer = self.context['request'].user
         validated_data.pop('customer', None)
@@ -86,19 +90,22 @@ class OrderSerializer(serializers.ModelSerializer):
         return data
     
 
-class OrderCombinedSerializer(serializers.ModelSerializer):
+class OrderCombinedSerializer(ExpandableSerializerMixin, serializers.ModelSerializer):
     """
     Read-only serializer combining order and offer detail fields for reporting purposes.
+    Detail fields are read from the snapshot taken when the order was placed.
     Includes customer and business user references.
+    Supports `?expand=details,user,business_user` to embed the ordered detail and both profiles.
     """
-    title = serializers.CharField(source='ordered_detail.title', read_only=True)
-    revisions = serializers.IntegerField(source='ordered_detail.revisions', read_only=True)
-    delivery_time_in_days = serializers.IntegerField(source='ordered_detail.delivery_time_in_days', read_only=True)
-    price = serializers.DecimalField(source='ordered_detail.price', max_digits=10, decimal_places=2, read_only=True)
-    features = serializers.JSONField(source='ordered_detail.features', read_only=True)
-    offer_type = serializers.CharField(source='ordered_detail.offer_type', read_only=True)
+    expandable_fields = {
+        'details': ('ordered_detail', 'ordered_detail', OfferDetailSerializer, False),
+        'user': ('customer_user', 'customer.userprofile', UserProfileSerializer, False),
+        'business_user': ('business_user', 'business_user.userprofile', UserProfileSerializer, False),
+    }
+    price = serializers.DecimalField(source='price_at_order', max_digits=10, decimal_places=2, read_only=True)
+    features = serializers.JSONField(read_only=True)
     customer_user = serializers.PrimaryKeyRelatedField(source='customer', read_only=True)
-    business_user = serializers.PrimaryKeyRelatedField(source='offer.user', read_only=True)
+    business_user = serializers.PrimaryKeyRelatedField(read_only=True)
 
 
     class Meta:
@@ -124,7 +131,8 @@ class OrderCombinedSerializer(serializers.ModelSerializer):
 class OrderStatusUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating the status of an existing order.
-    Restricts allowed status values and validates input.
+    Restricts allowed status values, enforces the order state machine,
+    and writes the change with a version-checked UPDATE.
     """
     class Meta:
         model = Order
@@ -134,4 +142,41 @@ class OrderStatusUpdateSerializer(serializers.ModelSerializer):
         allowed = ['in_progress', 'completed', 'cancelled']
         if value not in allowed:
             raise serializers.ValidationError(f"Status '{value}' ist nicht erlaubt.")
-        return value
\ No newline at end of file
+        if self.instance is not None and not self.instance.can_transition_to(value):
+            raise serializers.ValidationError(
+                f"Statuswechsel von '{self.instance.status}' zu '{value}' ist nicht erlaubt."
+            )
+        return value
+
+    def update(self, instance, validated_data):
+        """
+        Applies the status change only if the order still has the version it was loaded with.
+
+        Raises:
+            OrderVersionConflict: If the order was modified concurrently.
+        """
+        new_status = validated_data.get('status', instance.status)
+        if new_status != instance.status and not instance.transition_to(new_status):
+            raise OrderVersionConflict()
+        return instance
+
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """
+    Serializer for changing the status of several orders at once.
+    Accepts up to MAX_ORDERS order ids and one of the statuses a business may set.
+    """
+    MAX_ORDERS = 100
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_ORDERS
+    )
+    status = serializers.ChoiceField(choices=['in_progress', 'completed', 'cancelled'])
+
+    def validate_ids(self, value):
+        """
+        Removes duplicate ids while keeping the requested order.
+        """
+        return list(dict.fromkeys(value))
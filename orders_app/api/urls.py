@@ -7,9 +7,13 @@ router.register(r'orders', OrderViewSet, basename='order')
 urlpatterns = router.urls
 
 from django.urls import path
-from .views import OrderCountView, CompletedOrderCountView
+from .views import OrderCountView, CompletedOrderCountView, OrderStatsView, BusinessRevenueView, OrderEventStreamView, OrderOutboxMetricsView
 
 urlpatterns += [
     path('order-count/<int:business_user_id>/', OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/', CompletedOrderCountView.as_view(), name='completed-order-count'),
+    path('order-stats/<int:business_user_id>/', OrderStatsView.as_view(), name='order-stats'),
+    path('order-events/', OrderEventStreamView.as_view(), name='order-events'),
+    path('order-events/metrics/', OrderOutboxMetricsView.as_view(), name='order-event-metrics'),
+    path('businesses/<int:business_user_id>/revenue/', BusinessRevenueView.as_view(), name='business-revenue'),
 ]
\ No newline at end of file
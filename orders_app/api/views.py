@@ -6,24 +6,60 @@ Includes permission handling for customer creation and business-side status upda
 """
 from rest_framework.views import APIView
 from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from orders_app.models import Order
-from .serializers import OrderCombinedSerializer, OrderStatusUpdateSerializer, OrderSerializer
+from django.db.models import Q, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from datetime import timedelta
+from decimal import Decimal
+from rest_framework.exceptions import ValidationError, AuthenticationFailed
+from orders_app.models import Order, DailyRevenueRollup
+from orders_app.services import get_status_counts, bulk_transition
+from orders_app.archive import OrderHistory
+from .serializers import OrderCombinedSerializer, OrderStatusUpdateSerializer, OrderSerializer, OrderBulkStatusSerializer
 from .permissions import IsCustomerUser
 from django.contrib.auth.models import User
+from core.expand import ExpandQuerysetMixin
+from django_filters.rest_framework import DjangoFilterBackend
+from .pagination import OrdersCursorPagination
+from .filters import OrderFilter, ArchivedOrderFilter
+from .idempotency import IdempotentCreateMixin
+from .exceptions import OrderPreconditionFailed
+from orders_app.events import get_broker, OrderEventStream
+from orders_app.outbox import get_outbox_metrics
+from auth_app.api.authentication import CachedTokenAuthentication, get_token_lifetime
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from django.core.handlers.asgi import ASGIRequest
+from asgiref.sync import sync_to_async
 
 
-class OrderViewSet(viewsets.ModelViewSet):
+class OrderViewSet(IdempotentCreateMixin, ExpandQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing orders.
     Supports list, create, retrieve, and partial update (status).
     Includes permission handling to restrict creation to customers
     and status updates to business offer owners.
+    Related data can be embedded via `?expand=details,user,business_user`.
+    The list is cursor-paginated and can be filtered by status, creation date,
+    offer, and the user's role in the order. Archived orders are merged in
+    with `?include_archived=true`.
+    Order creation honours the Idempotency-Key header so client retries are safe.
     """
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
+    pagination_class = OrdersCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = OrderFilter
+    expand_related = {
+        'details': (['ordered_detail'], []),
+        'user': (['customer__userprofile'], []),
+        'business_user': (['business_user__userprofile'], []),
+    }
 
     def get_permissions(self):
         """
@@ -39,14 +75,39 @@ class OrderViewSet(viewsets.ModelViewSet):
         """
         Returns the queryset of orders accessible to the current user.
 
-        Includes orders created by the customer and those related to the user's offers.
+        Includes orders created by the customer and those related to the user's offers,
+        filtered on the indexed customer and business_user columns in a single predicate.
+        Orders carry a snapshot of the ordered detail, so no joins are needed.
+        Archived orders are only read when the list is requested with include_archived.
         """
         user = self.request.user
         if user.is_authenticated:
-            return Order.objects.filter(customer=user).distinct() | \
-                   Order.objects.filter(offer__user=user).distinct()
+            queryset = Order.objects.all()
+            if self.action == 'list' and self.include_archived():
+                queryset = OrderHistory()
+            queryset = queryset.filter(Q(customer=user) | Q(business_user=user))
+            return self.apply_expansions(queryset)
         return Order.objects.none()
 
+    def filter_queryset(self, queryset):
+        """
+        Applies the order filters to each table separately when archived orders are included,
+        since filter backends only operate on real querysets.
+        """
+        if not isinstance(queryset, OrderHistory):
+            return super().filter_queryset(queryset)
+        active = super().filter_queryset(queryset.active)
+        archived = ArchivedOrderFilter(
+            self.request.query_params, queryset=queryset.archived, request=self.request
+        ).qs
+        return OrderHistory(active, archived, queryset.ordering)
+
+    def include_archived(self):
+        """
+        Returns whether the client asked for archived orders via `?include_archived=true`.
+        """
+        return self.request.query_params.get('include_archived', '').lower() in ('true', '1')
+
     def get_serializer_class(self):
         """
         Returns the appropriate serializer class based on the current action.
@@ -60,59 +121,300 @@ class OrderViewSet(viewsets.ModelViewSet):
         'partial_update': OrderStatusUpdateSerializer,
     }
 
-    def perform_create(self, serializer):
+    def create(self, request, *args, **kwargs):
         """
-        Saves the order instance and assigns the authenticated user as the customer.
+        Handles creation of a new order and returns combined serialized data.
+
+        The order is inserted once with the authenticated user as the customer and
+        serialized once for the response. Requests carrying an Idempotency-Key header
+        are only executed once per key.
         """
-        order = serializer.save()
-        order.customer = self.request.user
-        order.save()
-        self._created_order = order
+        def create_order():
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            order = serializer.save()
+            combined_data = OrderCombinedSerializer(order, context=self.get_serializer_context()).data
+            return Response(combined_data, status=201)
 
-    def create(self, request, *args, **kwargs):
+        return self.with_idempotency(request, create_order)
+
+    def retrieve(self, request, *args, **kwargs):
         """
-        Handles creation of a new order and returns combined serialized data.
+        Returns a single order together with an ETag of its current version.
         """
-        response = super().create(request, *args, **kwargs)
-        combined_data = OrderCombinedSerializer(self._created_order).data
-        return Response(combined_data, status=201)
+        order = self.get_object()
+        serializer = self.get_serializer(order)
+        return Response(serializer.data, headers={'ETag': order.etag})
+
+    def check_if_match(self, request, order):
+        """
+        Rejects the request if its If-Match header names a different order version.
+
+        Raises:
+            OrderPreconditionFailed: If none of the given entity tags match.
+        """
+        if_match = request.headers.get('If-Match')
+        if if_match is None:
+            return
+        tags = {tag.strip() for tag in if_match.split(',')}
+        if '*' not in tags and order.etag not in tags:
+            raise OrderPreconditionFailed()
 
     def partial_update(self, request, *args, **kwargs):
         """
         Allows a business user to update the status of an order.
 
-        Ensures only the offer owner is authorized to change the status.
+        Ensures only the offer owner is authorized to change the status. Honours If-Match
+        (412 on mismatch) and rejects concurrent modifications with 409 instead of
+        overwriting them.
         """
         order = self.get_object()
-        if order.offer.user != request.user:
+        if order.business_user_id != request.user.id:
             return Response({'detail': 'Nur der Anbieter kann den Status aktualisieren.'}, status=403)
+        self.check_if_match(request, order)
         serializer = OrderStatusUpdateSerializer(order, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         combined_serializer = OrderCombinedSerializer(order)
-        return Response(combined_serializer.data, status=200)
+        return Response(combined_serializer.data, status=200, headers={'ETag': order.etag})
+
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """
+        Allows a business user to change the status of many orders in one request.
 
+        Ownership is checked for all ids in one query and allowed transitions are applied
+        with a single UPDATE. Returns a result for every requested id.
+        """
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_transition(
+            request.user,
+            serializer.validated_data['ids'],
+            serializer.validated_data['status']
+        )
+        return Response({
+            'status': serializer.validated_data['status'],
+            'updated': sum(1 for result in results.values() if result == 'updated'),
+            'results': [{'id': pk, 'result': result} for pk, result in results.items()],
+        }, status=200)
 
-class OrderCountView(APIView):
+
+class BusinessOrderCountsMixin:
+    """
+    Shared lookup of the materialized order counters for a business user.
+    """
+
+    def get_counts(self, business_user_id):
+        """
+        Returns all status counts for the business user from the counter table.
+
+        The user table is only consulted when no counters exist, to tell a business
+        without orders apart from a user that does not exist.
+        """
+        counts = get_status_counts(business_user_id)
+        if counts is None:
+            get_object_or_404(User, pk=business_user_id)
+            counts = {status: 0 for status, _ in Order.STATUS_CHOICES}
+        return counts
+
+
+class OrderCountView(BusinessOrderCountsMixin, APIView):
     """
     API endpoint to retrieve the count of in-progress orders for a given business user.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, business_user_id):
-        user = get_object_or_404(User, pk=business_user_id)
-        count = Order.objects.filter(offer__user=user, status='in_progress').count()
-        return Response({'order_count': count}, status=200)
+        counts = self.get_counts(business_user_id)
+        return Response({'order_count': counts['in_progress']}, status=200)
 
 
-class CompletedOrderCountView(APIView):
+class CompletedOrderCountView(BusinessOrderCountsMixin, APIView):
     """
     API endpoint to retrieve the count of completed orders for a given business user.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, business_user_id):
-        user = get_object_or_404(User, pk=business_user_id)
-        count = Order.objects.filter(offer__user=user, status='completed').count()
-        return Response({'completed_order_count': count}, status=200)
-    
\ No newline at end of file
+        counts = self.get_counts(business_user_id)
+        return Response({'completed_order_count': counts['completed']}, status=200)
+
+
+class OrderStatsView(BusinessOrderCountsMixin, APIView):
+    """
+    API endpoint to retrieve the order counts for every status of a given business user.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        counts = self.get_counts(business_user_id)
+        return Response({
+            'business_user': business_user_id,
+            'counts': counts,
+            'total': sum(counts.values()),
+        }, status=200)
+
+
+class BusinessRevenueView(APIView):
+    """
+    API endpoint to retrieve the daily revenue of a business user between two dates.
+
+    Reads only the daily revenue rollups. Revenue counts every order that was not cancelled;
+    the per-status breakdown includes cancelled orders as well.
+    Only the business user may read their own revenue.
+    """
+    permission_classes = [IsAuthenticated]
+    default_range_days = 30
+    max_range_days = 366
+
+    def parse_day(self, request, name, default):
+        """
+        Parses a YYYY-MM-DD query parameter, falling back to the default if it is missing.
+        """
+        value = request.query_params.get(name)
+        if not value:
+            return default
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValidationError({name: 'Must be a date in the format YYYY-MM-DD.'})
+        return day
+
+    def get_date_range(self, request):
+        """
+        Returns the requested (from, to) range, defaulting to the last 30 days.
+        """
+        date_to = self.parse_day(request, 'to', timezone.localdate())
+        date_from = self.parse_day(request, 'from', date_to - timedelta(days=self.default_range_days - 1))
+        if date_from > date_to:
+            raise ValidationError({'from': "Must not be after 'to'."})
+        if (date_to - date_from).days >= self.max_range_days:
+            raise ValidationError({'from': f'The range can span at most {self.max_range_days} days.'})
+        return date_from, date_to
+
+    def get(self, request, business_user_id):
+        if request.user.id != business_user_id:
+            return Response({'detail': 'Nur der Anbieter kann seinen Umsatz einsehen.'}, status=403)
+        date_from, date_to = self.get_date_range(request)
+
+        rows = (
+            DailyRevenueRollup.objects
+            .filter(business_user_id=business_user_id, day__range=(date_from, date_to))
+            .order_by('day')
+            .values('day', 'status')
+            .annotate(order_count=Sum('order_count'), units=Sum('units'), revenue=Sum('revenue'))
+        )
+
+        days = {}
+        totals = {'order_count': 0, 'units': 0, 'revenue': Decimal('0.00')}
+        for row in rows:
+            day = days.setdefault(row['day'], {
+                'date': row['day'].isoformat(), 'order_count': 0, 'units': 0,
+                'revenue': Decimal('0.00'), 'by_status': {},
+            })
+            day['by_status'][row['status']] = {
+                'order_count': row['order_count'],
+                'units': row['units'],
+                'revenue': str(row['revenue']),
+            }
+            if row['status'] != 'cancelled':
+                for bucket in (day, totals):
+                    bucket['order_count'] += row['order_count']
+                    bucket['units'] += row['units']
+                    bucket['revenue'] += row['revenue']
+
+        for bucket in (*days.values(), totals):
+            bucket['revenue'] = str(bucket['revenue'])
+        return Response({
+            'business_user': business_user_id,
+            'from': date_from.isoformat(),
+            'to': date_to.isoformat(),
+            'days': list(days.values()),
+            'totals': totals,
+        }, status=200)
+
+
+class OrderOutboxMetricsView(APIView):
+    """
+    API endpoint exposing the backlog, dispatch lag, and throughput of the order event outbox.
+
+    Lag and throughput are measured over the last `window` seconds (default 300).
+    Only staff users may read the metrics.
+    """
+    permission_classes = [IsAdminUser]
+    default_window_seconds = 300
+    max_window_seconds = 86400
+
+    def get(self, request):
+        try:
+            window = int(request.query_params.get('window', self.default_window_seconds))
+        except ValueError:
+            window = 0
+        if not 0 < window <= self.max_window_seconds:
+            raise ValidationError({'window': f'Must be between 1 and {self.max_window_seconds} seconds.'})
+        return Response(get_outbox_metrics(timedelta(seconds=window)), status=200)
+
+
+class OrderEventStreamView(View):
+    """
+    Server-sent events stream of order creations and status changes for the authenticated user.
+
+    Both the customer and the business user of an order receive its events, so dashboards
+    no longer need to poll the order list. The token is read from the Authorization header
+    or, because EventSource cannot set headers, from the `token` query parameter. The token
+    is checked again on every heartbeat, and the stream ends when it is revoked or expires.
+    The stream is only served through the ASGI application in core/asgi.py: under WSGI
+    every open stream would hold a worker forever, so such requests get a 501 instead.
+    """
+
+    def get_token_key(self, request):
+        """
+        Returns the token key from the Authorization header or the `token` query parameter.
+        """
+        header = request.headers.get('Authorization', '')
+        scheme, _, key = header.partition(' ')
+        if scheme.lower() != 'token' or not key:
+            key = request.GET.get('token', '')
+        return key.strip()
+
+    @sync_to_async
+    def authenticate(self, key):
+        """
+        Returns the user owning the token and the token's expiry timestamp, or (None, None).
+        """
+        if not key:
+            return None, None
+        try:
+            user, token = CachedTokenAuthentication().authenticate_credentials(key)
+        except AuthenticationFailed:
+            return None, None
+        expires_at = getattr(token, 'expires_at', None) or token.created + get_token_lifetime()
+        return user, expires_at.timestamp()
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {'detail': 'Der Event-Stream ist nur über den ASGI-Server (core.asgi:application) verfügbar.'},
+                status=501,
+            )
+        key = self.get_token_key(request)
+        user, expires_at = await self.authenticate(key)
+        if user is None:
+            return JsonResponse({'detail': 'Ungültiges oder fehlendes Token.'}, status=401)
+
+        async def validate():
+            return (await self.authenticate(key))[0] is not None
+
+        stream = OrderEventStream(
+            get_broker().subscribe(user.id),
+            heartbeat=getattr(settings, 'ORDER_EVENT_HEARTBEAT_SECONDS', 15),
+            validate=validate,
+            expires_at=expires_at,
+        )
+        response = StreamingHttpResponse(stream, content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
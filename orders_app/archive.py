@@ -0,0 +1,79 @@
+"""
+Read access to active and archived orders as one ordered result set.
+"""
+from functools import cmp_to_key
+from orders_app.models import Order, ArchivedOrder
+
+
+class OrderHistory:
+    """
+    Read-only, queryset-like view over the order and archived order tables.
+
+    Supports the part of the QuerySet API used by the order views and cursor pagination
+    (filter, exclude, order_by, select_related, prefetch_related, slicing). Every call is
+    applied to both tables; slices fetch at most `stop` rows from each and merge them.
+    """
+
+    def __init__(self, active=None, archived=None, ordering=None):
+        self.active = Order.objects.all() if active is None else active
+        self.archived = ArchivedOrder.objects.all() if archived is None else archived
+        self.ordering = tuple(ordering or Order._meta.ordering)
+
+    def _apply(self, method, *args, **kwargs):
+        return OrderHistory(
+            getattr(self.active, method)(*args, **kwargs),
+            getattr(self.archived, method)(*args, **kwargs),
+            self.ordering,
+        )
+
+    def all(self):
+        return self._apply('all')
+
+    def filter(self, *args, **kwargs):
+        return self._apply('filter', *args, **kwargs)
+
+    def exclude(self, *args, **kwargs):
+        return self._apply('exclude', *args, **kwargs)
+
+    def distinct(self, *args):
+        return self._apply('distinct', *args)
+
+    def select_related(self, *fields):
+        return self._apply('select_related', *fields)
+
+    def prefetch_related(self, *lookups):
+        return self._apply('prefetch_related', *lookups)
+
+    def order_by(self, *fields):
+        history = self._apply('order_by', *fields)
+        history.ordering = fields
+        return history
+
+    def count(self):
+        return self.active.count() + self.archived.count()
+
+    def exists(self):
+        return self.active.exists() or self.archived.exists()
+
+    def _compare(self, left, right):
+        for field in self.ordering:
+            name = field.lstrip('-')
+            a, b = getattr(left, name), getattr(right, name)
+            if a != b:
+                result = -1 if a < b else 1
+                return -result if field.startswith('-') else result
+        return 0
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+        stop = item.stop
+        rows = list(self.active[:stop]) + list(self.archived[:stop])
+        rows.sort(key=cmp_to_key(self._compare))
+        return rows[item]
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __len__(self):
+        return self.count()
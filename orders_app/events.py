@@ -0,0 +1,326 @@
+"""
+Publish/subscribe plumbing for pushing order events to connected clients.
+
+Order writes publish events after their transaction commits, and the server-sent
+events stream subscribes per user. The broker class is configurable via
+ORDER_EVENT_BROKER: LocalOrderEventBroker only reaches subscribers in the current
+process, while OutboxOrderEventBroker reads the order outbox table and therefore
+reaches the ASGI process serving the streams no matter which process wrote the order.
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connection, transaction
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+class OrderEventSubscription:
+    """
+    A single subscriber's queue of pending events.
+
+    Events are handed over from any thread into the event loop the subscriber was created on.
+    If the subscriber falls behind by more than max_queue_size events, further events are
+    dropped rather than buffered without limit.
+    """
+
+    def __init__(self, broker, user_id, max_queue_size):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+
+    def deliver(self, event):
+        """
+        Schedules the event to be put on the queue from the subscriber's event loop.
+        """
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The subscriber's loop has already shut down.
+            self.close()
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def get(self):
+        """
+        Waits for the next event.
+        """
+        return await self.queue.get()
+
+    def close(self):
+        """
+        Detaches the subscription from its broker.
+        """
+        self.broker.unsubscribe(self)
+
+
+class LocalOrderEventBroker:
+    """
+    In-process broker delivering order events to the subscribers of the current worker.
+    """
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        """
+        Registers a subscription for the user. Must be called from a running event loop.
+        """
+        subscription = OrderEventSubscription(self, user_id, self.max_queue_size)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Removes a subscription; closing an already removed subscription is a no-op.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def subscriber_count(self, user_id=None):
+        """
+        Returns the number of open subscriptions, optionally for a single user.
+        """
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscriptions.get(user_id, ()))
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def publish(self, user_ids, event):
+        """
+        Delivers the event to every subscription of the given users. Safe to call from any thread.
+        """
+        with self._lock:
+            subscriptions = [
+                subscription
+                for user_id in set(user_ids)
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+
+class OutboxOrderEventBroker(LocalOrderEventBroker):
+    """
+    Broker delivering the events of every process by polling the order outbox.
+
+    Order writes record their events in OrderOutboxEvent inside the order transaction,
+    so the table already is a channel shared by the WSGI workers and the ASGI process.
+    While this process has subscribers, a background thread reads new outbox rows every
+    ORDER_EVENT_POLL_SECONDS and fans them out to the local subscribers; publish() is a
+    no-op because locally written events arrive the same way.
+
+    The last `lookback` ids are read again on every poll, so rows committed out of id
+    order are still delivered once.
+    """
+
+    def __init__(self, max_queue_size=100, poll_interval=None, lookback=100):
+        super().__init__(max_queue_size)
+        if poll_interval is None:
+            poll_interval = getattr(settings, 'ORDER_EVENT_POLL_SECONDS', 1)
+        self.poll_interval = poll_interval
+        self.lookback = lookback
+        self.cursor = None
+        self.delivered = set()
+        self._poller = None
+        self._poller_lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        subscription = super().subscribe(user_id)
+        self.start_poller()
+        return subscription
+
+    def publish(self, user_ids, event):
+        """
+        Ignores direct publishes; every event is delivered from the outbox.
+        """
+
+    def start_poller(self):
+        """
+        Starts the polling thread unless it is already running.
+        """
+        with self._poller_lock:
+            if self._poller is None:
+                self._poller = threading.Thread(target=self.poll, name='order-event-poller', daemon=True)
+                self._poller.start()
+
+    def poll(self):
+        """
+        Delivers new outbox events until the last subscriber of this process is gone.
+        """
+        try:
+            while self.subscriber_count():
+                close_old_connections()
+                self.deliver_new_events()
+                time.sleep(self.poll_interval)
+        finally:
+            connection.close()
+            with self._poller_lock:
+                self._poller = None
+            if self.subscriber_count():
+                self.start_poller()
+
+    def deliver_new_events(self):
+        """
+        Fans the outbox events written since the last poll out to the local subscribers.
+        """
+        from orders_app.models import OrderOutboxEvent
+
+        events = OrderOutboxEvent.objects.order_by('id')
+        if self.cursor is None:
+            self.cursor = events.values_list('id', flat=True).last() or 0
+            return
+        rows = list(events.filter(id__gt=self.cursor - self.lookback).values_list('id', 'payload')[:1000])
+        for event_id, payload in rows:
+            if event_id in self.delivered:
+                continue
+            self.delivered.add(event_id)
+            super().publish((payload['customer_user'], payload['business_user']), payload)
+        if rows:
+            self.cursor = max(self.cursor, rows[-1][0])
+        self.delivered = {event_id for event_id in self.delivered if event_id > self.cursor - self.lookback}
+
+
+class OrderEventStream:
+    """
+    Async iterable rendering a subscription as a server-sent events body.
+
+    Sends a comment line whenever no event arrived for heartbeat seconds, so proxies keep
+    idle connections open. At most every heartbeat seconds the stream awaits `validate`
+    and ends once it returns False, e.g. because the token was revoked or its user
+    deactivated; it also ends when `expires_at` (a timestamp) passes. The subscription is
+    released when the iteration stops or the response is closed, whichever happens first.
+    """
+
+    def __init__(self, subscription, heartbeat, validate=None, expires_at=None):
+        self.subscription = subscription
+        self.heartbeat = heartbeat
+        self.validate = validate
+        self.expires_at = expires_at
+
+    def __aiter__(self):
+        return self.events()
+
+    async def is_valid(self):
+        """
+        Returns whether the stream may continue.
+        """
+        if self.expires_at is not None and self.expires_at <= time.time():
+            return False
+        return self.validate is None or await self.validate()
+
+    async def events(self):
+        try:
+            yield 'retry: 5000\n\n'
+            checked_at = time.monotonic()
+            while True:
+                timeout = self.heartbeat
+                if self.expires_at is not None:
+                    timeout = max(min(timeout, self.expires_at - time.time()), 0)
+                try:
+                    event = await asyncio.wait_for(self.subscription.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    event = None
+                if event is None or time.monotonic() - checked_at >= self.heartbeat:
+                    if not await self.is_valid():
+                        return
+                    checked_at = time.monotonic()
+                if event is None:
+                    yield ': keep-alive\n\n'
+                else:
+                    yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Releases the subscription.
+        """
+        self.subscription.close()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """
+    Returns the process-wide broker configured via ORDER_EVENT_BROKER.
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                broker_class = import_string(getattr(
+                    settings, 'ORDER_EVENT_BROKER', 'orders_app.events.LocalOrderEventBroker'
+                ))
+                _broker = broker_class(max_queue_size=getattr(settings, 'ORDER_EVENT_QUEUE_SIZE', 100))
+    return _broker
+
+
+@receiver(setting_changed)
+def reset_broker(setting, **kwargs):
+    """
+    Rebuilds the broker when one of its settings changes, e.g. in tests.
+    """
+    global _broker
+    if setting.startswith('ORDER_EVENT_'):
+        _broker = None
+
+
+def build_order_event(order, old_status, new_status):
+    """
+    Builds the event payload for an order that was created or changed status.
+    """
+    return {
+        'type': 'order.created' if old_status is None else 'order.status_changed',
+        'order_id': order.id,
+        'status': new_status,
+        'previous_status': old_status,
+        'customer_user': order.customer_id,
+        'business_user': order.business_user_id,
+        'occurred_at': timezone.now().isoformat(),
+    }
+
+
+def publish_order_events(changes):
+    """
+    Publishes an event to both parties of every created or re-statused order
+    once the surrounding transaction commits. Deleted orders are not published.
+
+    Args:
+        changes (iterable): Tuples of (order, old_status, new_status).
+    """
+    events = [
+        ((order.customer_id, order.business_user_id), build_order_event(order, old_status, new_status))
+        for order, old_status, new_status in changes
+        if new_status is not None and old_status != new_status
+    ]
+    if not events:
+        return
+
+    def publish():
+        broker = get_broker()
+        for user_ids, event in events:
+            broker.publish(user_ids, event)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,66 @@
+"""
+Management command that moves closed orders into the archive table.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from orders_app.models import Order, ArchivedOrder
+from orders_app.services import keep_deleted_orders_in_bookkeeping
+
+
+class Command(BaseCommand):
+    """
+    Moves completed and cancelled orders last updated before the cutoff into ArchivedOrder.
+
+    Each batch is copied and deleted in its own transaction, so the command can be
+    interrupted and rerun at any time and simply continues with the remaining orders.
+    Status counters are left untouched because they include archived orders.
+    """
+    help = "Moves closed orders older than the cutoff into the archive table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=getattr(settings, 'ORDER_ARCHIVE_AFTER_DAYS', 365),
+            help='Archive orders closed more than this many days ago.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of orders moved per transaction.',
+        )
+
+    def archive_batch(self, cutoff, batch_size):
+        """
+        Moves one batch of closed orders and returns how many were moved.
+        """
+        with transaction.atomic():
+            orders = list(
+                Order.objects.select_for_update()
+                .filter(status__in=ArchivedOrder.CLOSED_STATUSES, updated_at__lt=cutoff)
+                .order_by('pk')[:batch_size]
+            )
+            if not orders:
+                return 0
+            ArchivedOrder.objects.bulk_create(
+                [ArchivedOrder.from_order(order) for order in orders],
+                ignore_conflicts=True,
+            )
+            with keep_deleted_orders_in_bookkeeping():
+                Order.objects.filter(pk__in=[order.pk for order in orders]).delete()
+        return len(orders)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+        total = 0
+        while True:
+            moved = self.archive_batch(cutoff, options['batch_size'])
+            if not moved:
+                break
+            total += moved
+            self.stdout.write(f"Archived {total} order(s)...")
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} order(s) closed before {cutoff:%Y-%m-%d}."))
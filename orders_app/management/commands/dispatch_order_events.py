@@ -0,0 +1,61 @@
+"""
+Management command that delivers pending order outbox events.
+"""
+import time
+from django.core.management.base import BaseCommand
+from orders_app.outbox import dispatch_batch
+
+
+class Command(BaseCommand):
+    """
+    Delivers pending OrderOutboxEvent rows in batches using a thread pool.
+
+    Without --loop the command drains the due events once and exits, which suits a cron job.
+    With --loop it keeps polling and sleeps for --interval seconds whenever nothing is due.
+    Several instances can run side by side because each batch is claimed with a lease.
+    """
+    help = "Delivers pending order outbox events to the configured handlers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Number of events claimed per batch.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of threads delivering the events of a batch.',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling for new events instead of exiting once drained.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to sleep between polls when no event is due.',
+        )
+
+    def handle(self, *args, **options):
+        totals = {'dispatched': 0, 'retried': 0, 'failed': 0}
+        try:
+            while True:
+                summary = dispatch_batch(options['batch_size'], options['workers'])
+                for key, value in summary.items():
+                    totals[key] += value
+                if any(summary.values()):
+                    continue
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(
+            f"Dispatched {totals['dispatched']} event(s), "
+            f"scheduled {totals['retried']} retry(ies), {totals['failed']} failed permanently."
+        ))
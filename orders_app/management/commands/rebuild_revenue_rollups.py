@@ -0,0 +1,24 @@
+"""
+Management command that rebuilds the daily revenue rollups from the order tables.
+"""
+from django.core.management.base import BaseCommand
+from orders_app.services import rebuild_revenue_rollups
+
+
+class Command(BaseCommand):
+    """
+    Recomputes DailyRevenueRollup rows from active and archived orders,
+    either for every business user or for a single one.
+    """
+    help = "Rebuilds the daily revenue rollups from active and archived orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user',
+            type=int,
+            help='Only rebuild the rollups of this business user id.',
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_revenue_rollups(options.get('business_user'))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} revenue rollup row(s)."))
@@ -0,0 +1,70 @@
+"""
+Management command that detects and optionally repairs drift in the order status counters.
+"""
+from collections import Counter
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count
+from orders_app.models import Order, ArchivedOrder, OrderStatusCounter
+
+
+class Command(BaseCommand):
+    """
+    Compares every OrderStatusCounter with a COUNT over the active and archived orders.
+
+    Exits with an error if drift is found, so it can be used as a scheduled health check.
+    With --fix, drifted counters are overwritten with the actual counts.
+    """
+    help = "Detects drift between order status counters and the order table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Overwrite drifted counters with the actual counts.',
+        )
+
+    def get_actual_counts(self):
+        """
+        Returns the real number of active and archived orders per (business_user_id, status).
+        """
+        actual = Counter()
+        for model in (Order, ArchivedOrder):
+            rows = model.objects.order_by().values('business_user', 'status').annotate(total=Count('id'))
+            actual.update({(row['business_user'], row['status']): row['total'] for row in rows})
+        return actual
+
+    def handle(self, *args, **options):
+        actual = self.get_actual_counts()
+        stored = {
+            (business_user_id, status): count
+            for business_user_id, status, count
+            in OrderStatusCounter.objects.values_list('business_user_id', 'status', 'count')
+        }
+
+        drift = {
+            key: (stored.get(key, 0), actual.get(key, 0))
+            for key in set(actual) | set(stored)
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("All order status counters are in sync."))
+            return
+
+        for (business_user_id, status), (stored_count, actual_count) in sorted(drift.items()):
+            self.stdout.write(
+                f"business_user={business_user_id} status={status}: "
+                f"counter={stored_count} actual={actual_count}"
+            )
+
+        if not options['fix']:
+            raise CommandError(f"{len(drift)} drifted counter(s) found. Rerun with --fix to repair them.")
+
+        with transaction.atomic():
+            for (business_user_id, status), (_, actual_count) in drift.items():
+                OrderStatusCounter.objects.update_or_create(
+                    business_user_id=business_user_id,
+                    status=status,
+                    defaults={'count': actual_count},
+                )
+        self.stdout.write(self.style.SUCCESS(f"Repaired {len(drift)} counter(s)."))
@@ -0,0 +1,36 @@
+"""
+Management command that deletes expired order idempotency keys.
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from orders_app.models import OrderIdempotencyKey
+
+
+class Command(BaseCommand):
+    """
+    Deletes expired OrderIdempotencyKey rows in batches using the expires_at index,
+    so the sweep never holds a long write lock on the table.
+    """
+    help = "Deletes expired order idempotency keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of keys deleted per statement.',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        total = 0
+        while True:
+            ids = list(
+                OrderIdempotencyKey.objects.filter(expires_at__lte=now)
+                .order_by('expires_at')
+                .values_list('id', flat=True)[:options['batch_size']]
+            )
+            if not ids:
+                break
+            total += OrderIdempotencyKey.objects.filter(id__in=ids).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f"Deleted {total} expired idempotency key(s)."))
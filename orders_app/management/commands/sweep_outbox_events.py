@@ -0,0 +1,38 @@
+"""
+Management command that deletes dispatched order outbox events past their retention.
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from orders_app.outbox import purge_dispatched_events
+
+
+class Command(BaseCommand):
+    """
+    Deletes OrderOutboxEvent rows dispatched more than --older-than-days ago in batches.
+
+    Dispatched events are only kept for inspection and the dispatch metrics, so without
+    this sweep the table would grow with every order change. Pending and failed events
+    are never deleted.
+    """
+    help = "Deletes dispatched order outbox events older than the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=getattr(settings, 'ORDER_OUTBOX_RETENTION_DAYS', 7),
+            help='Delete events dispatched more than this many days ago.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of events deleted per statement.',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+        total = purge_dispatched_events(cutoff, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {total} dispatched outbox event(s)."))
@@ -0,0 +1,38 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_business_user(apps, schema_editor):
+    """
+    Copies the offer owner onto every existing order in a single UPDATE.
+    """
+    Order = apps.get_model('orders_app', 'Order')
+    Offer = apps.get_model('offers_app', 'Offer')
+    Order.objects.filter(business_user__isnull=True).update(
+        business_user=Subquery(Offer.objects.filter(pk=OuterRef('offer')).values('user')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0009_remove_offer_file_remove_offerdetail_file_and_more'),
+        ('orders_app', '0004_remove_order_offer_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='business_user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='received_orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_business_user, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='order',
+            name='business_user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='received_orders', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.3 on 2026-10-19 10:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    Creates the status counters from the existing orders.
+    """
+    Order = apps.get_model('orders_app', 'Order')
+    OrderStatusCounter = apps.get_model('orders_app', 'OrderStatusCounter')
+    rows = Order.objects.order_by().values('business_user', 'status').annotate(total=Count('id'))
+    OrderStatusCounter.objects.bulk_create([
+        OrderStatusCounter(business_user_id=row['business_user'], status=row['status'], count=row['total'])
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0006_order_list_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('in_progress', 'in_Progress')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_status_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('business_user', 'status')},
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.3 on 2026-10-19 10:22
+
+from django.db import migrations, models
+
+SNAPSHOT_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'features', 'offer_type']
+BATCH_SIZE = 500
+
+
+def backfill_snapshots(apps, schema_editor):
+    """
+    Copies the ordered detail fields onto existing orders in primary-key batches.
+    """
+    Order = apps.get_model('orders_app', 'Order')
+    last_id = 0
+    while True:
+        orders = list(
+            Order.objects.filter(pk__gt=last_id)
+            .select_related('ordered_detail')
+            .order_by('pk')[:BATCH_SIZE]
+        )
+        if not orders:
+            break
+        for order in orders:
+            for field in SNAPSHOT_FIELDS:
+                setattr(order, field, getattr(order.ordered_detail, field))
+        Order.objects.bulk_update(orders, SNAPSHOT_FIELDS)
+        last_id = orders[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0009_order_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='delivery_time_in_days',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='features',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='offer_type',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='revisions',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='title',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.3 on 2026-10-19 10:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0009_remove_offer_file_remove_offerdetail_file_and_more'),
+        ('orders_app', '0010_order_detail_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('in_progress', 'in_Progress')], max_length=20)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('quantity', models.PositiveIntegerField(default=1)),
+                ('price_at_order', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('title', models.CharField(blank=True, default='', max_length=255)),
+                ('revisions', models.IntegerField(default=0)),
+                ('delivery_time_in_days', models.PositiveIntegerField(default=0)),
+                ('features', models.JSONField(blank=True, default=list)),
+                ('offer_type', models.CharField(blank=True, default='', max_length=50)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived Order',
+                'verbose_name_plural': 'Archived Orders',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'updated_at'], name='order_status_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedorder',
+            name='business_user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='received_archived_orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='archivedorder',
+            name='customer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='archivedorder',
+            name='offer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders', to='offers_app.offer'),
+        ),
+        migrations.AddField(
+            model_name='archivedorder',
+            name='ordered_detail',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders_for_detail', to='offers_app.offerdetail'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedorder',
+            index=models.Index(fields=['customer', '-created_at'], name='archived_customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedorder',
+            index=models.Index(fields=['business_user', '-created_at'], name='archived_business_created_idx'),
+        ),
+    ]
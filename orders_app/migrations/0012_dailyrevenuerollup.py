@@ -0,0 +1,70 @@
+# Generated by Django 5.2.3 on 2026-10-19 10:26
+
+import django.db.models.deletion
+from django.conf import settings
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    """
+    Creates the daily revenue rollups from the existing active and archived orders.
+    """
+    DailyRevenueRollup = apps.get_model('orders_app', 'DailyRevenueRollup')
+    line_total = ExpressionWrapper(
+        F('price_at_order') * F('quantity'), output_field=DecimalField(max_digits=14, decimal_places=2)
+    )
+    totals = {}
+    for model_name in ('Order', 'ArchivedOrder'):
+        rows = (
+            apps.get_model('orders_app', model_name).objects
+            .annotate(day=TruncDate('created_at'))
+            .order_by()
+            .values('business_user', 'offer', 'day', 'status')
+            .annotate(order_count=Count('id'), units=Sum('quantity'), revenue=Sum(line_total))
+        )
+        for row in rows:
+            key = (row['business_user'], row['offer'], row['day'], row['status'])
+            current = totals.setdefault(key, [0, 0, Decimal('0')])
+            current[0] += row['order_count']
+            current[1] += row['units']
+            current[2] += row['revenue']
+    DailyRevenueRollup.objects.bulk_create([
+        DailyRevenueRollup(
+            business_user_id=business, offer_id=offer, day=day, status=status,
+            order_count=count, units=units, revenue=revenue,
+        )
+        for (business, offer, day, status), (count, units, revenue) in totals.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0009_remove_offer_file_remove_offerdetail_file_and_more'),
+        ('orders_app', '0011_archivedorder'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRevenueRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('in_progress', 'in_Progress')], max_length=20)),
+                ('order_count', models.IntegerField(default=0)),
+                ('units', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_rollups', to=settings.AUTH_USER_MODEL)),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_rollups', to='offers_app.offer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['business_user', 'day'], name='rollup_business_day_idx')],
+                'unique_together': {('business_user', 'offer', 'day', 'status')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,9 @@
 # orders_app/models.py (assuming this is the file)
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
 from offers_app.models import Offer, OfferDetail
 
 
@@ -8,6 +11,11 @@ class Order(models.Model):
     """
     Represents a customer order for a specific offer and its detail.
     Tracks status, quantity, price at order time, and timestamps.
+    The offer owner is stored as business_user so orders can be filtered
+    by either party without joining the offer.
+    The version is incremented on every update and backs optimistic concurrency control.
+    The purchased detail fields are copied onto the order when it is created, so later
+    edits of the offer detail do not change historic orders.
     """
     customer = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name='orders'
@@ -18,6 +26,9 @@ class Order(models.Model):
     ordered_detail = models.ForeignKey(
         OfferDetail, on_delete=models.CASCADE, related_name='orders_for_detail'
     )
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='received_orders'
+    )
 
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -32,19 +43,43 @@ class Order(models.Model):
         default='pending'
     )
 
+    STATUS_TRANSITIONS = {
+        'pending': {'accepted', 'in_progress', 'cancelled'},
+        'accepted': {'in_progress', 'cancelled'},
+        'in_progress': {'completed', 'cancelled'},
+        'completed': set(),
+        'cancelled': set(),
+    }
+    version = models.PositiveIntegerField(default=1)
+
     quantity = models.PositiveIntegerField(default=1)
     price_at_order = models.DecimalField(max_digits=10, decimal_places=2)
+
+    title = models.CharField(max_length=255, blank=True, default='')
+    revisions = models.IntegerField(default=0)
+    delivery_time_in_days = models.PositiveIntegerField(default=0)
+    features = models.JSONField(default=list, blank=True)
+    offer_type = models.CharField(max_length=50, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """
         Meta options for the Order model.
-        Defines verbose names and default ordering.
+        Defines verbose names, default ordering, and the composite indexes
+        backing the order list filters and cursor pagination.
         """
         verbose_name = "Order"
         verbose_name_plural = "Orders"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer', '-created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', '-created_at'], name='order_business_created_idx'),
+            models.Index(fields=['customer', 'status', '-created_at'], name='order_customer_status_idx'),
+            models.Index(fields=['business_user', 'status', '-created_at'], name='order_business_status_idx'),
+            models.Index(fields=['offer', '-created_at'], name='order_offer_created_idx'),
+            models.Index(fields=['status', 'updated_at'], name='order_status_updated_idx'),
+        ]
 
     def __str__(self):
         """
@@ -56,10 +91,295 @@ class Order(models.Model):
             f"(Detail: {self.ordered_detail.title}) by {self.customer.username}"
         )
 
+    _loaded_status = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the status the order was loaded with so status transitions
+        can be detected on save.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    SNAPSHOT_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'features', 'offer_type']
+
+    def snapshot_ordered_detail(self):
+        """
+        Copies the purchased fields of the ordered detail onto the order.
+        """
+        for field in self.SNAPSHOT_FIELDS:
+            setattr(self, field, getattr(self.ordered_detail, field))
+
+    def save(self, *args, **kwargs):
+        """
+        Fills in business_user from the offer, snapshots the ordered detail on creation,
+        and saves the order together with its status bookkeeping in a single transaction.
+        """
+        from orders_app.services import apply_status_changes
+
+        if self.business_user_id is None:
+            self.business_user_id = self.offer.user_id
+        adding = self._state.adding
+        if adding:
+            self.snapshot_ordered_detail()
+        if not adding and kwargs.get('update_fields') is None:
+            self.version += 1
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding or self._loaded_status is not None:
+                previous = None if adding else self._loaded_status
+                apply_status_changes([(self, previous, self.status)])
+        self._loaded_status = self.status
+
+    @property
+    def etag(self):
+        """
+        Returns the entity tag identifying the current version of the order.
+        """
+        return f'"{self.version}"'
+
+    def can_transition_to(self, status):
+        """
+        Returns whether the order may move from its current status to the given one.
+        Keeping the current status is always allowed.
+        """
+        return status == self.status or status in self.STATUS_TRANSITIONS.get(self.status, ())
+
+    def transition_to(self, status):
+        """
+        Moves the order to a new status with a conditional UPDATE on the loaded version.
+
+        Returns False without writing anything if the order was changed concurrently.
+        """
+        from orders_app.services import apply_status_changes
+
+        now = timezone.now()
+        with transaction.atomic():
+            updated = Order.objects.filter(pk=self.pk, version=self.version).update(
+                status=status, version=F('version') + 1, updated_at=now
+            )
+            if not updated:
+                return False
+            apply_status_changes([(self, self.status, status)])
+
+        self.status = status
+        self.version += 1
+        self.updated_at = now
+        self._loaded_status = status
+        return True
+
     def get_total_price(self):
         """
         Calculates and returns the total price of the order based on
         the price at order time and quantity.
         """
         return self.price_at_order * self.quantity
-    
\ No newline at end of file
+    
+
+
+class ArchivedOrder(models.Model):
+    """
+    Cold storage for closed orders moved out of the order table by archive_orders.
+
+    Keeps the original order id and all order columns, so archived orders can be
+    served alongside active ones when a client asks for its full history.
+    """
+    CLOSED_STATUSES = ['completed', 'cancelled']
+
+    id = models.BigIntegerField(primary_key=True)
+    customer = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='archived_orders'
+    )
+    offer = models.ForeignKey(
+        Offer, on_delete=models.CASCADE, related_name='archived_orders'
+    )
+    ordered_detail = models.ForeignKey(
+        OfferDetail, on_delete=models.CASCADE, related_name='archived_orders_for_detail'
+    )
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='received_archived_orders'
+    )
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    version = models.PositiveIntegerField(default=1)
+    quantity = models.PositiveIntegerField(default=1)
+    price_at_order = models.DecimalField(max_digits=10, decimal_places=2)
+    title = models.CharField(max_length=255, blank=True, default='')
+    revisions = models.IntegerField(default=0)
+    delivery_time_in_days = models.PositiveIntegerField(default=0)
+    features = models.JSONField(default=list, blank=True)
+    offer_type = models.CharField(max_length=50, blank=True, default='')
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    ARCHIVED_FIELDS = [
+        'id', 'customer_id', 'offer_id', 'ordered_detail_id', 'business_user_id', 'status',
+        'version', 'quantity', 'price_at_order', 'title', 'revisions', 'delivery_time_in_days',
+        'features', 'offer_type', 'created_at', 'updated_at',
+    ]
+
+    class Meta:
+        """
+        Meta options for the ArchivedOrder model.
+        Mirrors the order list ordering and visibility indexes.
+        """
+        verbose_name = "Archived Order"
+        verbose_name_plural = "Archived Orders"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer', '-created_at'], name='archived_customer_created_idx'),
+            models.Index(fields=['business_user', '-created_at'], name='archived_business_created_idx'),
+        ]
+
+    @classmethod
+    def from_order(cls, order):
+        """
+        Builds an unsaved archive row carrying every column of the given order.
+        """
+        return cls(**{field: getattr(order, field) for field in cls.ARCHIVED_FIELDS})
+
+    def __str__(self):
+        """
+        Returns a string representation of the archived order.
+        """
+        return f"Archived order {self.id} ({self.status})"
+
+
+class OrderStatusCounter(models.Model):
+    """
+    Materialized number of orders per business user and status.
+
+    Kept in sync by Order.save and the order delete signals so dashboard counts are a row lookup
+    instead of a COUNT over the order table.
+    """
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='order_status_counters'
+    )
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        """
+        Meta options for the OrderStatusCounter model.
+        Ensures one counter row per business user and status.
+        """
+        unique_together = ('business_user', 'status')
+
+    def __str__(self):
+        """
+        Returns a string representation of the counter.
+        """
+        return f"{self.business_user_id}/{self.status}: {self.count}"
+
+
+class OrderIdempotencyKey(models.Model):
+    """
+    Stores the first response to an order creation request sent with an Idempotency-Key header.
+
+    Retries with the same key replay the stored response instead of creating another order.
+    Rows expire after ORDER_IDEMPOTENCY_KEY_TTL and are removed by sweep_idempotency_keys.
+    """
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='order_idempotency_keys'
+    )
+    key = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)
+    response_status = models.PositiveSmallIntegerField()
+    response_body = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        """
+        Meta options for the OrderIdempotencyKey model.
+        Keys are unique per user.
+        """
+        unique_together = ('user', 'key')
+
+    def __str__(self):
+        """
+        Returns a string representation of the idempotency key.
+        """
+        return f"{self.user_id}/{self.key}"
+
+
+class DailyRevenueRollup(models.Model):
+    """
+    Daily order totals per business user, offer, and status.
+
+    Kept in sync by the order write paths and rebuilt by rebuild_revenue_rollups,
+    so revenue reports never aggregate over the order tables.
+    """
+    business_user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='revenue_rollups'
+    )
+    offer = models.ForeignKey(
+        Offer, on_delete=models.CASCADE, related_name='revenue_rollups'
+    )
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    order_count = models.IntegerField(default=0)
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        """
+        Meta options for the DailyRevenueRollup model.
+        Ensures one row per business user, offer, day, and status, and indexes
+        the business user and day for date range reports.
+        """
+        unique_together = ('business_user', 'offer', 'day', 'status')
+        indexes = [
+            models.Index(fields=['business_user', 'day'], name='rollup_business_day_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Returns a string representation of the rollup row.
+        """
+        return f"{self.business_user_id}/{self.offer_id} {self.day} {self.status}: {self.revenue}"
+
+
+class OrderOutboxEvent(models.Model):
+    """
+    Order event written in the same transaction as the order change it describes.
+
+    dispatch_order_events delivers pending events to the configured handlers outside
+    the request cycle and retries failed deliveries with exponential backoff.
+    The order id is stored without a foreign key, so events outlive archived or deleted orders.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('dispatched', 'Dispatched'),
+        ('failed', 'Failed'),
+    ]
+
+    event_type = models.CharField(max_length=50)
+    order_id = models.BigIntegerField()
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(default=timezone.now)
+    available_at = models.DateTimeField(default=timezone.now)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """
+        Meta options for the OrderOutboxEvent model.
+        Pending events are claimed in id order among those that are due.
+        """
+        verbose_name = "Order Outbox Event"
+        verbose_name_plural = "Order Outbox Events"
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='outbox_status_available_idx'),
+            models.Index(fields=['dispatched_at'], name='outbox_dispatched_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Returns a string representation of the outbox event.
+        """
+        return f"{self.event_type} for order {self.order_id} ({self.status})"
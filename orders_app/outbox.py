@@ -0,0 +1,209 @@
+"""
+Transactional outbox for order events.
+
+Order writes record an OrderOutboxEvent in their own transaction, and the
+dispatch_order_events command delivers the recorded events to the handlers
+listed in ORDER_OUTBOX_HANDLERS. Deliveries happen outside the request cycle,
+so slow handlers (emails, webhooks) never add latency to the order endpoints.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Max, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from orders_app.models import OrderOutboxEvent
+from orders_app.events import build_order_event
+
+logger = logging.getLogger(__name__)
+
+
+def record_outbox_events(changes):
+    """
+    Writes one outbox event per created or re-statused order with a single INSERT.
+
+    Must run inside the transaction that writes the orders.
+
+    Args:
+        changes (iterable): Tuples of (order, old_status, new_status).
+    """
+    events = []
+    for order, old_status, new_status in changes:
+        if new_status is None or old_status == new_status:
+            continue
+        payload = build_order_event(order, old_status, new_status)
+        events.append(OrderOutboxEvent(event_type=payload['type'], order_id=order.id, payload=payload))
+    if events:
+        OrderOutboxEvent.objects.bulk_create(events)
+
+
+def log_order_event(payload):
+    """
+    Default outbox handler that logs every delivered event.
+    """
+    logger.info("Order event %s for order %s", payload['type'], payload['order_id'])
+
+
+def get_handlers():
+    """
+    Returns the handler callables configured via ORDER_OUTBOX_HANDLERS.
+    """
+    return [
+        import_string(path)
+        for path in getattr(settings, 'ORDER_OUTBOX_HANDLERS', ['orders_app.outbox.log_order_event'])
+    ]
+
+
+def get_retry_delay(attempts):
+    """
+    Returns the exponential backoff before the next delivery attempt, capped at
+    ORDER_OUTBOX_RETRY_MAX_SECONDS.
+    """
+    base = getattr(settings, 'ORDER_OUTBOX_RETRY_BASE_SECONDS', 5)
+    cap = getattr(settings, 'ORDER_OUTBOX_RETRY_MAX_SECONDS', 3600)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), cap))
+
+
+def claim_batch(batch_size):
+    """
+    Claims up to batch_size due events by pushing their availability past the lease.
+
+    Concurrent dispatchers skip rows locked by each other on databases supporting
+    SKIP LOCKED, and never pick up an event whose lease has not expired.
+    """
+    now = timezone.now()
+    lease = timedelta(seconds=getattr(settings, 'ORDER_OUTBOX_LEASE_SECONDS', 60))
+    with transaction.atomic():
+        events = list(
+            OrderOutboxEvent.objects.select_for_update(skip_locked=True)
+            .filter(status='pending', available_at__lte=now)
+            .order_by('id')[:batch_size]
+        )
+        if events:
+            OrderOutboxEvent.objects.filter(id__in=[event.id for event in events]).update(
+                available_at=now + lease
+            )
+    return events
+
+
+def deliver(event, handlers):
+    """
+    Passes the event to every handler and returns the error message, or None on success.
+    """
+    try:
+        for handler in handlers:
+            handler(event.payload)
+    except Exception as exc:
+        logger.warning("Delivering outbox event %s failed: %s", event.id, exc)
+        return f"{type(exc).__name__}: {exc}"
+    return None
+
+
+def deliver_in_worker(event, handlers):
+    """
+    Delivers the event from a pool thread and releases the thread's database connections.
+    """
+    try:
+        return deliver(event, handlers)
+    finally:
+        connections.close_all()
+
+
+def dispatch_batch(batch_size=100, workers=4, handlers=None):
+    """
+    Claims and delivers one batch of pending outbox events.
+
+    Successful events are marked dispatched; failed ones are retried with backoff until
+    ORDER_OUTBOX_MAX_ATTEMPTS is reached and then marked failed.
+
+    Returns:
+        dict: Number of events that were 'dispatched', scheduled to be 'retried', or 'failed'.
+    """
+    handlers = get_handlers() if handlers is None else handlers
+    summary = {'dispatched': 0, 'retried': 0, 'failed': 0}
+    events = claim_batch(batch_size)
+    if not events:
+        return summary
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            errors = list(pool.map(lambda event: deliver_in_worker(event, handlers), events))
+    else:
+        errors = [deliver(event, handlers) for event in events]
+
+    now = timezone.now()
+    max_attempts = getattr(settings, 'ORDER_OUTBOX_MAX_ATTEMPTS', 8)
+    for event, error in zip(events, errors):
+        event.attempts += 1
+        event.last_error = error or ''
+        if error is None:
+            event.status = 'dispatched'
+            event.dispatched_at = now
+            summary['dispatched'] += 1
+        elif event.attempts >= max_attempts:
+            event.status = 'failed'
+            summary['failed'] += 1
+        else:
+            event.available_at = now + get_retry_delay(event.attempts)
+            summary['retried'] += 1
+    OrderOutboxEvent.objects.bulk_update(
+        events, ['status', 'attempts', 'last_error', 'available_at', 'dispatched_at']
+    )
+    return summary
+
+
+def purge_dispatched_events(older_than, batch_size=1000):
+    """
+    Deletes events dispatched before older_than in batches using the dispatched_at index,
+    so the sweep never holds a long write lock on the table. Pending and failed events
+    are kept.
+
+    Returns:
+        int: The number of deleted events.
+    """
+    total = 0
+    while True:
+        ids = list(
+            OrderOutboxEvent.objects.filter(status='dispatched', dispatched_at__lt=older_than)
+            .order_by('dispatched_at')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        total += OrderOutboxEvent.objects.filter(id__in=ids).delete()[0]
+
+
+def get_outbox_metrics(window):
+    """
+    Returns backlog, dispatch lag, and throughput figures for the outbox.
+
+    Args:
+        window (timedelta): Period over which lag and throughput are measured.
+    """
+    now = timezone.now()
+    backlog = OrderOutboxEvent.objects.aggregate(
+        pending=Count('id', filter=Q(status='pending')),
+        failed=Count('id', filter=Q(status='failed')),
+    )
+    oldest_pending = (
+        OrderOutboxEvent.objects.filter(status='pending')
+        .order_by('id')
+        .values_list('created_at', flat=True)
+        .first()
+    )
+    lag = ExpressionWrapper(F('dispatched_at') - F('created_at'), output_field=DurationField())
+    recent = OrderOutboxEvent.objects.filter(dispatched_at__gte=now - window).aggregate(
+        dispatched=Count('id'), avg_lag=Avg(lag), max_lag=Max(lag),
+    )
+    return {
+        'pending': backlog['pending'],
+        'failed': backlog['failed'],
+        'oldest_pending_age_seconds': (now - oldest_pending).total_seconds() if oldest_pending else 0.0,
+        'window_seconds': int(window.total_seconds()),
+        'dispatched': recent['dispatched'],
+        'throughput_per_second': recent['dispatched'] / window.total_seconds(),
+        'avg_dispatch_lag_seconds': recent['avg_lag'].total_seconds() if recent['avg_lag'] else 0.0,
+        'max_dispatch_lag_seconds': recent['max_lag'].total_seconds() if recent['max_lag'] else 0.0,
+    }
@@ -0,0 +1,209 @@
+"""
+Bookkeeping that has to happen whenever orders are created, change status, or are deleted.
+
+All functions expect to run inside the transaction that writes the order rows,
+so derived data never diverges from the orders themselves.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from django.db import transaction
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from orders_app.models import Order, ArchivedOrder, OrderStatusCounter, DailyRevenueRollup
+from orders_app.events import publish_order_events
+from orders_app.outbox import record_outbox_events
+from core.counters import adjust_row
+
+_keep_deleted_orders = ContextVar('keep_deleted_orders', default=False)
+
+
+@contextmanager
+def keep_deleted_orders_in_bookkeeping():
+    """
+    Deletes orders inside the block without removing them from the status counters
+    and revenue rollups, e.g. when they are moved into the archive table.
+    """
+    token = _keep_deleted_orders.set(True)
+    try:
+        yield
+    finally:
+        _keep_deleted_orders.reset(token)
+
+
+def remove_from_bookkeeping(order):
+    """
+    Removes a deleted active or archived order from the status counters and revenue rollups.
+
+    Called from the pre_delete handler in orders_app.signals, so direct deletes and
+    cascades from offers, offer details, and users are both covered.
+    """
+    if _keep_deleted_orders.get():
+        return
+    apply_status_changes([(order, getattr(order, '_loaded_status', None) or order.status, None)])
+
+
+def apply_status_changes(changes):
+    """
+    Applies a batch of status changes to the status counters and daily revenue rollups,
+    records the matching order events in the outbox, and publishes them to connected
+    clients once the transaction commits.
+
+    Args:
+        changes (iterable): Tuples of (order, old_status, new_status).
+            old_status is None for new orders, new_status is None for deleted orders.
+    """
+    counter_deltas = Counter()
+    rollup_deltas = {}
+    for order, old_status, new_status in changes:
+        if old_status == new_status:
+            continue
+        for status, sign in ((old_status, -1), (new_status, 1)):
+            if not status:
+                continue
+            counter_deltas[(order.business_user_id, status)] += sign
+            key = (order.business_user_id, order.offer_id, timezone.localdate(order.created_at), status)
+            totals = rollup_deltas.setdefault(key, [0, 0, Decimal('0')])
+            totals[0] += sign
+            totals[1] += sign * order.quantity
+            totals[2] += sign * order.quantity * order.price_at_order
+
+    for (business_user_id, status), delta in counter_deltas.items():
+        if delta:
+            adjust_row(OrderStatusCounter, {'business_user_id': business_user_id, 'status': status}, count=delta)
+
+    for (business_user_id, offer_id, day, status), (count, units, revenue) in rollup_deltas.items():
+        if count or units or revenue:
+            adjust_row(
+                DailyRevenueRollup,
+                {'business_user_id': business_user_id, 'offer_id': offer_id, 'day': day, 'status': status},
+                order_count=count, units=units, revenue=revenue,
+            )
+
+    record_outbox_events(changes)
+    publish_order_events(changes)
+
+
+def get_status_counts(business_user_id):
+    """
+    Returns a dict mapping every order status to its count for the business user,
+    or None if no counters exist for that user yet.
+    """
+    rows = OrderStatusCounter.objects.filter(
+        business_user_id=business_user_id
+    ).values_list('status', 'count')
+    counts = dict(rows)
+    if not counts:
+        return None
+    return {status: counts.get(status, 0) for status, _ in Order.STATUS_CHOICES}
+
+
+def bulk_transition(user, order_ids, new_status):
+    """
+    Moves every order the user owns as business to new_status with a single UPDATE.
+
+    Ownership and the allowed transitions are checked against one query that locks the rows,
+    and the status counters and revenue rollups are adjusted in the same transaction.
+    The UPDATE only matches orders still holding the status and version that were read,
+    so an order changed concurrently is reported as 'conflict' instead of being overwritten,
+    and the bookkeeping is only adjusted for orders that were actually updated.
+
+    Returns:
+        dict: Maps each requested order id to one of 'updated', 'unchanged',
+        'invalid_transition', 'conflict', 'forbidden', or 'not_found'.
+    """
+    results = {}
+    with transaction.atomic():
+        orders = {
+            order.id: order
+            for order in Order.objects.select_for_update()
+            .filter(pk__in=order_ids)
+            .only(
+                'id', 'customer_id', 'business_user_id', 'offer_id', 'status', 'version',
+                'quantity', 'price_at_order', 'created_at'
+            )
+        }
+
+        changes = []
+        for pk in order_ids:
+            order = orders.get(pk)
+            if order is None or user.id not in (order.customer_id, order.business_user_id):
+                results[pk] = 'not_found'
+            elif order.business_user_id != user.id:
+                results[pk] = 'forbidden'
+            elif order.status == new_status:
+                results[pk] = 'unchanged'
+            elif not order.can_transition_to(new_status):
+                results[pk] = 'invalid_transition'
+            else:
+                results[pk] = 'updated'
+                changes.append((order, order.status, new_status))
+
+        if changes:
+            now = timezone.now()
+            expected = Q()
+            for order, old_status, _ in changes:
+                expected |= Q(pk=order.id, status=old_status, version=order.version)
+            updated = Order.objects.filter(expected).update(
+                status=new_status, version=F('version') + 1, updated_at=now
+            )
+            if updated < len(changes):
+                applied = set(
+                    Order.objects.filter(
+                        pk__in=[order.id for order, _, _ in changes], status=new_status, updated_at=now
+                    ).values_list('pk', flat=True)
+                )
+                for order, _, _ in changes:
+                    if order.id not in applied:
+                        results[order.id] = 'conflict'
+                changes = [change for change in changes if change[0].id in applied]
+            apply_status_changes(changes)
+    return results
+
+
+def rebuild_revenue_rollups(business_user_id=None):
+    """
+    Recomputes the daily revenue rollups from the active and archived orders.
+
+    Args:
+        business_user_id (int, optional): Limits the rebuild to a single business user.
+
+    Returns:
+        int: The number of rollup rows written.
+    """
+    line_total = ExpressionWrapper(
+        F('price_at_order') * F('quantity'), output_field=DecimalField(max_digits=14, decimal_places=2)
+    )
+    totals = {}
+    for model in (Order, ArchivedOrder):
+        rows = model.objects.all()
+        if business_user_id is not None:
+            rows = rows.filter(business_user_id=business_user_id)
+        rows = (
+            rows.annotate(day=TruncDate('created_at'))
+            .order_by()
+            .values('business_user', 'offer', 'day', 'status')
+            .annotate(order_count=Count('id'), units=Sum('quantity'), revenue=Sum(line_total))
+        )
+        for row in rows:
+            key = (row['business_user'], row['offer'], row['day'], row['status'])
+            current = totals.setdefault(key, [0, 0, Decimal('0')])
+            current[0] += row['order_count']
+            current[1] += row['units']
+            current[2] += row['revenue']
+
+    rollups = DailyRevenueRollup.objects.all()
+    if business_user_id is not None:
+        rollups = rollups.filter(business_user_id=business_user_id)
+    with transaction.atomic():
+        rollups.delete()
+        DailyRevenueRollup.objects.bulk_create([
+            DailyRevenueRollup(
+                business_user_id=business, offer_id=offer, day=day, status=status,
+                order_count=count, units=units, revenue=revenue,
+            )
+            for (business, offer, day, status), (count, units, revenue) in totals.items()
+        ], batch_size=1000)
+    return len(totals)
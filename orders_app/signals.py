@@ -0,0 +1,21 @@
+"""
+Signal handlers keeping the order bookkeeping consistent with deletes.
+
+Deletes are handled in pre_delete instead of Order.delete, because cascades from
+offers, offer details, and users never call the model's delete method. pre_delete
+runs before the collector removes any row, so the counter and rollup rows are still
+there to be adjusted even when the same cascade deletes them afterwards.
+"""
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from orders_app.models import Order, ArchivedOrder
+from orders_app.services import remove_from_bookkeeping
+
+
+@receiver(pre_delete, sender=ArchivedOrder)
+@receiver(pre_delete, sender=Order)
+def remove_deleted_order(sender, instance, **kwargs):
+    """
+    Removes every deleted active or archived order from the status counters and revenue rollups.
+    """
+    remove_from_bookkeeping(instance)
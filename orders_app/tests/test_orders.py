@@ -2,11 +2,13 @@ from django.urls import reverse
 from offers_app.models import Offer, OfferDetail
 from orders_app.models import Order
 from rest_framework.test import APITestCase
+from django.test import override_settings
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
 from auth_app.models import UserProfile
 from rest_framework import status
 from decimal import Decimal
+import asyncio
 
 """
 Test suite for Order API endpoints.
@@ -41,6 +43,34 @@ class OrdersAPITests(APITestCase):
         self.token = Token.objects.create(user=self.business_user)
         self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
 
+    def create_offer_with_detail(self, title="Test Offer", price=10, user=None, **detail_fields):
+        """
+        Creates a basic offer with one detail, owned by the business user unless given.
+        Returns the offer and the detail.
+        """
+        offer = Offer.objects.create(
+            user=user or self.business_user,
+            title=title,
+            description=title,
+            offer_type="basic"
+        )
+        detail_fields = {'delivery_time_in_days': 1, 'revisions': 1, 'features': [], **detail_fields}
+        detail = OfferDetail.objects.create(offer=offer, title=title, price=price, **detail_fields)
+        return offer, detail
+
+    def create_order(self, detail, order_status='in_progress', customer=None, **fields):
+        """
+        Creates an order of the given offer detail at its current price, placed by the
+        customer user unless given.
+        """
+        return Order.objects.create(
+            customer=customer or self.customer_user,
+            offer=detail.offer,
+            ordered_detail=detail,
+            price_at_order=detail.price,
+            status=order_status,
+            **fields
+        )
 
     def test_get_order(self):
         """
@@ -231,4 +261,633 @@ class OrdersAPITests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['completed_order_count'], 2)
-        
\ No newline at end of file
+        
+    def test_expand_embeds_related_resources_with_fixed_query_count(self):
+        """
+        Test that ?expand=details,user,business_user embeds the related data and
+        keeps the query count independent of the number of orders.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        _, detail = self.create_offer_with_detail("Expand Detail", price=80)
+
+        url = reverse('order-list') + '?expand=details,user,business_user'
+        self.create_order(detail)
+        # Warm the token cache so both measurements exclude authentication.
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as single:
+            response = self.client.get(url)
+        for _ in range(3):
+            self.create_order(detail)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(len(single), len(many))
+        data = response.data['results'][0]
+        self.assertEqual(data['ordered_detail']['title'], "Expand Detail")
+        self.assertEqual(data['customer_user']['username'], 'customer_user')
+        self.assertEqual(data['business_user']['username'], 'business_user')
+
+    def test_order_list_query_count_does_not_grow_with_orders(self):
+        """
+        Test that listing orders uses the same number of queries for one and for many orders,
+        and that the business user is filled in from the offer automatically.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        _, detail = self.create_offer_with_detail("Query Test", price=40)
+
+        order = self.create_order(detail)
+        self.assertEqual(order.business_user, self.business_user)
+
+        url = reverse('order-list')
+        # Warm the token cache so both measurements exclude authentication.
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url)
+        for _ in range(5):
+            self.create_order(detail)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(single), len(many))
+
+    def test_order_list_is_cursor_paginated_and_filterable(self):
+        """
+        Test that the order list is cursor-paginated newest first and supports
+        status, offer, and role filters.
+        """
+        offer, detail = self.create_offer_with_detail("Filter Test", price=30)
+        orders = [
+            self.create_order(detail, order_status)
+            for order_status in ['in_progress', 'completed', 'in_progress']
+        ]
+
+        url = reverse('order-list')
+        first_page = self.client.get(url, {'page_size': 2})
+        self.assertEqual(first_page.status_code, status.HTTP_200_OK)
+        self.assertEqual([o['id'] for o in first_page.data['results']], [orders[2].id, orders[1].id])
+        second_page = self.client.get(first_page.data['next'])
+        self.assertEqual([o['id'] for o in second_page.data['results']], [orders[0].id])
+
+        completed = self.client.get(url, {'status': 'completed', 'offer_id': offer.id})
+        self.assertEqual([o['id'] for o in completed.data['results']], [orders[1].id])
+
+        as_customer = self.client.get(url, {'role': 'customer'})
+        self.assertEqual(as_customer.data['results'], [])
+        as_business = self.client.get(url, {'role': 'business'})
+        self.assertEqual(len(as_business.data['results']), 3)
+
+        invalid = self.client.get(url, {'status': 'unknown'})
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_order_stats_follow_status_transitions(self):
+        """
+        Test that the status counters follow creation, status updates, and deletion,
+        and that the combined stats endpoint returns every status count.
+        """
+        from django.core.management import call_command
+        from io import StringIO
+
+        _, detail = self.create_offer_with_detail("Stats Test", price=25)
+        orders = [self.create_order(detail) for _ in range(3)]
+
+        url = reverse('order-detail', kwargs={'pk': orders[0].id})
+        self.client.patch(url, {'status': 'completed'}, format='json')
+        Order.objects.get(pk=orders[1].id).delete()
+
+        stats_url = reverse('order-stats', kwargs={'business_user_id': self.business_user.id})
+        with self.assertNumQueries(1):
+            response = self.client.get(stats_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['counts']['in_progress'], 1)
+        self.assertEqual(response.data['counts']['completed'], 1)
+        self.assertEqual(response.data['total'], 2)
+
+        out = StringIO()
+        call_command('reconcile_order_counters', stdout=out)
+        self.assertIn('in sync', out.getvalue())
+
+    def test_cascade_deletes_update_counters_and_rollups(self):
+        """
+        Test that orders removed by deleting their offer or offer detail leave the
+        status counters and revenue rollups, exactly like directly deleted orders.
+        """
+        from django.core.management import call_command
+        from orders_app.models import DailyRevenueRollup
+        from io import StringIO
+
+        offers = [
+            self.create_offer_with_detail(title, price=40) for title in ("Cascade Offer", "Cascade Detail")
+        ]
+        for _, detail in offers:
+            self.create_order(detail)
+
+        count_url = reverse('order-count', kwargs={'business_user_id': self.business_user.id})
+        stats_url = reverse('order-stats', kwargs={'business_user_id': self.business_user.id})
+        self.assertEqual(self.client.get(count_url).data['order_count'], 2)
+
+        response = self.client.delete(reverse('offer-detail', kwargs={'pk': offers[0][0].id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(count_url).data['order_count'], 1)
+
+        response = self.client.delete(reverse('offerdetail-detail', kwargs={'pk': offers[1][1].id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(self.client.get(count_url).data['order_count'], 0)
+        self.assertEqual(self.client.get(stats_url).data['counts']['in_progress'], 0)
+        self.assertFalse(DailyRevenueRollup.objects.exclude(order_count=0).exists())
+
+        out = StringIO()
+        call_command('reconcile_order_counters', stdout=out)
+        self.assertIn('in sync', out.getvalue())
+
+    def test_order_stats_for_unknown_user_returns_404(self):
+        """
+        Test that the stats endpoint returns 404 for users that do not exist.
+        """
+        response = self.client.get(reverse('order-stats', kwargs={'business_user_id': 999999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_reconcile_order_counters_repairs_drift(self):
+        """
+        Test that the reconcile command reports drift and repairs it with --fix.
+        """
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from orders_app.models import OrderStatusCounter
+        from io import StringIO
+
+        OrderStatusCounter.objects.create(business_user=self.business_user, status='completed', count=7)
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_order_counters', stdout=StringIO())
+
+        call_command('reconcile_order_counters', '--fix', stdout=StringIO())
+        self.assertEqual(OrderStatusCounter.objects.get(business_user=self.business_user, status='completed').count, 0)
+
+    def test_order_creation_with_idempotency_key_is_replayed(self):
+        """
+        Test that retrying an order creation with the same Idempotency-Key replays the
+        first response without creating another order, and that reusing the key for a
+        different payload is rejected.
+        """
+        from django.core.management import call_command
+        from django.utils import timezone
+        from orders_app.models import OrderIdempotencyKey
+        from io import StringIO
+
+        details = [self.create_offer_with_detail(f"Retry Test {i}", price=60)[1] for i in range(2)]
+
+        token = Token.objects.create(user=self.customer_user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        url = reverse('order-list')
+        payload = {"offer_detail_id": details[0].id}
+
+        first = self.client.post(url, payload, format='json', HTTP_IDEMPOTENCY_KEY='retry-1')
+        retry = self.client.post(url, payload, format='json', HTTP_IDEMPOTENCY_KEY='retry-1')
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry.data['id'], first.data['id'])
+        self.assertEqual(Order.objects.filter(customer=self.customer_user).count(), 1)
+
+        conflict = self.client.post(
+            url, {"offer_detail_id": details[1].id}, format='json', HTTP_IDEMPOTENCY_KEY='retry-1'
+        )
+        self.assertEqual(conflict.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        OrderIdempotencyKey.objects.update(expires_at=timezone.now())
+        call_command('sweep_idempotency_keys', stdout=StringIO())
+        self.assertFalse(OrderIdempotencyKey.objects.exists())
+
+    def test_order_creation_writes_the_order_once(self):
+        """
+        Test that creating an order issues exactly one INSERT and no UPDATE on the order table.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        _, detail = self.create_offer_with_detail("Write Test", price=90)
+        token = Token.objects.create(user=self.customer_user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('order-list'), {"offer_detail_id": detail.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order_writes = [
+            q['sql'] for q in queries.captured_queries
+            if q['sql'].startswith(('INSERT INTO "orders_app_order"', 'UPDATE "orders_app_order"'))
+        ]
+        self.assertEqual(len(order_writes), 1)
+        self.assertTrue(order_writes[0].startswith('INSERT'))
+        self.assertEqual(Order.objects.get(pk=response.data['id']).customer, self.customer_user)
+
+    def test_status_update_uses_etags_and_state_machine(self):
+        """
+        Test that status updates honour If-Match, reject stale writes with 409,
+        and reject invalid transitions without writing.
+        """
+        _, detail = self.create_offer_with_detail("Version Test", price=70)
+        order = self.create_order(detail)
+        url = reverse('order-detail', kwargs={'pk': order.id})
+
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(etag, '"1"')
+
+        stale = self.client.patch(url, {'status': 'completed'}, format='json', HTTP_IF_MATCH='"0"')
+        self.assertEqual(stale.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        updated = self.client.patch(url, {'status': 'completed'}, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
+        self.assertEqual(updated['ETag'], '"2"')
+
+        invalid = self.client.patch(url, {'status': 'in_progress'}, format='json')
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.get(pk=order.id).version, 2)
+
+        loaded = Order.objects.get(pk=order.id)
+        Order.objects.filter(pk=order.id).update(status='in_progress', version=3)
+        self.assertFalse(loaded.transition_to('cancelled'))
+        self.assertEqual(Order.objects.get(pk=order.id).status, 'in_progress')
+
+    def test_bulk_status_update(self):
+        """
+        Test that the bulk endpoint updates owned orders in one request, reports a result
+        per id, and keeps the status counters in sync.
+        """
+        _, detail = self.create_offer_with_detail("Bulk Test", price=20)
+        other_business = User.objects.create_user(username='other_business', password='test123')
+        _, other_detail = self.create_offer_with_detail("Fremd", price=20, user=other_business)
+
+        open_orders = [self.create_order(detail) for _ in range(3)]
+        done = self.create_order(detail, 'completed')
+        foreign = self.create_order(other_detail)
+        own_purchase = self.create_order(other_detail, customer=self.business_user)
+
+        ids = [o.id for o in open_orders] + [done.id, foreign.id, own_purchase.id, 999999]
+        response = self.client.post(
+            reverse('order-bulk-status'), {'ids': ids, 'status': 'completed'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 3)
+        self.assertEqual(
+            [r['result'] for r in response.data['results']],
+            ['updated'] * 3 + ['unchanged', 'not_found', 'forbidden', 'not_found']
+        )
+        self.assertEqual(Order.objects.filter(business_user=self.business_user, status='completed').count(), 4)
+
+        stats = self.client.get(reverse('order-stats', kwargs={'business_user_id': self.business_user.id}))
+        self.assertEqual(stats.data['counts']['completed'], 4)
+        self.assertEqual(stats.data['counts']['in_progress'], 0)
+
+        cancel_done = self.client.post(
+            reverse('order-bulk-status'), {'ids': [done.id], 'status': 'cancelled'}, format='json'
+        )
+        self.assertEqual(cancel_done.data['results'], [{'id': done.id, 'result': 'invalid_transition'}])
+
+    def test_bulk_status_update_skips_concurrently_changed_orders(self):
+        """
+        Test that an order changed between the bulk read and its UPDATE is reported as a
+        conflict, keeps the concurrent status, and is left out of the counter adjustment.
+        """
+        from unittest import mock
+        from django.db.models import F
+
+        _, detail = self.create_offer_with_detail("Race", price=20)
+        orders = [self.create_order(detail) for _ in range(2)]
+        raced = orders[1]
+        can_transition_to = Order.can_transition_to
+
+        def change_concurrently(order, new_status):
+            if order.id == raced.id:
+                Order.objects.filter(pk=raced.id).update(status='cancelled', version=F('version') + 1)
+            return can_transition_to(order, new_status)
+
+        with mock.patch.object(Order, 'can_transition_to', change_concurrently):
+            response = self.client.post(
+                reverse('order-bulk-status'), {'ids': [o.id for o in orders], 'status': 'completed'},
+                format='json'
+            )
+
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual([r['result'] for r in response.data['results']], ['updated', 'conflict'])
+        raced.refresh_from_db()
+        self.assertEqual(raced.status, 'cancelled')
+        stats = self.client.get(reverse('order-stats', kwargs={'business_user_id': self.business_user.id}))
+        self.assertEqual(stats.data['counts']['completed'], 1)
+        self.assertEqual(stats.data['counts']['in_progress'], 1)
+
+    def test_order_keeps_detail_snapshot_after_offer_detail_edit(self):
+        """
+        Test that orders keep the purchased detail fields after the offer detail changes,
+        and that reading orders does not join the offer detail table.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        _, detail = self.create_offer_with_detail(
+            "Original", price=100, revisions=2, features=["Original"], offer_type="basic"
+        )
+        order = self.create_order(detail)
+
+        OfferDetail.objects.filter(pk=detail.pk).update(
+            title="Changed", price=999, revisions=9, features=["Changed"]
+        )
+
+        url = reverse('order-detail', kwargs={'pk': order.id})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.data['title'], "Original")
+        self.assertEqual(response.data['revisions'], 2)
+        self.assertEqual(response.data['features'], ["Original"])
+        self.assertEqual(Decimal(response.data['price']), Decimal('100.00'))
+        self.assertFalse(any('offers_app_offerdetail' in q['sql'] for q in queries.captured_queries))
+
+    def test_archive_orders_and_include_archived_list(self):
+        """
+        Test that closed orders older than the cutoff are moved to the archive, hidden from
+        the default list, merged back in with include_archived, and still counted in stats.
+        """
+        from datetime import timedelta
+        from django.core.management import call_command
+        from django.utils import timezone
+        from orders_app.models import ArchivedOrder
+        from io import StringIO
+
+        _, detail = self.create_offer_with_detail("Archive Test")
+        orders = [
+            self.create_order(detail, order_status)
+            for order_status in ['completed', 'in_progress', 'cancelled', 'completed']
+        ]
+        old = timezone.now() - timedelta(days=400)
+        Order.objects.filter(pk__in=[orders[0].pk, orders[1].pk, orders[2].pk]).update(updated_at=old)
+
+        call_command('archive_orders', '--batch-size', '1', stdout=StringIO())
+
+        self.assertEqual(
+            set(ArchivedOrder.objects.values_list('id', flat=True)), {orders[0].id, orders[2].id}
+        )
+        url = reverse('order-list')
+        active = self.client.get(url)
+        self.assertEqual({o['id'] for o in active.data['results']}, {orders[1].id, orders[3].id})
+
+        history = self.client.get(url, {'include_archived': 'true', 'page_size': 3})
+        self.assertEqual([o['id'] for o in history.data['results']], [o.id for o in reversed(orders)][:3])
+        next_page = self.client.get(history.data['next'])
+        self.assertEqual([o['id'] for o in next_page.data['results']], [orders[0].id])
+
+        filtered = self.client.get(url, {'include_archived': 'true', 'status': 'cancelled'})
+        self.assertEqual([o['id'] for o in filtered.data['results']], [orders[2].id])
+
+        stats = self.client.get(reverse('order-stats', kwargs={'business_user_id': self.business_user.id}))
+        self.assertEqual(stats.data['counts']['completed'], 2)
+        out = StringIO()
+        call_command('reconcile_order_counters', stdout=out)
+        self.assertIn('in sync', out.getvalue())
+
+    def test_business_revenue_reads_daily_rollups(self):
+        """
+        Test that revenue rollups follow order creation and status changes, that the revenue
+        endpoint reports them per day, and that the rebuild command reproduces them.
+        """
+        from django.core.management import call_command
+        from django.utils import timezone
+        from orders_app.models import DailyRevenueRollup
+        from io import StringIO
+
+        _, detail = self.create_offer_with_detail("Revenue Test", price=50)
+        orders = [self.create_order(detail, quantity=quantity) for quantity in (1, 2, 3)]
+        self.client.patch(reverse('order-detail', kwargs={'pk': orders[0].id}), {'status': 'completed'}, format='json')
+        self.client.patch(reverse('order-detail', kwargs={'pk': orders[2].id}), {'status': 'cancelled'}, format='json')
+
+        url = reverse('business-revenue', kwargs={'business_user_id': self.business_user.id})
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        today = timezone.localdate().isoformat()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['days']), 1)
+        day = response.data['days'][0]
+        self.assertEqual(day['date'], today)
+        self.assertEqual(day['order_count'], 2)
+        self.assertEqual(day['units'], 3)
+        self.assertEqual(Decimal(day['revenue']), Decimal('150'))
+        self.assertEqual(Decimal(day['by_status']['cancelled']['revenue']), Decimal('150'))
+        self.assertEqual(Decimal(response.data['totals']['revenue']), Decimal('150'))
+
+        incremental = set(DailyRevenueRollup.objects.values_list('status', 'order_count', 'units', 'revenue'))
+        call_command('rebuild_revenue_rollups', stdout=StringIO())
+        rebuilt = set(DailyRevenueRollup.objects.values_list('status', 'order_count', 'units', 'revenue'))
+        self.assertEqual({row for row in incremental if row[1]}, rebuilt)
+
+        self.assertEqual(self.client.get(url, {'from': 'gestern'}).status_code, status.HTTP_400_BAD_REQUEST)
+        other = reverse('business-revenue', kwargs={'business_user_id': self.customer_user.id})
+        self.assertEqual(self.client.get(other).status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(ORDER_EVENT_BROKER='orders_app.events.LocalOrderEventBroker')
+    async def test_order_event_stream_pushes_status_changes(self):
+        """
+        Test that the event stream requires a token and pushes order events to both parties
+        once the order transaction commits.
+        """
+        import json
+        from asgiref.sync import sync_to_async
+        from orders_app.events import get_broker
+
+        url = reverse('order-events')
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = await self.async_client.get(url, {'token': self.token.key})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b'retry:'))
+        self.assertEqual(get_broker().subscriber_count(self.business_user.id), 1)
+
+        def create_and_accept():
+            _, detail = self.create_offer_with_detail("Stream")
+            with self.captureOnCommitCallbacks(execute=True):
+                order = self.create_order(detail, 'pending')
+            with self.captureOnCommitCallbacks(execute=True):
+                order.transition_to('accepted')
+            return order
+
+        order = await sync_to_async(create_and_accept)()
+
+        created = await asyncio.wait_for(anext(stream), timeout=2)
+        self.assertTrue(created.startswith(b'event: order.created\n'))
+        changed = await asyncio.wait_for(anext(stream), timeout=2)
+        payload = json.loads(changed.decode().split('data: ', 1)[1])
+        self.assertEqual(payload['type'], 'order.status_changed')
+        self.assertEqual(payload['order_id'], order.id)
+        self.assertEqual((payload['previous_status'], payload['status']), ('pending', 'accepted'))
+
+        await stream.aclose()
+        response.close()
+        self.assertEqual(get_broker().subscriber_count(self.business_user.id), 0)
+
+    @override_settings(
+        ORDER_EVENT_BROKER='orders_app.events.LocalOrderEventBroker', ORDER_EVENT_HEARTBEAT_SECONDS=0.05
+    )
+    async def test_order_event_stream_ends_when_token_is_revoked(self):
+        """
+        Test that the stream re-validates its token on the heartbeat and ends once the
+        token is deleted.
+        """
+        from asgiref.sync import sync_to_async
+
+        response = await self.async_client.get(reverse('order-events'), {'token': self.token.key})
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b'retry:'))
+        self.assertEqual(await asyncio.wait_for(anext(stream), timeout=2), b': keep-alive\n\n')
+
+        await sync_to_async(self.token.delete)()
+        with self.assertRaises(StopAsyncIteration):
+            while True:
+                await asyncio.wait_for(anext(stream), timeout=2)
+        response.close()
+
+    @override_settings(ORDER_EVENT_BROKER='orders_app.events.LocalOrderEventBroker')
+    async def test_order_event_stream_ends_when_token_expires(self):
+        """
+        Test that the stream ends at the token's expiry even between heartbeats.
+        """
+        from datetime import timedelta
+        from asgiref.sync import sync_to_async
+        from django.utils import timezone
+        from auth_app.models import AuthToken
+
+        def issue_short_lived_token():
+            token = AuthToken.issue(self.customer_user)
+            AuthToken.objects.filter(pk=token.pk).update(expires_at=timezone.now() + timedelta(seconds=0.3))
+            return token.key
+
+        key = await sync_to_async(issue_short_lived_token)()
+        response = await self.async_client.get(reverse('order-events'), {'token': key})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b'retry:'))
+        with self.assertRaises(StopAsyncIteration):
+            await asyncio.wait_for(anext(stream), timeout=2)
+        response.close()
+
+    def test_order_event_stream_requires_asgi(self):
+        """
+        Test that the event stream refuses WSGI requests instead of holding a worker.
+        """
+        response = self.client.get(reverse('order-events'), {'token': self.token.key})
+        self.assertEqual(response.status_code, 501)
+
+    async def test_outbox_broker_delivers_events_written_by_any_process(self):
+        """
+        Test that the outbox broker delivers events read from the outbox table once,
+        and ignores direct publishes.
+        """
+        from unittest import mock
+        from asgiref.sync import sync_to_async
+        from orders_app.events import OutboxOrderEventBroker
+
+        broker = OutboxOrderEventBroker()
+        with mock.patch.object(broker, 'start_poller'):
+            subscription = broker.subscribe(self.customer_user.id)
+        await sync_to_async(broker.deliver_new_events)()
+
+        _, detail = await sync_to_async(self.create_offer_with_detail)("Outbox")
+        order = await sync_to_async(self.create_order)(detail, 'pending')
+        broker.publish([self.customer_user.id], {'type': 'direct'})
+        await sync_to_async(broker.deliver_new_events)()
+        await sync_to_async(broker.deliver_new_events)()
+
+        event = await asyncio.wait_for(subscription.get(), timeout=2)
+        self.assertEqual((event['type'], event['order_id']), ('order.created', order.id))
+        await asyncio.sleep(0)
+        self.assertTrue(subscription.queue.empty())
+        subscription.close()
+        self.assertEqual(broker.subscriber_count(), 0)
+
+    def test_outbox_records_order_events_and_dispatcher_retries(self):
+        """
+        Test that order changes are recorded in the outbox, that the dispatcher delivers them,
+        retries failures with backoff, and that the metrics endpoint reports the backlog.
+        """
+        from django.core.management import call_command
+        from django.test import override_settings
+        from orders_app.models import OrderOutboxEvent
+        from django.utils import timezone
+        from orders_app.outbox import dispatch_batch
+        from io import StringIO
+
+        _, detail = self.create_offer_with_detail("Outbox")
+        order = self.create_order(detail, 'pending')
+        order.transition_to('accepted')
+        self.assertEqual(
+            list(OrderOutboxEvent.objects.order_by('id').values_list('event_type', 'order_id')),
+            [('order.created', order.id), ('order.status_changed', order.id)],
+        )
+
+        delivered = []
+
+        def flaky_handler(payload):
+            if payload['type'] == 'order.status_changed':
+                raise RuntimeError('webhook down')
+            delivered.append(payload['order_id'])
+
+        with self.assertLogs('orders_app.outbox', level='WARNING'):
+            summary = dispatch_batch(batch_size=10, workers=2, handlers=[flaky_handler])
+        self.assertEqual(summary, {'dispatched': 1, 'retried': 1, 'failed': 0})
+        self.assertEqual(delivered, [order.id])
+        retried = OrderOutboxEvent.objects.get(event_type='order.status_changed')
+        self.assertEqual((retried.status, retried.attempts), ('pending', 1))
+        self.assertIn('webhook down', retried.last_error)
+        self.assertGreater(retried.available_at, timezone.now())
+        self.assertEqual(dispatch_batch(batch_size=10, workers=1, handlers=[flaky_handler])['retried'], 0)
+
+        metrics_url = reverse('order-event-metrics')
+        self.assertEqual(self.client.get(metrics_url).status_code, status.HTTP_403_FORBIDDEN)
+        self.business_user.is_staff = True
+        self.business_user.save()
+        metrics = self.client.get(metrics_url).data
+        self.assertEqual((metrics['pending'], metrics['dispatched'], metrics['failed']), (1, 1, 0))
+
+        OrderOutboxEvent.objects.update(available_at=timezone.now())
+        with override_settings(ORDER_OUTBOX_HANDLERS=['orders_app.outbox.log_order_event']):
+            call_command('dispatch_order_events', stdout=StringIO())
+        self.assertFalse(OrderOutboxEvent.objects.exclude(status='dispatched').exists())
+
+    def test_sweep_outbox_events_deletes_only_old_dispatched_events(self):
+        """
+        Test that the retention sweep deletes dispatched events past the retention window
+        and keeps recent, pending, and failed events.
+        """
+        from datetime import timedelta
+        from django.core.management import call_command
+        from django.utils import timezone
+        from orders_app.models import OrderOutboxEvent
+        from io import StringIO
+
+        now = timezone.now()
+        old = now - timedelta(days=8)
+        OrderOutboxEvent.objects.bulk_create([
+            OrderOutboxEvent(event_type='order.created', order_id=1, payload={}, status='dispatched', dispatched_at=old),
+            OrderOutboxEvent(event_type='order.created', order_id=2, payload={}, status='dispatched', dispatched_at=old),
+            OrderOutboxEvent(event_type='order.created', order_id=3, payload={}, status='dispatched', dispatched_at=now),
+            OrderOutboxEvent(event_type='order.created', order_id=4, payload={}, status='pending'),
+            OrderOutboxEvent(event_type='order.created', order_id=5, payload={}, status='failed'),
+        ])
+
+        out = StringIO()
+        call_command('sweep_outbox_events', batch_size=1, stdout=out)
+
+        self.assertIn('Deleted 2', out.getvalue())
+        self.assertEqual(
+            sorted(OrderOutboxEvent.objects.values_list('order_id', flat=True)), [3, 4, 5]
+        )
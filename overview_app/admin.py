@@ -1,3 +1,28 @@
 from django.contrib import admin
+from .models import BusinessLeaderboardEntry
 
-# Register your models here.
+
+@admin.register(BusinessLeaderboardEntry)
+class BusinessLeaderboardEntryAdmin(admin.ModelAdmin):
+    """
+    Read-only admin view of the materialized business leaderboard.
+    """
+    list_display = (
+        'business_user',
+        'username',
+        'score',
+        'average_rating',
+        'review_count',
+        'completed_order_count',
+        'refreshed_at'
+    )
+
+    search_fields = (
+        'username',
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
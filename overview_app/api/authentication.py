@@ -0,0 +1,19 @@
+"""
+Authentication of the sub-requests dispatched by the batch endpoint.
+"""
+from rest_framework.authentication import BaseAuthentication
+
+
+class BatchSubRequestAuthentication(BaseAuthentication):
+    """
+    Authenticates sub-requests built by BatchAPIView as the batch request's user.
+
+    The batch view stores the already authenticated (user, auth) pair on the Django
+    request it builds. Clients cannot set that attribute, so requests arriving from
+    outside are never authenticated by this class. It is listed after the token
+    authentication, which keeps answering unauthenticated requests with 401.
+    """
+    attribute = 'batch_credentials'
+
+    def authenticate(self, request):
+        return getattr(request._request, self.attribute, None)
@@ -0,0 +1,14 @@
+"""
+Custom pagination settings for the business leaderboard in the overview_app.
+"""
+
+from rest_framework.pagination import PageNumberPagination
+
+class LeaderboardPagination(PageNumberPagination):
+    """
+    Pagination class for the leaderboard, allowing a default page size of 10 and
+    supporting a 'page_size' query parameter with a maximum limit.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
@@ -0,0 +1,64 @@
+"""
+Serializers for the overview_app validating batch request payloads
+and representing the business leaderboard.
+"""
+from rest_framework import serializers
+from overview_app.models import BusinessLeaderboardEntry
+
+
+class BatchItemSerializer(serializers.Serializer):
+    """
+    Serializer for a single sub-request inside a batch.
+
+    Only relative GET requests to API endpoints are allowed, and batches cannot be nested.
+    """
+    method = serializers.ChoiceField(choices=['GET'], default='GET')
+    path = serializers.CharField()
+
+    def validate_path(self, value):
+        """
+        Ensures the path targets the API and is not the batch endpoint itself.
+        """
+        if not value.startswith('/api/'):
+            raise serializers.ValidationError("Only relative '/api/' paths can be batched.")
+        if value.split('?', 1)[0].rstrip('/') == '/api/batch':
+            raise serializers.ValidationError("Batch requests cannot be nested.")
+        return value
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    """
+    Serializer for a batch of sub-requests.
+
+    Limits the number of sub-requests to keep a single batch from monopolizing a worker.
+    """
+    MAX_REQUESTS = 20
+
+    requests = BatchItemSerializer(many=True)
+
+    def validate_requests(self, value):
+        """
+        Ensures the batch contains between one and MAX_REQUESTS sub-requests.
+        """
+        if not value:
+            raise serializers.ValidationError("At least one request is required.")
+        if len(value) > self.MAX_REQUESTS:
+            raise serializers.ValidationError(
+                f"A batch can contain at most {self.MAX_REQUESTS} requests."
+            )
+        return value
+
+
+class BusinessLeaderboardEntrySerializer(serializers.ModelSerializer):
+    """
+    Serializer for a leaderboard entry with the business profile fields it carries.
+    """
+    file = serializers.ImageField(read_only=True)
+
+    class Meta:
+        model = BusinessLeaderboardEntry
+        fields = [
+            'business_user', 'username', 'first_name', 'last_name', 'location', 'file',
+            'review_count', 'average_rating', 'score', 'completed_order_count', 'refreshed_at'
+        ]
+        read_only_fields = fields
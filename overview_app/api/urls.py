@@ -1,6 +1,8 @@
 from django.urls import path
-from .views import BaseInfoAPIView
+from .views import BaseInfoAPIView, BatchAPIView, TopBusinessesListView
 
 urlpatterns = [
     path('base-info/', BaseInfoAPIView.as_view(), name='base-info'),
+    path('batch/', BatchAPIView.as_view(), name='batch'),
+    path('businesses/top/', TopBusinessesListView.as_view(), name='top-businesses'),
 ]
\ No newline at end of file
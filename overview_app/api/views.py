@@ -2,16 +2,31 @@
 API views for the overview_app providing general platform statistics.
 
 Includes endpoints for retrieving aggregated data such as review counts,
-average ratings, number of business profiles, and number of available offers.
+average ratings, number of business profiles, and number of available offers,
+as well as a batch endpoint that serves several API GETs in one round trip
+and the top-rated businesses leaderboard.
 """
+import io
+import logging
+import time
+from asgiref.sync import iscoroutinefunction
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import Http404
+from django.urls import resolve, Resolver404
 from rest_framework.views import APIView
+from rest_framework import generics
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Avg
-from reviews_app.models import Review
-from offers_app.models import Offer 
-from auth_app.models import UserProfile 
-from rest_framework.permissions import AllowAny
+from django.conf import settings
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from overview_app.models import BusinessLeaderboardEntry
+from .serializers import BatchRequestSerializer, BusinessLeaderboardEntrySerializer
+from .pagination import LeaderboardPagination
+from .authentication import BatchSubRequestAuthentication
+from overview_app.services import get_base_info
+
+logger = logging.getLogger(__name__)
 
 
 class BaseInfoAPIView(APIView):
@@ -20,6 +35,8 @@ class BaseInfoAPIView(APIView):
 
     Returns statistics including total reviews, average rating, number of
     business profiles, and total offer count. Publicly accessible without authentication.
+    The statistics come from a short-lived cached snapshot, and the response carries
+    Cache-Control headers so shared caches and CDNs can serve it as well.
     """
     permission_classes = [AllowAny]
     authentication_classes = []
@@ -33,22 +50,136 @@ class BaseInfoAPIView(APIView):
             business profile count, and offer count.
         """
         try:
-            review_count = Review.objects.count()
-            average_rating = Review.objects.aggregate(avg=Avg('rating'))['avg'] or 0.0
-            average_rating = round(average_rating, 1)
-
-            business_profile_count = UserProfile.objects.filter(type='business').count()
-            offer_count = Offer.objects.count()
-
-            return Response({
-                "review_count": review_count,
-                "average_rating": average_rating,
-                "business_profile_count": business_profile_count,
-                "offer_count": offer_count,
-            }, status=status.HTTP_200_OK)
+            response = Response(get_base_info(), status=status.HTTP_200_OK)
+            response['Cache-Control'] = (
+                f"public, max-age={getattr(settings, 'BASE_INFO_CACHE_TTL', 60)}, "
+                f"stale-while-revalidate={getattr(settings, 'BASE_INFO_STALE_TTL', 300)}"
+            )
+            return response
 
         except Exception as e:
             return Response(
                 {"detail": "Interner Serverfehler."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+class BatchAPIView(APIView):
+    """
+    API view to execute several API GET requests in a single round trip.
+
+    The batch request is authenticated once; every sub-request is dispatched in-process
+    through the URL resolver as the same user and reports its own status and timing.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Handles POST requests containing a list of relative GET requests.
+
+        Returns:
+            Response: A JSON response containing one entry per sub-request with its
+            path, status code, body, and duration in milliseconds.
+        """
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        started = time.perf_counter()
+        responses = [
+            self.dispatch_sub_request(request, item['path'])
+            for item in serializer.validated_data['requests']
+        ]
+        return Response({
+            "responses": responses,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }, status=status.HTTP_200_OK)
+
+    def build_sub_request(self, request, path, query_string):
+        """
+        Builds a GET request for the given path that reuses the batch request's headers
+        and is authenticated as the batch request's user by BatchSubRequestAuthentication.
+        """
+        environ = dict(request._request.META)
+        environ.pop('CONTENT_TYPE', None)
+        environ.update({
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'QUERY_STRING': query_string,
+            'CONTENT_LENGTH': '0',
+            'wsgi.input': io.BytesIO(b''),
+        })
+        sub_request = WSGIRequest(environ)
+        setattr(sub_request, BatchSubRequestAuthentication.attribute, (request.user, request.auth))
+        return sub_request
+
+    def dispatch_sub_request(self, request, full_path):
+        """
+        Resolves and executes a single sub-request and returns its serialized result.
+
+        Async and streaming views cannot be answered inside a batch and are reported
+        with status 400. Http404 and PermissionDenied raised by plain Django views become
+        404 and 403 entries; any other error raised by one sub-request is reported as its
+        own 500 entry, so the remaining sub-requests are still answered.
+        """
+        path, _, query_string = full_path.partition('?')
+        started = time.perf_counter()
+        try:
+            match = resolve(path)
+        except Resolver404:
+            response_status, body = status.HTTP_404_NOT_FOUND, {"detail": "Not found."}
+        else:
+            if iscoroutinefunction(match.func):
+                response_status, body = self.unbatchable()
+            else:
+                try:
+                    response_status, body = self.execute_sub_request(request, match, path, query_string)
+                except Http404:
+                    response_status, body = status.HTTP_404_NOT_FOUND, {"detail": "Not found."}
+                except PermissionDenied:
+                    response_status = status.HTTP_403_FORBIDDEN
+                    body = {"detail": "You do not have permission to perform this action."}
+                except Exception:
+                    logger.exception("Batch sub-request %s failed", full_path)
+                    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+                    body = {"detail": "Interner Serverfehler."}
+        return {
+            "path": full_path,
+            "status": response_status,
+            "body": body,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def execute_sub_request(self, request, match, path, query_string):
+        """
+        Calls the resolved view and returns the status code and body of its response.
+        """
+        sub_request = self.build_sub_request(request, path, query_string)
+        response = match.func(sub_request, *match.args, **match.kwargs)
+        if response.streaming:
+            response.close()
+            return self.unbatchable()
+        if hasattr(response, 'data'):
+            return response.status_code, response.data
+        return response.status_code, response.content.decode(response.charset or 'utf-8')
+
+    def unbatchable(self):
+        """
+        Returns the status code and body reported for async and streaming endpoints.
+        """
+        return status.HTTP_400_BAD_REQUEST, {"detail": "Async and streaming endpoints cannot be batched."}
+
+
+class TopBusinessesListView(generics.ListAPIView):
+    """
+    API view listing the top-rated businesses from the materialized leaderboard.
+
+    Businesses are ranked by their Bayesian-adjusted score, so few but perfect reviews
+    do not outrank a long track record. Reads only the leaderboard table, which is
+    refreshed by the refresh_leaderboard command. Publicly accessible without authentication.
+    """
+    queryset = BusinessLeaderboardEntry.objects.all()
+    serializer_class = BusinessLeaderboardEntrySerializer
+    pagination_class = LeaderboardPagination
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    filter_backends = []
@@ -0,0 +1,25 @@
+"""
+Management command that refreshes the materialized business leaderboard.
+"""
+from django.core.management.base import BaseCommand
+from overview_app.services import refresh_leaderboard
+
+
+class Command(BaseCommand):
+    """
+    Recomputes BusinessLeaderboardEntry rows, either for every business user
+    (meant to run on a schedule) or only for the given ones.
+    """
+    help = "Refreshes the top-rated businesses leaderboard."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user',
+            type=int,
+            action='append',
+            help='Only refresh the entry of this business user id. Can be repeated.',
+        )
+
+    def handle(self, *args, **options):
+        written = refresh_leaderboard(options.get('business_user'))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} leaderboard entry(ies)."))
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-19 10:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessLeaderboardEntry',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='leaderboard_entry', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('username', models.CharField(max_length=150)),
+                ('first_name', models.CharField(blank=True, default='', max_length=150)),
+                ('last_name', models.CharField(blank=True, default='', max_length=150)),
+                ('location', models.CharField(blank=True, default='', max_length=100)),
+                ('file', models.ImageField(blank=True, default='', upload_to='profile_pictures/')),
+                ('review_count', models.IntegerField(default=0)),
+                ('average_rating', models.FloatField(default=0.0)),
+                ('score', models.FloatField(default=0.0)),
+                ('completed_order_count', models.IntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Business Leaderboard Entry',
+                'verbose_name_plural': 'Business Leaderboard Entries',
+                'ordering': ['-score', '-review_count', 'business_user'],
+                'indexes': [models.Index(fields=['-score', '-review_count', 'business_user'], name='leaderboard_rank_idx')],
+            },
+        ),
+    ]
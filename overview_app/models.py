@@ -1,3 +1,49 @@
+"""
+Models for the overview_app holding materialized platform statistics.
+"""
 from django.db import models
+from django.contrib.auth.models import User
 
-# Create your models here.
+
+class BusinessLeaderboardEntry(models.Model):
+    """
+    Materialized ranking row of a reviewed business user.
+
+    Copies the profile fields shown on the landing page next to the review count,
+    average rating, Bayesian-adjusted score, and completed order count, so the
+    leaderboard is served from this table alone. Rebuilt by refresh_leaderboard.
+    """
+    business_user = models.OneToOneField(
+        User,
+        related_name='leaderboard_entry',
+        on_delete=models.CASCADE,
+        primary_key=True
+    )
+    username = models.CharField(max_length=150)
+    first_name = models.CharField(max_length=150, blank=True, default='')
+    last_name = models.CharField(max_length=150, blank=True, default='')
+    location = models.CharField(max_length=100, blank=True, default='')
+    file = models.ImageField(upload_to='profile_pictures/', blank=True, default='')
+    review_count = models.IntegerField(default=0)
+    average_rating = models.FloatField(default=0.0)
+    score = models.FloatField(default=0.0)
+    completed_order_count = models.IntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        """
+        Meta options for the BusinessLeaderboardEntry model.
+        Entries are ranked by score, ties broken by review count and user id.
+        """
+        verbose_name = "Business Leaderboard Entry"
+        verbose_name_plural = "Business Leaderboard Entries"
+        ordering = ['-score', '-review_count', 'business_user']
+        indexes = [
+            models.Index(fields=['-score', '-review_count', 'business_user'], name='leaderboard_rank_idx'),
+        ]
+
+    def __str__(self):
+        """
+        Returns a string representation of the leaderboard entry.
+        """
+        return f"{self.username}: {self.score:.2f} ({self.review_count} reviews)"
@@ -0,0 +1,130 @@
+"""
+Computation of the cached platform statistics and the materialized business leaderboard.
+"""
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Count, Sum
+from django.utils import timezone
+from auth_app.models import UserProfile
+from offers_app.models import Offer
+from reviews_app.models import Review
+from orders_app.models import OrderStatusCounter
+from reviews_app.models import BusinessRatingSummary
+from overview_app.models import BusinessLeaderboardEntry
+
+
+BASE_INFO_CACHE_KEY = 'overview:base-info'
+BASE_INFO_LOCK_KEY = 'overview:base-info:lock'
+
+
+def compute_base_info():
+    """
+    Aggregates the platform statistics shown by /api/base-info/.
+    """
+    reviews = Review.objects.aggregate(count=Count('id'), avg=Avg('rating'))
+    return {
+        "review_count": reviews['count'],
+        "average_rating": round(reviews['avg'] or 0.0, 1),
+        "business_profile_count": UserProfile.objects.filter(type='business').count(),
+        "offer_count": Offer.objects.count(),
+    }
+
+
+def get_base_info():
+    """
+    Returns the platform statistics from a snapshot cached for BASE_INFO_CACHE_TTL seconds.
+
+    Concurrent cache misses are coalesced: only the request that wins cache.add on the lock
+    key recomputes the snapshot. The others keep serving the previous snapshot, which is
+    kept for BASE_INFO_STALE_TTL more seconds, or wait for the winner when there is none yet.
+    """
+    ttl = getattr(settings, 'BASE_INFO_CACHE_TTL', 60)
+    stale_ttl = getattr(settings, 'BASE_INFO_STALE_TTL', 300)
+    lock_timeout = getattr(settings, 'BASE_INFO_LOCK_TIMEOUT', 10)
+
+    entry = cache.get(BASE_INFO_CACHE_KEY)
+    if entry is not None and entry['fresh_until'] > time.time():
+        return entry['data']
+
+    if cache.add(BASE_INFO_LOCK_KEY, True, lock_timeout):
+        try:
+            data = compute_base_info()
+            cache.set(BASE_INFO_CACHE_KEY, {'data': data, 'fresh_until': time.time() + ttl}, ttl + stale_ttl)
+        finally:
+            cache.delete(BASE_INFO_LOCK_KEY)
+        return data
+
+    if entry is not None:
+        return entry['data']
+
+    deadline = time.time() + lock_timeout
+    while time.time() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(BASE_INFO_CACHE_KEY)
+        if entry is not None:
+            return entry['data']
+    return compute_base_info()
+
+
+def bayesian_score(rating_sum, review_count, prior_mean, prior_weight):
+    """
+    Returns the average rating shrunk towards the platform mean.
+
+    A business with few reviews is pulled towards prior_mean as if it had prior_weight
+    additional reviews of that rating, so a single five-star review does not top the list.
+    """
+    return (prior_weight * prior_mean + rating_sum) / (prior_weight + review_count)
+
+
+def refresh_leaderboard(business_user_ids=None):
+    """
+    Recomputes the leaderboard entries from the rating summaries, the completed order
+    counters, and the business profiles.
+
+    The platform mean used as prior always covers every business. Passing business_user_ids
+    refreshes only those entries, which suits incremental updates between full refreshes.
+
+    Returns:
+        int: The number of entries written.
+    """
+    prior_weight = getattr(settings, 'BUSINESS_LEADERBOARD_PRIOR_WEIGHT', 5)
+    totals = BusinessRatingSummary.objects.aggregate(
+        rating_sum=Sum('rating_sum'), review_count=Sum('review_count')
+    )
+    prior_mean = (totals['rating_sum'] or 0) / totals['review_count'] if totals['review_count'] else 0.0
+
+    profiles = UserProfile.objects.filter(
+        type='business', user__rating_summary__review_count__gt=0
+    ).select_related('user__rating_summary')
+    completed = OrderStatusCounter.objects.filter(status='completed')
+    entries = BusinessLeaderboardEntry.objects.all()
+    if business_user_ids is not None:
+        profiles = profiles.filter(user_id__in=business_user_ids)
+        completed = completed.filter(business_user_id__in=business_user_ids)
+        entries = entries.filter(business_user_id__in=business_user_ids)
+    completed = dict(completed.values_list('business_user_id', 'count'))
+
+    now = timezone.now()
+    rows = []
+    for profile in profiles:
+        summary = profile.user.rating_summary
+        rows.append(BusinessLeaderboardEntry(
+            business_user_id=profile.user_id,
+            username=profile.user.username,
+            first_name=profile.user.first_name,
+            last_name=profile.user.last_name,
+            location=profile.location or '',
+            file=profile.file.name or '',
+            review_count=summary.review_count,
+            average_rating=summary.average_rating,
+            score=round(bayesian_score(summary.rating_sum, summary.review_count, prior_mean, prior_weight), 4),
+            completed_order_count=completed.get(profile.user_id, 0),
+            refreshed_at=now,
+        ))
+
+    with transaction.atomic():
+        entries.delete()
+        BusinessLeaderboardEntry.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
@@ -11,6 +11,7 @@ from reviews_app.models import Review
 from offers_app.models import Offer
 from auth_app.models import UserProfile
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 class BaseInfoAPITests(APITestCase):
     """
@@ -23,6 +24,7 @@ class BaseInfoAPITests(APITestCase):
         Sets up test data including users, profiles, reviews, and offers.
         Prepares the URL used in the base info endpoint tests.
         """
+        cache.clear()
         user1 = User.objects.create(username="user1")
         user2 = User.objects.create(username="user2")
         user3 = User.objects.create(username="user3")
@@ -63,4 +65,203 @@ class BaseInfoAPITests(APITestCase):
         self.client.credentials()
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
\ No newline at end of file
+
+    def test_base_info_is_served_from_cached_snapshot(self):
+        """
+        Test that repeated requests are answered from the cached snapshot without queries
+        and carry Cache-Control headers for shared caches.
+        """
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.data['review_count'], 2)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('max-age=60', response['Cache-Control'])
+
+    def test_concurrent_cache_misses_recompute_once(self):
+        """
+        Test that a burst of concurrent cache misses triggers a single recomputation.
+        """
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from overview_app import services
+
+        calls = []
+        lock = threading.Lock()
+
+        def slow_compute():
+            with lock:
+                calls.append(1)
+            time.sleep(0.2)
+            return {"review_count": 7}
+
+        with patch.object(services, 'compute_base_info', side_effect=slow_compute):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: services.get_base_info(), range(8)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"review_count": 7}] * 8)
+        
+
+class BatchAPITests(APITestCase):
+    """
+    Integration tests for the /api/batch/ endpoint.
+
+    Tests in-process dispatch of sub-requests, validation limits, and authentication.
+    """
+    def setUp(self):
+        """
+        Sets up a business user with one offer and prepares the batch URL.
+        """
+        cache.clear()
+        self.user = User.objects.create_user(username="batch_user", password="test123")
+        UserProfile.objects.create(user=self.user, type="business")
+        Offer.objects.create(user=self.user, title="Angebot", description="Test")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('batch')
+
+    def test_batch_dispatches_sub_requests(self):
+        """
+        Test that each sub-request is executed and reported with status, body, and timing.
+        """
+        response = self.client.post(self.url, {"requests": [
+            {"path": "/api/base-info/"},
+            {"path": f"/api/order-count/{self.user.id}/"},
+            {"path": "/api/does-not-exist/"},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['responses']
+        self.assertEqual([r['status'] for r in results], [200, 200, 404])
+        self.assertEqual(results[0]['body']['offer_count'], 1)
+        self.assertEqual(results[1]['body']['order_count'], 0)
+        self.assertTrue(all('duration_ms' in r for r in results))
+
+    def test_batch_isolates_unbatchable_and_failing_sub_requests(self):
+        """
+        Test that async endpoints are rejected and a crashing sub-request reports its own
+        500 entry while the other sub-requests are still answered.
+        """
+        from unittest.mock import patch
+        from overview_app.api.views import BaseInfoAPIView
+
+        with patch.object(BaseInfoAPIView, 'get', side_effect=RuntimeError("boom")):
+            with self.assertLogs('overview_app.api.views', level='ERROR'):
+                response = self.client.post(self.url, {"requests": [
+                    {"path": "/api/order-events/"},
+                    {"path": "/api/base-info/"},
+                    {"path": f"/api/order-count/{self.user.id}/"},
+                ]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['responses']
+        self.assertEqual([r['status'] for r in results], [400, 500, 200])
+        self.assertEqual(results[2]['body']['order_count'], 0)
+
+    def test_batch_maps_django_http_errors(self):
+        """
+        Test that Http404 and PermissionDenied raised by plain Django views are reported
+        as 404 and 403 entries instead of 500.
+        """
+        from unittest.mock import patch
+        from django.core.exceptions import PermissionDenied
+        from django.http import Http404
+        from overview_app.api.views import BatchAPIView
+
+        with patch.object(BatchAPIView, 'execute_sub_request', side_effect=[Http404(), PermissionDenied()]):
+            response = self.client.post(self.url, {"requests": [
+                {"path": "/api/base-info/"},
+                {"path": "/api/base-info/"},
+            ]}, format='json')
+
+        self.assertEqual([r['status'] for r in response.data['responses']], [404, 403])
+
+    def test_batch_rejects_invalid_batches(self):
+        """
+        Test that empty, oversized, nested, and non-API batches are rejected with HTTP 400.
+        """
+        too_many = [{"path": "/api/base-info/"}] * 21
+        for requests in ([], too_many, [{"path": "/api/batch/"}], [{"path": "/admin/"}]):
+            response = self.client.post(self.url, {"requests": requests}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_requires_authentication(self):
+        """
+        Test that unauthenticated clients cannot use the batch endpoint.
+        """
+        self.client.force_authenticate(user=None)
+        response = self.client.post(self.url, {"requests": [{"path": "/api/base-info/"}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TopBusinessesAPITests(APITestCase):
+    """
+    Integration tests for the /api/businesses/top/ leaderboard endpoint.
+    """
+    def setUp(self):
+        """
+        Creates one business with a single perfect review, one with a longer perfect
+        track record, and one with mediocre reviews, then refreshes the leaderboard.
+        """
+        from django.core.management import call_command
+        from io import StringIO
+        from orders_app.models import OrderStatusCounter
+
+        self.newcomer = User.objects.create(username="newcomer")
+        self.veteran = User.objects.create(username="veteran")
+        self.mediocre = User.objects.create(username="mediocre")
+        UserProfile.objects.create(user=self.newcomer, type="business", location="Berlin")
+        UserProfile.objects.create(user=self.veteran, type="business", location="Hamburg")
+        UserProfile.objects.create(user=self.mediocre, type="business", location="Köln")
+        OrderStatusCounter.objects.create(business_user=self.veteran, status='completed', count=7)
+
+        ratings = [
+            (self.newcomer, 5), (self.veteran, 5), (self.veteran, 5), (self.veteran, 5), (self.veteran, 5),
+            (self.mediocre, 3), (self.mediocre, 3),
+        ]
+        for index, (business_user, rating) in enumerate(ratings):
+            customer = User.objects.create(username=f"leaderboard_customer{index}")
+            UserProfile.objects.create(user=customer, type="customer")
+            Review.objects.create(business_user=business_user, reviewer=customer, rating=rating)
+
+        call_command('refresh_leaderboard', stdout=StringIO())
+        self.url = reverse('top-businesses')
+
+    def test_leaderboard_ranks_by_bayesian_score(self):
+        """
+        Test that a long track record outranks a single perfect review and that the
+        endpoint is public and reads only the leaderboard table.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        first, second, third = response.data['results']
+        self.assertEqual(
+            (first['username'], second['username'], third['username']), ("veteran", "newcomer", "mediocre")
+        )
+        self.assertEqual(first['average_rating'], 5.0)
+        self.assertEqual(first['completed_order_count'], 7)
+        self.assertEqual(first['location'], "Hamburg")
+        self.assertGreater(first['score'], second['score'])
+
+    def test_incremental_refresh_only_touches_given_business(self):
+        """
+        Test that refreshing a single business updates its entry and keeps the others.
+        """
+        from overview_app.services import refresh_leaderboard
+
+        customer = User.objects.create(username="late_customer")
+        UserProfile.objects.create(user=customer, type="customer")
+        Review.objects.create(business_user=self.newcomer, reviewer=customer, rating=1)
+
+        self.assertEqual(refresh_leaderboard([self.newcomer.id]), 1)
+        response = self.client.get(self.url, {'page_size': 1, 'page': 3})
+        self.assertEqual(response.data['results'][0]['username'], "newcomer")
+        self.assertEqual(response.data['results'][0]['review_count'], 2)
+        self.assertEqual(response.data['results'][0]['average_rating'], 3.0)
+        self.assertEqual(response.data['count'], 3)
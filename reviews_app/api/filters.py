@@ -0,0 +1,20 @@
+import django_filters
+from reviews_app.models import Review
+
+class ReviewFilter(django_filters.FilterSet):
+    """
+    A FilterSet for the Review model, allowing filtering by the reviewed business user
+    and by the reviewer.
+    """
+    business_user_id = django_filters.NumberFilter(field_name='business_user_id')
+    reviewer_id = django_filters.NumberFilter(field_name='reviewer_id')
+
+    class Meta:
+        """
+        Meta class for ReviewFilter, defining the model and fields to filter on.
+        """
+        model = Review
+        fields = [
+            'business_user_id',
+            'reviewer_id',
+        ]
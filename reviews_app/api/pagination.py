@@ -0,0 +1,96 @@
+"""
+Custom pagination settings for the review list in the reviews_app.
+"""
+import json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, Cursor
+
+class ReviewsCursorPagination(CursorPagination):
+    """
+    Keyset cursor pagination for reviews, most recently updated first.
+
+    DRF's CursorPagination positions cursors on the first ordering field only and
+    skips ties with an offset, which grows with every page of equal ratings and stops
+    moving at offset_cutoff. Here the cursor carries the ordering value together with
+    the review id, and every page is a range lookup on (value, id), so pages cost the
+    same no matter how many reviews tie. Only the first requested ordering field is used.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-updated_at'
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the first requested ordering field followed by the id in the same direction.
+        """
+        field = super().get_ordering(request, queryset, view)[0]
+        return (field, '-id' if field.startswith('-') else 'id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.field_name = self.ordering[0].lstrip('-')
+        self.model_field = queryset.model._meta.get_field(self.field_name)
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(name[1:] if name.startswith('-') else '-' + name for name in ordering)
+        queryset = queryset.order_by(*ordering)
+        if self.cursor and self.cursor.position is not None:
+            queryset = queryset.filter(self.after_position(self.cursor.position, ordering))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None and self.cursor.position is not None
+        return self.page
+
+    def after_position(self, position, ordering):
+        """
+        Returns the filter selecting the rows that follow the position in the given ordering.
+        """
+        try:
+            value, pk = json.loads(position)
+            value = self.model_field.to_python(value)
+            pk = int(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        lookup = 'lt' if ordering[0].startswith('-') else 'gt'
+        id_lookup = 'lt' if ordering[1].startswith('-') else 'gt'
+        return (
+            Q(**{f'{self.field_name}__{lookup}': value})
+            | Q(**{self.field_name: value, f'id__{id_lookup}': pk})
+        )
+
+    def get_position(self, instance):
+        """
+        Returns the encoded (ordering value, id) position of a review.
+        """
+        return json.dumps([self.model_field.value_to_string(instance), instance.pk])
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = Cursor(offset=0, reverse=False, position=self.get_position(self.page[-1]))
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        cursor = Cursor(offset=0, reverse=True, position=self.get_position(self.page[0]))
+        return self.encode_cursor(cursor)
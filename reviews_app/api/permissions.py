@@ -2,6 +2,7 @@
 Permissions for the reviews_app handling review permissions.
 """
 from rest_framework.permissions import BasePermission
+from auth_app.models import get_profile_type
 
 class IsCustomerAndAuthenticated(BasePermission):
     """
@@ -25,9 +26,7 @@ class IsCustomerAndAuthenticated(BasePermission):
         if request.method == 'POST':
             if not request.user or not request.user.is_authenticated:
                 return False
-            if not hasattr(request.user, 'userprofile'):
-                return False
-            if request.user.userprofile.type != 'customer':
+            if get_profile_type(request.user) != 'customer':
                 return False
        
             return True
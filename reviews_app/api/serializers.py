@@ -1,18 +1,27 @@
 """
 Serializers for the reviews_app handling review creation and representation.
 """
+from django.db import IntegrityError
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
-from reviews_app.models import Review
+from rest_framework.settings import api_settings
+from reviews_app.models import Review, BusinessRatingSummary
+from auth_app.api.serializers import UserProfileSerializer
+from core.expand import ExpandableSerializerMixin
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(ExpandableSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Review model.
     Handles creation and read-only representation of reviews,
     including reviewer, business user, rating, description, and timestamps.
+    Supports `?expand=user,business_user` to embed the reviewer and business profiles.
     """
-    reviewer = serializers.ReadOnlyField(source='reviewer.id')
+    reviewer = serializers.ReadOnlyField(source='reviewer_id')
+    expandable_fields = {
+        'user': ('reviewer', 'reviewer.userprofile', UserProfileSerializer, False),
+        'business_user': ('business_user', 'business_user.userprofile', UserProfileSerializer, False),
+    }
     
     class Meta:
 
@@ -28,15 +37,48 @@ class ReviewSerializer(serializers.ModelSerializer):
             ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def validate(self, data):
+    def create(self, validated_data):
         """
-        Validates that the authenticated user has not already submitted a review for the same business user.
+        Inserts the review and relies on the (business_user, reviewer) unique constraint
+        to reject duplicates, so concurrent requests cannot both succeed.
 
         Raises:
             ValidationError: If a review by the same reviewer for the business user already exists.
         """
-        user = self.context['request'].user
-        business_user = data.get('business_user')
-        if Review.objects.filter(reviewer=user, business_user=business_user).exists():
-            raise ValidationError("You have already reviewed this business user.")
-        return data
\ No newline at end of file
+        try:
+            return super().create(validated_data)
+        except IntegrityError:
+            raise self.duplicate_review_error()
+
+    def update(self, instance, validated_data):
+        """
+        Updates the review; moving it to a business user the reviewer has already
+        reviewed is rejected by the same unique constraint as a duplicate create.
+
+        Raises:
+            ValidationError: If a review by the same reviewer for the business user already exists.
+        """
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError:
+            raise self.duplicate_review_error()
+
+    def duplicate_review_error(self):
+        """
+        Returns the validation error reported for a review violating the unique constraint.
+        """
+        return ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: ["You have already reviewed this business user."]
+        })
+
+class BusinessRatingSummarySerializer(serializers.ModelSerializer):
+    """
+    Serializer for a business user's rating summary, including the per-star histogram.
+    """
+    average_rating = serializers.FloatField(read_only=True)
+    histogram = serializers.DictField(child=serializers.IntegerField(), read_only=True)
+
+    class Meta:
+        model = BusinessRatingSummary
+        fields = ['business_user', 'review_count', 'average_rating', 'histogram']
+        read_only_fields = fields
@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ReviewViewSet
+from .views import ReviewViewSet, BusinessRatingView
 
 router = DefaultRouter()
 router.register(r'reviews', ReviewViewSet, basename='review')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('businesses/<int:business_user_id>/rating/', BusinessRatingView.as_view(), name='business-rating'),
 ]
\ No newline at end of file
@@ -5,15 +5,24 @@ creation to customers who haven't reviewed a business yet,
 and allows only creators to edit or delete their reviews.
 """
 from rest_framework import viewsets
+from rest_framework.views import APIView
 from rest_framework.response import Response
-from reviews_app.models import Review
-from reviews_app.api.serializers import ReviewSerializer
+from rest_framework.permissions import IsAuthenticated
+from django.contrib.auth.models import User
+from django.shortcuts import get_object_or_404
+from rest_framework.filters import OrderingFilter
+from django_filters.rest_framework import DjangoFilterBackend
+from reviews_app.models import Review, BusinessRatingSummary
+from reviews_app.api.serializers import ReviewSerializer, BusinessRatingSummarySerializer
 from django.core.exceptions import ValidationError
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from .permissions import IsCustomerAndAuthenticated
+from core.expand import ExpandQuerysetMixin
+from .filters import ReviewFilter
+from .pagination import ReviewsCursorPagination
 
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(ExpandQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Review instances.
 
@@ -22,10 +31,28 @@ class ReviewViewSet(viewsets.ModelViewSet):
     - Each customer can create only one review per business user.
     - Only the creator of a review can update or delete it.
     - All authenticated users can read reviews.
+
+    Reviewer and business profiles can be embedded via `?expand=user,business_user`.
+    The list is cursor-paginated, can be filtered by business_user_id and reviewer_id,
+    and ordered via `?ordering=rating` or `?ordering=-updated_at` (the default).
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [IsCustomerAndAuthenticated]
+    pagination_class = ReviewsCursorPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = ReviewFilter
+    ordering_fields = ['rating', 'updated_at']
+    expand_related = {
+        'user': (['reviewer__userprofile'], []),
+        'business_user': (['business_user__userprofile'], []),
+    }
+
+    def get_queryset(self):
+        """
+        Returns all reviews with joins for any requested expansions.
+        """
+        return self.apply_expansions(super().get_queryset())
 
     def perform_create(self, serializer):
         """
@@ -38,12 +65,20 @@ class ReviewViewSet(viewsets.ModelViewSet):
         except ValidationError as e:
             raise DRFValidationError(e.message_dict)
 
-    def list(self, request, *args, **kwargs):
-        """
-        Retrieves and returns a list of all reviews serialized.
 
-        Does not apply any additional filtering or pagination.
-        """
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+
+class BusinessRatingView(APIView):
+    """
+    API endpoint to retrieve the review count, average rating, and per-star histogram
+    of a business user from its rating summary.
+
+    Business users without reviews get an empty summary; unknown users return 404.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        summary = BusinessRatingSummary.objects.filter(business_user_id=business_user_id).first()
+        if summary is None:
+            get_object_or_404(User, pk=business_user_id)
+            summary = BusinessRatingSummary(business_user_id=business_user_id)
+        return Response(BusinessRatingSummarySerializer(summary).data)
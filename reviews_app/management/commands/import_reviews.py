@@ -0,0 +1,204 @@
+"""
+Management command that bulk imports reviews from a CSV or NDJSON file.
+"""
+import csv
+import json
+import os
+from itertools import islice
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from auth_app.models import UserProfile
+from reviews_app.models import Review
+from reviews_app.services import apply_rating_changes
+
+
+class Command(BaseCommand):
+    """
+    Streams reviews from a CSV or NDJSON file into the database in batches.
+
+    Every record needs business_user_id, reviewer_id, and rating (1-5); description is optional.
+    Each batch is validated with a fixed number of queries (users, reviewer profile types,
+    existing reviews), checked against the pairs already seen in the file, written with
+    bulk_create, and added to the rating summaries in one transaction.
+
+    Rejected records are written to the rejects file together with the reason. After every
+    committed batch the number of consumed records is stored in the checkpoint file, so an
+    interrupted import continues where it stopped when started again with the same file.
+    """
+    help = "Bulk imports reviews from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or NDJSON file to import.')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'ndjson'],
+            help='Input format. Defaults to the file extension.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of records validated and written per transaction.',
+        )
+        parser.add_argument(
+            '--rejects',
+            help='NDJSON file receiving rejected records. Defaults to <path>.rejects.ndjson.',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='File storing the import progress. Defaults to <path>.checkpoint.',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore an existing checkpoint and start from the first record.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        fmt = options['format'] or ('ndjson' if path.endswith(('.ndjson', '.jsonl')) else 'csv')
+        checkpoint_path = options['checkpoint'] or f"{path}.checkpoint"
+        rejects_path = options['rejects'] or f"{path}.rejects.ndjson"
+
+        start = 0 if options['restart'] else self.read_checkpoint(checkpoint_path)
+        if start:
+            self.stdout.write(f"Resuming after record {start}.")
+
+        self.seen = set()
+        totals = {'imported': 0, 'rejected': 0}
+        records = islice(self.iter_records(path, fmt), start, None)
+        with open(rejects_path, 'a' if start else 'w', encoding='utf-8') as rejects:
+            while True:
+                batch = list(islice(records, options['batch_size']))
+                if not batch:
+                    break
+                imported, rejected = self.import_batch(batch)
+                for number, record, reason in rejected:
+                    rejects.write(json.dumps({'record': number, 'reason': reason, 'data': record}) + '\n')
+                rejects.flush()
+                self.write_checkpoint(checkpoint_path, batch[-1][0])
+                totals['imported'] += imported
+                totals['rejected'] += len(rejected)
+                self.stdout.write(
+                    f"Processed {batch[-1][0]} record(s): "
+                    f"{totals['imported']} imported, {totals['rejected']} rejected."
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {totals['imported']} review(s), rejected {totals['rejected']}. "
+            f"Rejected records: {rejects_path}"
+        ))
+
+    def iter_records(self, path, fmt):
+        """
+        Yields (record number, record) pairs, numbering records from 1.
+        Unparseable NDJSON lines are yielded with a None record.
+        """
+        with open(path, newline='', encoding='utf-8') as handle:
+            if fmt == 'csv':
+                for number, record in enumerate(csv.DictReader(handle), start=1):
+                    yield number, record
+                return
+            for number, line in enumerate(handle, start=1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield number, record if isinstance(record, dict) else None
+
+    def parse_record(self, record):
+        """
+        Returns (business_user_id, reviewer_id, rating, description) or raises ValueError.
+        """
+        if record is None:
+            raise ValueError("Malformed record.")
+        try:
+            business_user_id = int(record['business_user_id'])
+            reviewer_id = int(record['reviewer_id'])
+            rating = int(record['rating'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("business_user_id, reviewer_id and rating must be integers.")
+        if not 1 <= rating <= 5:
+            raise ValueError("Rating must be between 1 and 5.")
+        return business_user_id, reviewer_id, rating, record.get('description') or ''
+
+    def import_batch(self, batch):
+        """
+        Validates and writes one batch.
+
+        Returns:
+            tuple: The number of imported reviews and a list of
+            (record number, record, reason) tuples for rejected records.
+        """
+        rejected = []
+        parsed = []
+        for number, record in batch:
+            try:
+                parsed.append((number, record, self.parse_record(record)))
+            except ValueError as exc:
+                rejected.append((number, record, str(exc)))
+
+        business_ids = {fields[0] for _, _, fields in parsed}
+        reviewer_ids = {fields[1] for _, _, fields in parsed}
+        existing_users = set(User.objects.filter(id__in=business_ids).values_list('id', flat=True))
+        customers = set(
+            UserProfile.objects.filter(user_id__in=reviewer_ids, type='customer').values_list('user_id', flat=True)
+        )
+        existing_pairs = set(
+            Review.objects.filter(reviewer_id__in=reviewer_ids, business_user_id__in=business_ids)
+            .values_list('business_user_id', 'reviewer_id')
+        )
+
+        reviews = []
+        for number, record, (business_user_id, reviewer_id, rating, description) in parsed:
+            pair = (business_user_id, reviewer_id)
+            if business_user_id == reviewer_id:
+                reason = "Users cannot review themselves."
+            elif business_user_id not in existing_users:
+                reason = "Business user does not exist."
+            elif reviewer_id not in customers:
+                reason = "Only customers with a profile are allowed to write reviews."
+            elif pair in existing_pairs or pair in self.seen:
+                reason = "Duplicate review for this business user."
+            else:
+                reason = None
+            if reason:
+                rejected.append((number, record, reason))
+                continue
+            self.seen.add(pair)
+            reviews.append(Review(
+                business_user_id=business_user_id, reviewer_id=reviewer_id,
+                rating=rating, description=description,
+            ))
+
+        with transaction.atomic():
+            Review.objects.bulk_create(reviews)
+            apply_rating_changes([(None, (review.business_user_id, review.rating)) for review in reviews])
+        rejected.sort(key=lambda item: item[0])
+        return len(reviews), rejected
+
+    def read_checkpoint(self, path):
+        """
+        Returns the number of records already consumed, or 0 without a checkpoint.
+        """
+        try:
+            with open(path, encoding='utf-8') as handle:
+                return int(handle.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            raise CommandError(f"Invalid checkpoint file: {path}")
+
+    def write_checkpoint(self, path, number):
+        """
+        Atomically replaces the checkpoint with the number of consumed records.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            handle.write(str(number))
+        os.replace(temporary, path)
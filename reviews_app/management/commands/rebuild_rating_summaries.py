@@ -0,0 +1,24 @@
+"""
+Management command that rebuilds the business rating summaries from the reviews.
+"""
+from django.core.management.base import BaseCommand
+from reviews_app.services import rebuild_rating_summaries
+
+
+class Command(BaseCommand):
+    """
+    Recomputes BusinessRatingSummary rows from the reviews, either for every
+    business user or for a single one, repairing any drift from bulk edits.
+    """
+    help = "Rebuilds the business rating summaries from the reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user',
+            type=int,
+            help='Only rebuild the summary of this business user id.',
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_rating_summaries(options.get('business_user'))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} rating summary row(s)."))
@@ -3,9 +3,10 @@ Models for the reviews_app representing user reviews
 between customers and business users, including validation
 to prevent self-reviews and duplicate reviews.
 """
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from auth_app.models import get_profile_type
 
 
 class Review(models.Model):
@@ -44,30 +45,58 @@ class Review(models.Model):
     class Meta:
         """
         Meta options for the Review model.
-        Defines unique constraints and default ordering.
+        Defines unique constraints, default ordering, and the composite indexes
+        backing the review list filters and cursor pagination.
         """
         unique_together = ('business_user', 'reviewer')
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', 'rating'], name='review_business_rating_idx'),
+            models.Index(fields=['reviewer', '-updated_at'], name='review_reviewer_updated_idx'),
+            models.Index(fields=['-updated_at'], name='review_updated_idx'),
+        ]
 
     def clean(self):
         """
         Performs custom validation for the Review instance.
         Ensures a user cannot review themselves and only customers can write reviews.
+        The profile type is resolved through get_profile_type, which the request has
+        usually filled in already during authentication.
         """
-        if self.business_user == self.reviewer:
+        if self.business_user_id == self.reviewer_id:
             raise ValidationError("Users cannot review themselves.")
 
-        profile = getattr(self.reviewer, 'userprofile', None)
-        if not profile or profile.type != 'customer':
+        if get_profile_type(self.reviewer) != 'customer':
             raise ValidationError("Only customers with a profile are allowed to write reviews.")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remembers the business user and rating the review was loaded with,
+        so save() can move the rating summary by the difference.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = (instance.__dict__.get('business_user_id'), instance.__dict__.get('rating'))
+        return instance
+
     def save(self, *args, **kwargs):
         """
-        Overrides the default save method to include full model validation
+        Overrides the default save method to include model validation
         before saving the instance to the database.
+
+        Uniqueness is left to the database constraint and the related users are not
+        re-fetched, so creating a review is a single INSERT; duplicates raise IntegrityError.
+        The business user's rating summary is updated in the same transaction.
         """
-        self.full_clean()  # Calls clean() and validates all fields
-        super().save(*args, **kwargs)
+        from reviews_app.services import apply_rating_changes
+
+        self.full_clean(exclude=['business_user', 'reviewer'], validate_unique=False)
+        old = None if self._state.adding else getattr(self, '_loaded_rating', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            apply_rating_changes([(old, (self.business_user_id, self.rating))])
+        self._loaded_rating = (self.business_user_id, self.rating)
 
     def __str__(self):
         """
@@ -78,4 +107,56 @@ class Review(models.Model):
             f"Review from {self.reviewer.username} for "
             f"{self.business_user.username} ({self.rating} stars)"
         )
-    
\ No newline at end of file
+    
+
+class BusinessRatingSummary(models.Model):
+    """
+    Materialized review count, rating sum, and per-star histogram of a business user.
+
+    Kept in sync by Review.save and the review pre_delete handler, and rebuilt by
+    rebuild_rating_summaries, so profile pages never aggregate over the review table.
+    """
+    STARS = range(1, 6)
+
+    business_user = models.OneToOneField(
+        User,
+        related_name='rating_summary',
+        on_delete=models.CASCADE,
+        primary_key=True
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    stars_1 = models.IntegerField(default=0)
+    stars_2 = models.IntegerField(default=0)
+    stars_3 = models.IntegerField(default=0)
+    stars_4 = models.IntegerField(default=0)
+    stars_5 = models.IntegerField(default=0)
+
+    @staticmethod
+    def star_field(rating):
+        """
+        Returns the histogram field for the rating, or None for ratings outside 1-5.
+        """
+        return f'stars_{rating}' if rating in BusinessRatingSummary.STARS else None
+
+    @property
+    def average_rating(self):
+        """
+        Returns the average rating rounded to one decimal, or 0.0 without reviews.
+        """
+        if not self.review_count:
+            return 0.0
+        return round(self.rating_sum / self.review_count, 1)
+
+    @property
+    def histogram(self):
+        """
+        Returns the number of reviews per star as a dict keyed by star.
+        """
+        return {str(star): getattr(self, f'stars_{star}') for star in self.STARS}
+
+    def __str__(self):
+        """
+        Returns a string representation of the summary.
+        """
+        return f"{self.business_user_id}: {self.average_rating} ({self.review_count} reviews)"
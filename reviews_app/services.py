@@ -0,0 +1,84 @@
+"""
+Bookkeeping that has to happen whenever reviews are created, changed, or deleted.
+
+All functions expect to run inside the transaction that writes the review rows,
+so the rating summaries never diverge from the reviews themselves.
+"""
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from reviews_app.models import Review, BusinessRatingSummary
+from core.counters import adjust_row
+
+
+def apply_rating_changes(changes):
+    """
+    Applies a batch of rating changes to the business rating summaries.
+
+    Args:
+        changes (iterable): Tuples of (old, new) where each side is a
+            (business_user_id, rating) pair, or None for created or deleted reviews.
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    for old, new in changes:
+        if old == new:
+            continue
+        for side, sign in ((old, -1), (new, 1)):
+            if side is None:
+                continue
+            business_user_id, rating = side
+            summary = deltas[business_user_id]
+            summary['review_count'] += sign
+            summary['rating_sum'] += sign * rating
+            star_field = BusinessRatingSummary.star_field(rating)
+            if star_field:
+                summary[star_field] += sign
+
+    for business_user_id, summary in deltas.items():
+        summary = {field: delta for field, delta in summary.items() if delta}
+        if summary:
+            adjust_row(BusinessRatingSummary, {'business_user_id': business_user_id}, **summary)
+
+
+def remove_from_rating_summary(review):
+    """
+    Removes a deleted review's rating from its business user's summary.
+
+    Called from the pre_delete handler in reviews_app.signals, so direct deletes,
+    queryset deletes, and cascades from deleted users are all covered.
+    """
+    old = getattr(review, '_loaded_rating', None) or (review.business_user_id, review.rating)
+    apply_rating_changes([(old, None)])
+
+
+def rebuild_rating_summaries(business_user_id=None):
+    """
+    Recomputes the rating summaries from the reviews.
+
+    Args:
+        business_user_id (int, optional): Limits the rebuild to a single business user.
+
+    Returns:
+        int: The number of summaries written.
+    """
+    reviews = Review.objects.all()
+    summaries = BusinessRatingSummary.objects.all()
+    if business_user_id is not None:
+        reviews = reviews.filter(business_user_id=business_user_id)
+        summaries = summaries.filter(business_user_id=business_user_id)
+
+    rows = list(reviews.order_by().values('business_user').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        **{
+            f'stars_{star}': Count('id', filter=Q(rating=star))
+            for star in BusinessRatingSummary.STARS
+        },
+    ))
+    with transaction.atomic():
+        summaries.delete()
+        BusinessRatingSummary.objects.bulk_create([
+            BusinessRatingSummary(business_user_id=row.pop('business_user'), **row)
+            for row in rows
+        ], batch_size=1000)
+    return len(rows)
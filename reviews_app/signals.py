@@ -0,0 +1,20 @@
+"""
+Signal handlers keeping the business rating summaries consistent with deletes.
+
+Deletes are handled in pre_delete instead of Review.delete, because queryset deletes
+and cascades from deleted users never call the model's delete method. pre_delete
+runs before the collector removes any row, so the summary row is still there to be
+adjusted even when the same cascade deletes it afterwards.
+"""
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from reviews_app.models import Review
+from reviews_app.services import remove_from_rating_summary
+
+
+@receiver(pre_delete, sender=Review)
+def remove_deleted_review(sender, instance, **kwargs):
+    """
+    Removes every deleted review from its business user's rating summary.
+    """
+    remove_from_rating_summary(instance)
@@ -54,7 +54,7 @@ class ReviewListTests(APITestCase):
         self.client.force_authenticate(user=self.user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(isinstance(response.data, list))
+        self.assertTrue(isinstance(response.data['results'], list))
 
     def test_get_reviews_unauthenticated_returns_401(self):
         """
@@ -82,9 +82,78 @@ class ReviewListTests(APITestCase):
         })
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        for review in response.data:
+        for review in response.data['results']:
             self.assertEqual(review['reviewer'], self.other_user.id, msg=f"Falscher Reviewer: {review}")
 
+    def test_get_reviews_paginates_filters_and_orders(self):
+        """
+        Tests that the review list is cursor-paginated, filtered by business user,
+        and ordered by rating when requested.
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url, {
+            'business_user_id': self.user.id,
+            'ordering': 'rating',
+            'page_size': 1
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([review['rating'] for review in response.data['results']], [4])
+        self.assertIsNotNone(response.data['next'])
+
+        next_page = self.client.get(response.data['next'])
+        self.assertEqual([review['rating'] for review in next_page.data['results']], [5])
+        self.assertIsNone(next_page.data['next'])
+
+        other = self.client.get(self.url, {'business_user_id': self.other_user.id})
+        self.assertEqual(other.data['results'], [])
+
+    def test_review_page_query_count_is_constant(self):
+        """
+        Tests that a review page costs one query no matter how many reviews it contains.
+        """
+        for index in range(20):
+            reviewer = User.objects.create_user(username=f'PageReviewer{index}', password='1234')
+            UserProfile.objects.create(user=reviewer, type='customer')
+            Review.objects.create(business_user=self.user, reviewer=reviewer, rating=5)
+        self.client.force_authenticate(user=self.user)
+
+        for page_size in (2, 20):
+            with self.assertNumQueries(1):
+                response = self.client.get(self.url, {'page_size': page_size})
+            self.assertEqual(len(response.data['results']), page_size)
+
+    def test_rating_cursor_pages_through_more_ties_than_offset_cutoff(self):
+        """
+        Tests that paging through reviews ordered by rating returns every review exactly
+        once, and that the previous link leads back, although more reviews tie than
+        DRF's offset-based cursors can skip.
+        """
+        from reviews_app.api.pagination import ReviewsCursorPagination
+
+        tied = ReviewsCursorPagination.offset_cutoff + 150
+        reviewers = User.objects.bulk_create(
+            [User(username=f'TieReviewer{index}') for index in range(tied)]
+        )
+        Review.objects.bulk_create(
+            [Review(business_user=self.user, reviewer=reviewer, rating=5) for reviewer in reviewers]
+        )
+        self.client.force_authenticate(user=self.user)
+
+        seen = []
+        response = self.client.get(self.url, {'ordering': 'rating', 'page_size': 100})
+        while True:
+            seen.extend(review['id'] for review in response.data['results'])
+            if not response.data['next']:
+                break
+            last_page = response
+            response = self.client.get(response.data['next'])
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(sorted(seen), sorted(Review.objects.values_list('id', flat=True)))
+
+        previous = self.client.get(response.data['previous'])
+        self.assertEqual(previous.data['results'], last_page.data['results'])
+
     def test_internal_server_error_simulation_returns_500(self):
         """
         Simulates an internal server error during review list retrieval and checks for exception.
@@ -154,6 +223,74 @@ class ReviewCreateTests(APITestCase):
 
         response = self.client.post(self.url, self.valid_payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['non_field_errors'], ["You have already reviewed this business user."])
+
+    def test_create_review_is_a_single_insert(self):
+        """
+        Tests that creating a review does not pre-check uniqueness or re-fetch the users,
+        so the review row is written by exactly one statement.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_authenticate(user=self.customer_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, self.valid_payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        review_queries = [q['sql'] for q in queries.captured_queries if '"reviews_app_review"' in q['sql']]
+        self.assertEqual(len(review_queries), 1)
+        self.assertTrue(review_queries[0].startswith('INSERT'))
+
+    def test_concurrent_duplicate_reviews_are_rejected_by_constraint(self):
+        """
+        Tests that two requests validated before either one is saved cannot both create
+        a review: the database constraint rejects the second insert with the usual 400 error.
+        """
+        from rest_framework.exceptions import ValidationError as DRFValidationError
+        from rest_framework.test import APIRequestFactory
+        from reviews_app.api.serializers import ReviewSerializer
+
+        request = APIRequestFactory().post(self.url)
+        request.user = self.customer_user
+        first, second = (
+            ReviewSerializer(data=self.valid_payload, context={'request': request})
+            for _ in range(2)
+        )
+        self.assertTrue(first.is_valid())
+        self.assertTrue(second.is_valid())
+
+        first.save(reviewer=self.customer_user)
+        with self.assertRaises(DRFValidationError) as context:
+            second.save(reviewer=self.customer_user)
+
+        self.assertEqual(
+            context.exception.detail['non_field_errors'][0],
+            "You have already reviewed this business user."
+        )
+        self.assertEqual(
+            Review.objects.filter(reviewer=self.customer_user, business_user=self.business_user).count(), 1
+        )
+
+    def test_patch_review_onto_already_reviewed_business_400(self):
+        """
+        Tests that moving a review to a business user the reviewer has already reviewed
+        is rejected with the duplicate error and leaves both reviews unchanged.
+        """
+        other_business = User.objects.create_user(username='OtherBusiness', password='pass')
+        Review.objects.create(business_user=self.business_user, reviewer=self.customer_user, rating=5)
+        review = Review.objects.create(business_user=other_business, reviewer=self.customer_user, rating=3)
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.patch(
+            reverse('review-detail', kwargs={'pk': review.id}),
+            {'business_user': self.business_user.id}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['non_field_errors'], ["You have already reviewed this business user."])
+        review.refresh_from_db()
+        self.assertEqual(review.business_user_id, other_business.id)
 
     def test_create_review_invalid_payload_400(self):
         """
@@ -213,7 +350,7 @@ class ReviewPermissionTests(APITestCase):
         self.client.force_authenticate(user=self.non_customer_user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(isinstance(response.data, list))
+        self.assertTrue(isinstance(response.data['results'], list))
 
     def test_non_customer_cannot_create_review(self):
         """
@@ -253,4 +390,185 @@ class ReviewPermissionTests(APITestCase):
         self.client.force_authenticate(user=self.customer_user)
         delete_response = self.client.delete(edit_url)
         self.assertEqual(delete_response.status_code, status.HTTP_204_NO_CONTENT)
-        
\ No newline at end of file
+        
+
+class BusinessRatingSummaryTests(APITestCase):
+    """
+    Tests for the denormalized business rating summary and its endpoints.
+    """
+    def setUp(self):
+        """
+        Sets up a business user reviewed by two customers.
+        """
+        self.client = APIClient()
+        self.business_user = User.objects.create_user(username='RatedBusiness', password='pass')
+        UserProfile.objects.create(user=self.business_user, type='business')
+        self.customers = []
+        for index, rating in enumerate((5, 3)):
+            customer = User.objects.create_user(username=f'RatingCustomer{index}', password='pass')
+            UserProfile.objects.create(user=customer, type='customer')
+            Review.objects.create(business_user=self.business_user, reviewer=customer, rating=rating)
+            self.customers.append(customer)
+        self.url = reverse('business-rating', kwargs={'business_user_id': self.business_user.id})
+
+    def test_summary_follows_review_changes(self):
+        """
+        Tests that creating, updating, and deleting reviews keeps the summary in sync.
+        """
+        self.client.force_authenticate(user=self.customers[0])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['review_count'], 2)
+        self.assertEqual(response.data['average_rating'], 4.0)
+        self.assertEqual(response.data['histogram'], {'1': 0, '2': 0, '3': 1, '4': 0, '5': 1})
+
+        review = Review.objects.get(reviewer=self.customers[1])
+        self.client.force_authenticate(user=self.customers[1])
+        self.client.patch(reverse('review-detail', kwargs={'pk': review.id}), {'rating': 1}, format='json')
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['average_rating'], 3.0)
+        self.assertEqual(response.data['histogram']['1'], 1)
+        self.assertEqual(response.data['histogram']['3'], 0)
+
+        self.client.delete(reverse('review-detail', kwargs={'pk': review.id}))
+        response = self.client.get(self.url)
+        self.assertEqual((response.data['review_count'], response.data['average_rating']), (1, 5.0))
+
+    def test_summary_follows_queryset_and_cascade_deletes(self):
+        """
+        Tests that reviews removed by a queryset delete or by deleting their reviewer's
+        account leave the summary, just like reviews deleted one by one.
+        """
+        Review.objects.filter(reviewer=self.customers[1]).delete()
+        self.client.force_authenticate(user=self.customers[0])
+        response = self.client.get(self.url)
+        self.assertEqual((response.data['review_count'], response.data['average_rating']), (1, 5.0))
+
+        self.customers[0].delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['review_count'], 0)
+        self.assertEqual(response.data['histogram'], {'1': 0, '2': 0, '3': 0, '4': 0, '5': 0})
+
+    def test_business_profiles_expose_summary_without_extra_queries(self):
+        """
+        Tests that the business profile list embeds the summary in the joined page query.
+        """
+        self.client.force_authenticate(user=self.customers[0])
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('business-user-list'))
+        profile = response.data['results'][0]
+        self.assertEqual((profile['review_count'], profile['average_rating']), (2, 4.0))
+
+    def test_rebuild_command_repairs_drift_and_unknown_user_returns_404(self):
+        """
+        Tests that rebuild_rating_summaries repairs drifted summaries,
+        and that unknown users return 404.
+        """
+        from django.core.management import call_command
+        from reviews_app.models import BusinessRatingSummary
+        from io import StringIO
+
+        BusinessRatingSummary.objects.update(review_count=7, rating_sum=7, stars_1=7)
+        call_command('rebuild_rating_summaries', stdout=StringIO())
+
+        self.client.force_authenticate(user=self.customers[0])
+        response = self.client.get(self.url)
+        self.assertEqual((response.data['review_count'], response.data['average_rating']), (2, 4.0))
+        self.assertEqual(response.data['histogram']['1'], 0)
+
+        missing = reverse('business-rating', kwargs={'business_user_id': 999999})
+        self.assertEqual(self.client.get(missing).status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ImportReviewsCommandTests(APITestCase):
+    """
+    Tests for the import_reviews management command.
+    """
+    def setUp(self):
+        """
+        Creates a business user, two customers, and a user without a profile.
+        """
+        import tempfile
+
+        self.business_user = User.objects.create_user(username='ImportBusiness', password='pass')
+        UserProfile.objects.create(user=self.business_user, type='business')
+        self.customers = []
+        for index in range(2):
+            customer = User.objects.create_user(username=f'ImportCustomer{index}', password='pass')
+            UserProfile.objects.create(user=customer, type='customer')
+            self.customers.append(customer)
+        self.no_profile = User.objects.create_user(username='ImportNoProfile', password='pass')
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_file(self, name, content):
+        import os
+
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        return path
+
+    def test_import_csv_validates_batches_and_reports_rejects(self):
+        """
+        Tests that valid rows are imported with their rating summary and that invalid
+        rows are written to the rejects file with a reason.
+        """
+        import json
+        from django.core.management import call_command
+        from io import StringIO
+        from reviews_app.models import BusinessRatingSummary
+
+        business, first, second = self.business_user.id, self.customers[0].id, self.customers[1].id
+        path = self.write_file('reviews.csv', "\n".join([
+            "business_user_id,reviewer_id,rating,description",
+            f"{business},{first},5,Top",
+            f"{business},{first},4,Duplicate in file",
+            f"{business},{business},5,Self review",
+            f"{business},{self.no_profile.id},5,No customer",
+            f"{business},{second},9,Bad rating",
+            f"{business},{second},3,Okay",
+        ]) + "\n")
+
+        call_command('import_reviews', path, '--batch-size', '2', stdout=StringIO())
+
+        self.assertEqual(
+            sorted(Review.objects.values_list('reviewer_id', 'rating')), sorted([(first, 5), (second, 3)])
+        )
+        summary = BusinessRatingSummary.objects.get(business_user=self.business_user)
+        self.assertEqual((summary.review_count, summary.rating_sum), (2, 8))
+        with open(f"{path}.rejects.ndjson", encoding='utf-8') as handle:
+            rejects = [json.loads(line) for line in handle]
+        self.assertEqual([reject['record'] for reject in rejects], [2, 3, 4, 5])
+        self.assertEqual(rejects[0]['reason'], "Duplicate review for this business user.")
+
+    def test_import_ndjson_resumes_from_checkpoint(self):
+        """
+        Tests that an import continues after the records stored in the checkpoint
+        and rejects rows that already exist in the database.
+        """
+        import json
+        from django.core.management import call_command
+        from io import StringIO
+
+        business = self.business_user.id
+        lines = [
+            {"business_user_id": business, "reviewer_id": self.customers[0].id, "rating": 4},
+            {"business_user_id": business, "reviewer_id": self.customers[1].id, "rating": 2},
+        ]
+        path = self.write_file('reviews.ndjson', "".join(json.dumps(line) + "\n" for line in lines) + "{broken\n")
+        Review.objects.create(business_user=self.business_user, reviewer=self.customers[0], rating=4)
+        with open(f"{path}.checkpoint", 'w', encoding='utf-8') as handle:
+            handle.write("1")
+
+        out = StringIO()
+        call_command('import_reviews', path, stdout=out)
+
+        self.assertIn("Resuming after record 1.", out.getvalue())
+        self.assertEqual(Review.objects.count(), 2)
+        self.assertTrue(Review.objects.filter(reviewer=self.customers[1], rating=2).exists())
+        with open(f"{path}.checkpoint", encoding='utf-8') as handle:
+            self.assertEqual(handle.read(), "3")
+
+        call_command('import_reviews', path, '--restart', stdout=StringIO())
+        self.assertEqual(Review.objects.count(), 2)